@@ -1,5 +1,5 @@
 import { NextRequest, NextResponse } from 'next/server';
-import { deleteTrack } from '@/lib/data';
+import { deleteTrack, updateTrack } from '@/lib/data';
 
 // Token d'authentification pour les imports (depuis .env)
 const IMPORT_API_TOKEN = process.env.IMPORT_API_TOKEN || process.env.ADMIN_PASSWORD;
@@ -10,6 +10,61 @@ function verifyToken(request: NextRequest): boolean {
   return token === IMPORT_API_TOKEN;
 }
 
+// Mise à jour d'un track importé (synchronisation --sync des scripts d'import)
+export async function PUT(
+  request: NextRequest,
+  { params }: { params: Promise<{ id: string }> }
+) {
+  try {
+    // Vérifier le token d'authentification
+    if (!verifyToken(request)) {
+      return NextResponse.json({ error: 'Non autorisé' }, { status: 401 });
+    }
+
+    const resolvedParams = await params;
+    const id = parseInt(resolvedParams.id, 10);
+
+    if (isNaN(id)) {
+      return NextResponse.json({ error: 'ID invalide' }, { status: 400 });
+    }
+
+    const body = await request.json();
+    const {
+      title, titleVF, acceptedAnswers, matchIndex, audioFile, imageFile,
+      timeLimit, startTime, externalId, sourceHash,
+    } = body;
+
+    if (acceptedAnswers !== undefined && !Array.isArray(acceptedAnswers)) {
+      return NextResponse.json({ error: 'acceptedAnswers doit être un tableau' }, { status: 400 });
+    }
+
+    const updated = await updateTrack(id, {
+      title,
+      titleVF,
+      acceptedAnswers,
+      matchIndex,
+      audioFile,
+      imageFile,
+      timeLimit,
+      startTime,
+      externalId: externalId === undefined || externalId === null ? externalId : String(externalId),
+      sourceHash,
+    });
+
+    if (!updated) {
+      return NextResponse.json({ error: 'Track non trouvé' }, { status: 404 });
+    }
+
+    return NextResponse.json(updated);
+  } catch (error: any) {
+    console.error('Erreur mise à jour track:', error);
+    return NextResponse.json(
+      { error: error.message || 'Erreur serveur' },
+      { status: 500 }
+    );
+  }
+}
+
 export async function DELETE(
   request: NextRequest,
   { params }: { params: Promise<{ id: string }> }
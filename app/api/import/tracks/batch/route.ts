@@ -0,0 +1,154 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { addTracks, deleteTracks } from '@/lib/data';
+import { Track } from '@/types';
+
+// Token d'authentification pour les imports (depuis .env)
+const IMPORT_API_TOKEN = process.env.IMPORT_API_TOKEN || process.env.ADMIN_PASSWORD;
+
+// Nombre maximum de tracks par requête
+const MAX_BATCH_SIZE = 500;
+
+// Nombre maximum d'IDs par suppression
+const MAX_DELETE_IDS = 5000;
+
+function verifyToken(request: NextRequest): boolean {
+  const authHeader = request.headers.get('Authorization');
+  const token = authHeader?.replace('Bearer ', '');
+  return token === IMPORT_API_TOKEN;
+}
+
+type BatchResult =
+  | { index: number; status: 'created'; track: Track }
+  | { index: number; status: 'invalid'; error: string };
+
+// Valider un track (mêmes règles que POST /api/import/tracks)
+function parseTrack(body: any): Omit<Track, 'id'> | string {
+  const { title, acceptedAnswers, audioFile, categoryId } = body || {};
+
+  if (!title || !acceptedAnswers || !audioFile || !categoryId) {
+    return 'Champs manquants: title, acceptedAnswers, audioFile, categoryId requis';
+  }
+
+  let answersArray: string[];
+  if (typeof acceptedAnswers === 'string') {
+    answersArray = acceptedAnswers.split(',').map((a: string) => a.trim());
+  } else if (Array.isArray(acceptedAnswers)) {
+    answersArray = acceptedAnswers;
+  } else {
+    return 'acceptedAnswers doit être un tableau ou une chaîne séparée par des virgules';
+  }
+
+  return {
+    title,
+    titleVF: body.titleVF || null,
+    acceptedAnswers: answersArray,
+    matchIndex: body.matchIndex || null,
+    externalId: body.externalId ? String(body.externalId) : null,
+    sourceHash: body.sourceHash || null,
+    audioFile,
+    imageFile: body.imageFile || null,
+    categoryId,
+    timeLimit: body.timeLimit || 30,
+    startTime: body.startTime || 0,
+  };
+}
+
+// Créer plusieurs tracks en une requête (une seule transaction)
+// Corps : { tracks: [...] } ou directement un tableau
+export async function POST(request: NextRequest) {
+  try {
+    // Vérifier le token d'authentification
+    if (!verifyToken(request)) {
+      return NextResponse.json({ error: 'Non autorisé' }, { status: 401 });
+    }
+
+    const body = await request.json();
+    const items = Array.isArray(body) ? body : body?.tracks;
+
+    if (!Array.isArray(items)) {
+      return NextResponse.json(
+        { error: 'Le corps doit être un tableau de tracks ou { tracks: [...] }' },
+        { status: 400 }
+      );
+    }
+
+    if (items.length > MAX_BATCH_SIZE) {
+      return NextResponse.json(
+        { error: `Trop de tracks (${items.length}), maximum ${MAX_BATCH_SIZE} par requête` },
+        { status: 413 }
+      );
+    }
+
+    // Les tracks invalides sont signalés individuellement, les autres sont insérés
+    const results: BatchResult[] = [];
+    const valid: { index: number; track: Omit<Track, 'id'> }[] = [];
+
+    items.forEach((item: any, index: number) => {
+      const parsed = parseTrack(item);
+      if (typeof parsed === 'string') {
+        results.push({ index, status: 'invalid', error: parsed });
+      } else {
+        valid.push({ index, track: parsed });
+      }
+    });
+
+    const created = valid.length > 0 ? await addTracks(valid.map((v) => v.track)) : [];
+
+    created.forEach((track, i) => {
+      results.push({ index: valid[i].index, status: 'created', track });
+    });
+    results.sort((a, b) => a.index - b.index);
+
+    return NextResponse.json(
+      { created: created.length, invalid: items.length - created.length, results },
+      { status: 201 }
+    );
+  } catch (error: any) {
+    console.error('Erreur création tracks (batch):', error);
+    return NextResponse.json(
+      { error: error.message || 'Erreur serveur' },
+      { status: 500 }
+    );
+  }
+}
+
+// Supprimer plusieurs tracks en une requête (une seule transaction)
+// Corps : { ids: [...] }, { categoryId: "films" } ou les deux (IDs de la catégorie)
+export async function DELETE(request: NextRequest) {
+  try {
+    // Vérifier le token d'authentification
+    if (!verifyToken(request)) {
+      return NextResponse.json({ error: 'Non autorisé' }, { status: 401 });
+    }
+
+    const body = await request.json().catch(() => null);
+    const { ids, categoryId } = body || {};
+
+    if (ids === undefined && !categoryId) {
+      return NextResponse.json(
+        { error: 'Champs manquants: ids et/ou categoryId requis' },
+        { status: 400 }
+      );
+    }
+
+    if (ids !== undefined && (!Array.isArray(ids) || !ids.every((id: unknown) => Number.isInteger(id)))) {
+      return NextResponse.json({ error: 'ids doit être un tableau d\'entiers' }, { status: 400 });
+    }
+
+    if (ids && ids.length > MAX_DELETE_IDS) {
+      return NextResponse.json(
+        { error: `Trop d'IDs (${ids.length}), maximum ${MAX_DELETE_IDS} par requête` },
+        { status: 413 }
+      );
+    }
+
+    const deleted = await deleteTracks({ ids, categoryId: categoryId || undefined });
+    return NextResponse.json({ deleted: deleted.length, ids: deleted });
+  } catch (error: any) {
+    console.error('Erreur suppression tracks (batch):', error);
+    return NextResponse.json(
+      { error: error.message || 'Erreur serveur' },
+      { status: 500 }
+    );
+  }
+}
@@ -66,6 +66,9 @@ export async function POST(request: NextRequest) {
       title,
       titleVF: body.titleVF || null,
       acceptedAnswers: answersArray,
+      matchIndex: body.matchIndex || null,
+      externalId: body.externalId ? String(body.externalId) : null,
+      sourceHash: body.sourceHash || null,
       audioFile,
       imageFile: body.imageFile || null,
       categoryId,
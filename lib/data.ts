@@ -2,19 +2,24 @@ import { prisma } from './prisma';
 import { Track, Category } from '@/types';
 
 // Convertir un track Prisma vers le type Track
+// (l'index de correspondance reste côté serveur de jeu)
 function toTrack(dbTrack: {
   id: number;
   title: string;
   titleVF: string | null;
   acceptedAnswers: string;
+  matchIndex?: string | null;
+  externalId?: string | null;
+  sourceHash?: string | null;
   audioFile: string;
   imageFile: string | null;
   categoryId: string;
   timeLimit: number;
   startTime: number;
 }): Track {
+  const { matchIndex: _matchIndex, ...track } = dbTrack;
   return {
-    ...dbTrack,
+    ...track,
     acceptedAnswers: JSON.parse(dbTrack.acceptedAnswers),
   };
 }
@@ -56,16 +61,43 @@ export async function addTrack(track: Omit<Track, 'id'>): Promise<Track> {
       title: track.title,
       titleVF: track.titleVF,
       acceptedAnswers: JSON.stringify(track.acceptedAnswers),
+      matchIndex: track.matchIndex ? JSON.stringify(track.matchIndex) : null,
       audioFile: track.audioFile,
       imageFile: track.imageFile,
       categoryId: track.categoryId,
       timeLimit: track.timeLimit,
       startTime: track.startTime || 0,
+      externalId: track.externalId || null,
+      sourceHash: track.sourceHash || null,
     },
   });
   return toTrack(newTrack);
 }
 
+// Ajouter plusieurs tracks dans une seule transaction
+export async function addTracks(tracks: Omit<Track, 'id'>[]): Promise<Track[]> {
+  const created = await prisma.$transaction(
+    tracks.map((track) =>
+      prisma.track.create({
+        data: {
+          title: track.title,
+          titleVF: track.titleVF,
+          acceptedAnswers: JSON.stringify(track.acceptedAnswers),
+          matchIndex: track.matchIndex ? JSON.stringify(track.matchIndex) : null,
+          audioFile: track.audioFile,
+          imageFile: track.imageFile,
+          categoryId: track.categoryId,
+          timeLimit: track.timeLimit,
+          startTime: track.startTime || 0,
+          externalId: track.externalId || null,
+          sourceHash: track.sourceHash || null,
+        },
+      })
+    )
+  );
+  return created.map(toTrack);
+}
+
 // Mettre à jour un track
 export async function updateTrack(id: number, updates: Partial<Track>): Promise<Track | null> {
   try {
@@ -73,12 +105,18 @@ export async function updateTrack(id: number, updates: Partial<Track>): Promise<
 
     if (updates.title !== undefined) data.title = updates.title;
     if (updates.titleVF !== undefined) data.titleVF = updates.titleVF;
-    if (updates.acceptedAnswers !== undefined) data.acceptedAnswers = JSON.stringify(updates.acceptedAnswers);
+    if (updates.acceptedAnswers !== undefined) {
+      data.acceptedAnswers = JSON.stringify(updates.acceptedAnswers);
+      // Un index périmé est effacé : server.js le reconstruit au chargement
+      data.matchIndex = updates.matchIndex ? JSON.stringify(updates.matchIndex) : null;
+    }
     if (updates.audioFile !== undefined) data.audioFile = updates.audioFile;
     if (updates.imageFile !== undefined) data.imageFile = updates.imageFile;
     if (updates.categoryId !== undefined) data.categoryId = updates.categoryId;
     if (updates.timeLimit !== undefined) data.timeLimit = updates.timeLimit;
     if (updates.startTime !== undefined) data.startTime = updates.startTime;
+    if (updates.externalId !== undefined) data.externalId = updates.externalId;
+    if (updates.sourceHash !== undefined) data.sourceHash = updates.sourceHash;
 
     const track = await prisma.track.update({
       where: { id },
@@ -102,6 +140,22 @@ export async function deleteTrack(id: number): Promise<boolean> {
   }
 }
 
+// Supprimer plusieurs tracks (par IDs et/ou par catégorie) dans une seule transaction
+// Renvoie les IDs supprimés
+export async function deleteTracks(filter: { ids?: number[]; categoryId?: string }): Promise<number[]> {
+  const where = {
+    ...(filter.ids ? { id: { in: filter.ids } } : {}),
+    ...(filter.categoryId ? { categoryId: filter.categoryId } : {}),
+  };
+
+  return prisma.$transaction(async (tx) => {
+    const tracks = await tx.track.findMany({ where, select: { id: true } });
+    const ids = tracks.map((track) => track.id);
+    await tx.track.deleteMany({ where: { id: { in: ids } } });
+    return ids;
+  });
+}
+
 // Ajouter une catégorie
 export async function addCategory(category: Category): Promise<Category> {
   try {
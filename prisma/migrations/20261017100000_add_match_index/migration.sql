@@ -0,0 +1,2 @@
+-- AlterTable
+ALTER TABLE "Track" ADD COLUMN "matchIndex" TEXT;
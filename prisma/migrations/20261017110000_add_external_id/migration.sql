@@ -0,0 +1,6 @@
+-- AlterTable
+ALTER TABLE "Track" ADD COLUMN "externalId" TEXT;
+ALTER TABLE "Track" ADD COLUMN "sourceHash" TEXT;
+
+-- CreateIndex
+CREATE INDEX "Track_categoryId_externalId_idx" ON "Track"("categoryId", "externalId");
@@ -0,0 +1,3 @@
+"""
+Offline import benchmark (see run.py).
+"""
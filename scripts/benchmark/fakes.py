@@ -0,0 +1,302 @@
+"""
+Local stand-ins for the services an import talks to: an OMDb-compatible
+server, the tracks import API (with poster hosting) and a yt-dlp/FFmpeg
+audio source. They run in-process, without network access.
+"""
+
+import hashlib
+import io
+import json
+import shutil
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+try:
+    from scripts.utils.ratelimit import TokenBucket
+except ImportError:
+    from ..utils.ratelimit import TokenBucket
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Request handler dispatching to the owning server's route()."""
+
+    protocol_version = 'HTTP/1.1'  # Keep-alive, like the real services
+    disable_nagle_algorithm = True  # Headers and body go out in separate writes
+
+    def log_message(self, format, *args):
+        pass
+
+    def _respond(self, method: str):
+        body = None
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            body = json.loads(self.rfile.read(length))
+
+        status, payload, content_type = self.server.owner.route(method, urlparse(self.path), body)
+        data = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        self._respond('GET')
+
+    def do_POST(self):
+        self._respond('POST')
+
+    def do_DELETE(self):
+        self._respond('DELETE')
+
+
+class _LocalServer:
+    """HTTP server on 127.0.0.1 (random port) served from a background thread."""
+
+    def __init__(self, latency: float = 0.0):
+        """
+        Initialize server.
+
+        Args:
+            latency: Seconds added to every response
+        """
+        self.latency = latency
+        self.requests = 0
+        self.lock = threading.Lock()
+        self._httpd: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL (e.g., "http://127.0.0.1:8123")."""
+        return f"http://127.0.0.1:{self._httpd.server_address[1]}"
+
+    def start(self) -> '_LocalServer':
+        """Start serving in a daemon thread."""
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.owner = self
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        """Stop serving."""
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def route(self, method: str, url, body: Any) -> tuple:
+        """Count the request, apply latency and dispatch to handle()."""
+        with self.lock:
+            self.requests += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return self.handle(method, url, body)
+
+    def handle(self, method: str, url, body: Any) -> tuple:
+        """
+        Build a response.
+
+        Returns:
+            Tuple of (status, JSON-serializable payload or bytes, content type)
+        """
+        raise NotImplementedError
+
+
+class FakeOMDbServer(_LocalServer):
+    """OMDb-compatible server with synthetic movies, latency and a rate limit."""
+
+    def __init__(
+        self,
+        poster_base_url: str,
+        latency: float = 0.0,
+        rate_limit: Optional[float] = None,
+        burst: int = 1,
+        missing_every: int = 0
+    ):
+        """
+        Initialize fake OMDb.
+
+        Args:
+            poster_base_url: URL prefix of posters (see FakeTracksAPI)
+            latency: Seconds added to every response
+            rate_limit: Requests per second allowed (None for unlimited);
+                requests over the limit get HTTP 429
+            burst: Requests allowed back to back
+            missing_every: Answer "Incorrect IMDb ID." for every Nth ID (0 for never)
+        """
+        super().__init__(latency)
+        self.poster_base_url = poster_base_url
+        self.bucket = TokenBucket(rate_limit, burst, 'fake-omdb') if rate_limit else None
+        self.missing_every = missing_every
+        self.rejected = 0
+
+    @property
+    def api_url(self) -> str:
+        """URL to use as OMDB_API_URL."""
+        return f"{self.url}/"
+
+    def handle(self, method, url, body):
+        # A request "in debt" would have had to wait: the real API refuses it
+        if self.bucket and self.bucket._reserve() > 0:
+            with self.lock:
+                self.rejected += 1
+            return 429, {'Response': 'False', 'Error': 'Request limit reached!'}, 'application/json'
+
+        imdb_id = parse_qs(url.query).get('i', [''])[0]
+        number = int(''.join(c for c in imdb_id if c.isdigit()) or 0)
+        if not imdb_id or (self.missing_every and number % self.missing_every == 0):
+            return 200, {'Response': 'False', 'Error': 'Incorrect IMDb ID.'}, 'application/json'
+
+        return 200, {
+            'Response': 'True',
+            'Title': f"Benchmark Movie {number}",
+            'Year': str(1950 + number % 75),
+            'imdbID': imdb_id,
+            'Type': 'movie',
+            'Genre': 'Drama',
+            'Director': 'Jane Doe',
+            'Actors': 'John Doe, Jane Roe',
+            'Plot': 'A synthetic movie used to benchmark imports.',
+            'Poster': f"{self.poster_base_url}/{imdb_id}.jpg",
+        }, 'application/json'
+
+
+class FakeTracksAPI(_LocalServer):
+    """Tracks import API (/api/import/tracks, /batch, /<id>) that also serves posters (/posters/)."""
+
+    def __init__(self, latency: float = 0.0, poster_size: tuple = (600, 889), bulk_delete: bool = True):
+        """
+        Initialize fake API.
+
+        Args:
+            latency: Seconds added to every response
+            poster_size: Size of the generated poster JPEG
+            bulk_delete: Serve DELETE /batch (False: like servers without it)
+        """
+        super().__init__(latency)
+        self.tracks: List[Dict[str, Any]] = []
+        self.next_id = 1
+        self.bulk_delete = bulk_delete
+
+        from PIL import Image
+        buffer = io.BytesIO()
+        Image.new('RGB', poster_size, (40, 40, 60)).save(buffer, 'JPEG', quality=90)
+        self.poster = buffer.getvalue()
+
+    @property
+    def poster_base_url(self) -> str:
+        """URL prefix of posters."""
+        return f"{self.url}/posters"
+
+    def _create(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        with self.lock:
+            track = {'id': self.next_id, **data}
+            self.next_id += 1
+            self.tracks.append(track)
+        return track
+
+    def _delete(self, ids: Optional[List[int]] = None, category_id: Optional[str] = None) -> List[int]:
+        with self.lock:
+            deleted = [
+                track['id'] for track in self.tracks
+                if (ids is None or track['id'] in ids) and (not category_id or track.get('categoryId') == category_id)
+            ]
+            self.tracks = [track for track in self.tracks if track['id'] not in deleted]
+        return deleted
+
+    def handle(self, method, url, body):
+        if url.path.startswith('/posters/'):
+            # Unique bytes per poster (after the JPEG end marker) so files do not deduplicate
+            return 200, self.poster + url.path.encode(), 'image/jpeg'
+
+        if url.path == '/api/import/tracks':
+            if method == 'GET':
+                with self.lock:
+                    return 200, list(self.tracks), 'application/json'
+            return 201, self._create(body), 'application/json'
+
+        if url.path == '/api/import/tracks/batch' and method == 'POST':
+            tracks = body['tracks'] if isinstance(body, dict) else body
+            results = [
+                {'index': i, 'status': 'created', 'track': self._create(track)}
+                for i, track in enumerate(tracks)
+            ]
+            return 201, {'created': len(results), 'invalid': 0, 'results': results}, 'application/json'
+
+        if url.path == '/api/import/tracks/batch' and method == 'DELETE' and self.bulk_delete:
+            deleted = self._delete(body.get('ids'), body.get('categoryId'))
+            return 200, {'deleted': len(deleted), 'ids': deleted}, 'application/json'
+
+        if url.path.startswith('/api/import/tracks/') and method == 'DELETE' and url.path.rsplit('/', 1)[1].isdigit():
+            self._delete([int(url.path.rsplit('/', 1)[1])])
+            return 200, {'success': True}, 'application/json'
+
+        return 404, {'error': 'Not found'}, 'application/json'
+
+
+class StubAudioSource:
+    """
+    Replaces yt-dlp downloads and FFmpeg encodes of a YouTubeDownloader.
+
+    Downloads sleep for `download_latency` and write `size` bytes; encodes
+    run stub_transcode() in the downloader's process pool.
+    """
+
+    def __init__(self, download_latency: float = 0.0, encode_latency: float = 0.0, size: int = 64 * 1024):
+        """
+        Initialize stub.
+
+        Args:
+            download_latency: Seconds per download
+            encode_latency: Seconds per encode
+            size: Bytes per downloaded file
+        """
+        self.download_latency = download_latency
+        self.encode_latency = encode_latency
+        self.size = size
+
+    def install(self, downloader):
+        """
+        Patch a YouTubeDownloader instance and the transcode function it uses.
+
+        Args:
+            downloader: YouTubeDownloader to patch
+        """
+        from scripts.utils import youtube
+
+        def fetch_source(target, filename, search=True, clip=None):
+            time.sleep(self.download_latency)
+            source = downloader.output_dir / f"{filename}.source.webm"
+            # Unique content per download, like real themes
+            header = f"{target}|{filename}|{clip}".encode()
+            source.write_bytes(header + b'\0' * max(0, self.size - len(header)))
+            video_id = hashlib.sha1(target.encode()).hexdigest()[:11]
+            return source, {'id': video_id, 'title': target}
+
+        downloader._fetch_source = fetch_source
+        downloader.download_source = lambda *args, **kwargs: fetch_source(*args, **kwargs)[0]
+        downloader.ffmpeg_path = f"stub:{self.encode_latency}"
+        youtube.transcode_audio = stub_transcode
+
+
+def stub_transcode(source, output, ffmpeg_path=None, profile=None, loudnorm=None, timeout=None) -> Dict[str, Any]:
+    """
+    Stand-in for transcode_audio(): sleeps, then copies the source.
+
+    Module-level so the process pool can pickle it; the encode latency
+    travels in ffmpeg_path ("stub:<seconds>").
+    """
+    time.sleep(float(str(ffmpeg_path).partition(':')[2] or 0))
+    shutil.copyfile(source, output)
+    return {
+        'output': str(output),
+        'codec': (profile or {}).get('codec', 'stub'),
+        'bitrate': (profile or {}).get('bitrate', ''),
+        'sample_rate': (profile or {}).get('sample_rate', 0),
+        'loudness': None,
+    }
@@ -0,0 +1,383 @@
+"""
+Guess-replay evaluation of answer matching.
+Replays recorded or synthetic player guesses against each track's accepted
+answers with the game server's rules (see AnswerMatcher) and reports
+matching throughput, per-guess latency and false accept/reject rates
+("close" answers, which prompt the player to retry, are reported apart).
+Runs offline against prisma/dev.db or an exported catalog.
+"""
+
+import argparse
+import json
+import os
+import random
+import sqlite3
+import sys
+import time
+import unicodedata
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from scripts.config import PROJECT_ROOT
+from scripts.utils.answers import AnswerMatcher, generate_accepted_answers_batch
+from scripts.utils.catalog import iter_catalog
+from scripts.utils.metrics import percentile
+
+DEFAULT_DB = PROJECT_ROOT / 'prisma' / 'dev.db'
+
+# Synthetic guess kinds and whether the guess names the track
+GUESS_KINDS = {
+    'answer': True,   # An accepted answer, as typed
+    'styled': True,   # A title with other case, accents or spacing
+    'typo': True,     # A title with one typo
+    'other': False,   # Another track's title
+    'noise': False,   # Random words
+}
+
+NOISE_WORDS = (
+    'aucune', 'idee', 'film', 'musique', 'star', 'wars', 'love', 'night', 'man', 'king',
+    'le', 'la', 'the', 'of', 'retour', 'dark', 'city', 'blue', 'rouge', 'hero',
+)
+
+
+def load_tracks_from_db(db_path: Path, stored: bool = False) -> List[Dict[str, Any]]:
+    """
+    Load tracks from the SQLite database.
+
+    Args:
+        db_path: Path to dev.db
+        stored: Use the acceptedAnswers stored in the database instead of
+            regenerating them with generate_accepted_answers()
+
+    Returns:
+        Track dictionaries ('id', 'title', 'titleVF', 'acceptedAnswers')
+    """
+    connection = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        rows = connection.execute('SELECT id, title, titleVF, acceptedAnswers FROM Track ORDER BY id').fetchall()
+    finally:
+        connection.close()
+
+    tracks = [
+        {'id': row[0], 'title': row[1], 'titleVF': row[2], 'acceptedAnswers': json.loads(row[3])}
+        for row in rows
+    ]
+    if not stored:
+        answers = generate_accepted_answers_batch((t['title'], t['titleVF']) for t in tracks)
+        for track, accepted in zip(tracks, answers):
+            track['acceptedAnswers'] = accepted
+    return tracks
+
+
+def load_tracks_from_catalog(path: Path) -> List[Dict[str, Any]]:
+    """
+    Load tracks from a catalog file (films_list.json, JSON Lines or CSV).
+
+    Items need a "title" or "titleVF"; answers come from generate_accepted_answers().
+
+    Args:
+        path: Catalog file
+
+    Returns:
+        Track dictionaries ('id', 'title', 'titleVF', 'acceptedAnswers')
+    """
+    tracks = []
+    for number, item in enumerate(iter_catalog(path), 1):
+        title = item.get('title') or item.get('titleVF')
+        if not title:
+            continue
+        tracks.append({'id': item.get('id', number), 'title': title, 'titleVF': item.get('titleVF')})
+
+    answers = generate_accepted_answers_batch((t['title'], t['titleVF']) for t in tracks)
+    for track, accepted in zip(tracks, answers):
+        track['acceptedAnswers'] = accepted
+    return tracks
+
+
+def _strip_accents(text: str) -> str:
+    return ''.join(c for c in unicodedata.normalize('NFD', text) if unicodedata.category(c) != 'Mn')
+
+
+def _styled(rng: random.Random, title: str) -> str:
+    """Retype a title with other case, accents or spacing."""
+    style = rng.randrange(4)
+    if style == 0:
+        return title.upper()
+    if style == 1:
+        return _strip_accents(title).lower()
+    if style == 2:
+        return f"  {'  '.join(title.split())} "
+    return title.lower()
+
+
+def _typo(rng: random.Random, title: str) -> str:
+    """Apply one insertion, deletion or substitution to a title."""
+    chars = list(title.lower())
+    position = rng.randrange(len(chars) + 1)
+    operation = rng.randrange(3)
+    letter = rng.choice('abcdefghijklmnopqrstuvwxyz')
+    if operation == 0 or not chars:
+        chars.insert(position, letter)
+    elif operation == 1:
+        del chars[min(position, len(chars) - 1)]
+    else:
+        chars[min(position, len(chars) - 1)] = letter
+    return ''.join(chars)
+
+
+def synthetic_guesses(tracks: List[Dict[str, Any]], per_track: int, seed: int) -> Iterator[Dict[str, Any]]:
+    """
+    Generate labelled guesses.
+
+    Args:
+        tracks: Tracks to guess
+        per_track: Guesses per track (spread over GUESS_KINDS)
+        seed: Random seed (runs are reproducible)
+
+    Yields:
+        {'track': index, 'guess', 'kind', 'expected': True if the guess names the track}
+    """
+    rng = random.Random(seed)
+    kinds = list(GUESS_KINDS)
+
+    for index, track in enumerate(tracks):
+        titles = [title for title in (track['title'], track['titleVF']) if title]
+        for number in range(per_track):
+            kind = kinds[number % len(kinds)]
+            if kind == 'answer':
+                guess = rng.choice(track['acceptedAnswers'])
+            elif kind == 'styled':
+                guess = _styled(rng, rng.choice(titles))
+            elif kind == 'typo':
+                guess = _typo(rng, rng.choice(titles))
+            elif kind == 'other' and len(tracks) > 1:
+                other = tracks[(index + rng.randrange(1, len(tracks))) % len(tracks)]
+                guess = rng.choice([title for title in (other['title'], other['titleVF']) if title])
+            else:
+                kind = 'noise'
+                guess = ' '.join(rng.choice(NOISE_WORDS) for _ in range(rng.randint(1, 4)))
+            yield {'track': index, 'guess': guess, 'kind': kind, 'expected': GUESS_KINDS[kind]}
+
+
+def recorded_guesses(path: Path, tracks: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """
+    Read recorded guesses.
+
+    JSON Lines, one {"track": <id or title>, "guess": "...", "correct": true/false}
+    per line; "correct" is whether the player actually named the track.
+
+    Args:
+        path: Guess corpus file
+        tracks: Loaded tracks (to resolve "track")
+
+    Yields:
+        Labelled guesses like synthetic_guesses()
+    """
+    lookup = {}
+    for index, track in enumerate(tracks):
+        lookup[str(track['id'])] = index
+        lookup.setdefault(track['title'], index)
+
+    for record in iter_catalog(path):
+        index = lookup.get(str(record.get('track')))
+        if index is None:
+            continue
+        yield {
+            'track': index,
+            'guess': record['guess'],
+            'kind': record.get('kind', 'recorded'),
+            'expected': bool(record.get('correct')),
+        }
+
+
+def replay(tracks: List[Dict[str, Any]], guesses: Iterator[Dict[str, Any]], largest: int = 5) -> Dict[str, Any]:
+    """
+    Replay guesses and measure matching.
+
+    Args:
+        tracks: Tracks with 'acceptedAnswers'
+        guesses: Labelled guesses
+        largest: Number of largest answer sets reported
+
+    Returns:
+        Report dictionary (throughput, latencies, accuracy per kind)
+    """
+    build_start = time.perf_counter()
+    matchers = [AnswerMatcher.from_answers(track['acceptedAnswers']) for track in tracks]
+    build_time = time.perf_counter() - build_start
+
+    timings: List[float] = []
+    worst_by_track: Dict[int, float] = defaultdict(float)
+    kinds: Dict[str, Counter] = defaultdict(Counter)
+    false_accepts: List[Dict[str, Any]] = []
+    false_rejects: List[Dict[str, Any]] = []
+    close_calls: List[Dict[str, Any]] = []
+    positives = 0
+
+    for entry in guesses:
+        matcher = matchers[entry['track']]
+        start = time.perf_counter()
+        result = matcher.check(entry['guess'])
+        elapsed = time.perf_counter() - start
+
+        timings.append(elapsed)
+        worst_by_track[entry['track']] = max(worst_by_track[entry['track']], elapsed)
+
+        counts = kinds[entry['kind']]
+        counts['guesses'] += 1
+        counts[result] += 1
+        positives += entry['expected']
+        if result == 'correct' and not entry['expected']:
+            counts['false_accepts'] += 1
+            false_accepts.append({**entry, 'title': tracks[entry['track']]['title']})
+        elif result == 'close' and entry['expected']:
+            # The server asks the player to retry: neither accepted nor rejected
+            close_calls.append({**entry, 'title': tracks[entry['track']]['title'], 'result': result})
+        elif result == 'wrong' and entry['expected']:
+            counts['false_rejects'] += 1
+            false_rejects.append({**entry, 'title': tracks[entry['track']]['title'], 'result': result})
+
+    total_time = sum(timings)
+    timings.sort()
+    negatives = len(timings) - positives
+
+    by_size = sorted(range(len(tracks)), key=lambda i: len(matchers[i].ordered), reverse=True)[:largest]
+
+    return {
+        'tracks': len(tracks),
+        'answers_per_track': {
+            'mean': sum(len(m.ordered) for m in matchers) / len(matchers) if matchers else 0,
+            'max': max((len(m.ordered) for m in matchers), default=0),
+        },
+        'index_build_seconds': build_time,
+        'guesses': len(timings),
+        'matches_per_second': len(timings) / total_time if total_time else 0.0,
+        'latency': {
+            'p50': percentile(timings, 50),
+            'p99': percentile(timings, 99),
+            'max': timings[-1] if timings else 0.0,
+        },
+        'false_accept_rate': len(false_accepts) / negatives if negatives else 0.0,
+        'false_reject_rate': len(false_rejects) / positives if positives else 0.0,
+        'close_rate': len(close_calls) / positives if positives else 0.0,
+        'kinds': {kind: dict(counts) for kind, counts in kinds.items()},
+        'largest_answer_sets': [
+            {
+                'id': tracks[i]['id'],
+                'title': tracks[i]['title'],
+                'answers': len(matchers[i].ordered),
+                'worst_seconds': worst_by_track.get(i, 0.0),
+            }
+            for i in by_size
+        ],
+        'false_accepts': false_accepts,
+        'false_rejects': false_rejects,
+        'close_calls': close_calls,
+    }
+
+
+def print_report(report: Dict[str, Any], examples: int = 5):
+    """Print a replay report."""
+    answers = report['answers_per_track']
+    latency = report['latency']
+    print(f"Tracks:        {report['tracks']} (answers per track: {answers['mean']:.1f} avg, {answers['max']} max)")
+    print(f"Index build:   {report['index_build_seconds'] * 1000:.1f}ms")
+    print(f"Guesses:       {report['guesses']}")
+    print(f"Throughput:    {report['matches_per_second']:,.0f} matches/s")
+    print(
+        f"Per guess:     p50={latency['p50'] * 1e6:.1f}us  p99={latency['p99'] * 1e6:.1f}us  "
+        f"max={latency['max'] * 1e6:.1f}us"
+    )
+    print(f"False accepts: {len(report['false_accepts'])} ({report['false_accept_rate']:.2%} of wrong guesses)")
+    print(f"False rejects: {len(report['false_rejects'])} ({report['false_reject_rate']:.2%} of right guesses)")
+    print(f"Close:         {len(report['close_calls'])} ({report['close_rate']:.2%} of right guesses)")
+
+    print("\nBy kind:")
+    for kind, counts in report['kinds'].items():
+        print(
+            f"  {kind:<10} n={counts.get('guesses', 0):<7} correct={counts.get('correct', 0):<7} "
+            f"close={counts.get('close', 0):<7} wrong={counts.get('wrong', 0)}"
+        )
+
+    print("\nLargest answer sets (worst guess time):")
+    for track in report['largest_answer_sets']:
+        print(f"  {track['answers']:>3} answers  {track['worst_seconds'] * 1e6:8.1f}us  {track['title']}")
+
+    sections = (
+        ('False accepts', report['false_accepts']),
+        ('False rejects', report['false_rejects']),
+        ('Close', report['close_calls']),
+    )
+    for label, entries in sections:
+        if entries:
+            print(f"\n{label} (first {min(examples, len(entries))}):")
+            for entry in entries[:examples]:
+                result = f" -> {entry['result']}" if 'result' in entry else ''
+                print(f"  [{entry['kind']}] \"{entry['guess']}\" for \"{entry['title']}\"{result}")
+
+
+def main():
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description='Replay player guesses against accepted answers with the game server rules',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Synthetic guesses against the tracks of prisma/dev.db
+  python scripts/benchmark/guesses.py
+
+  # Answers as stored in the database, recorded guesses
+  python scripts/benchmark/guesses.py --stored --guesses guesses.jsonl
+
+  # Exported catalog, 200 guesses per track, JSON report
+  python scripts/benchmark/guesses.py --catalog export.jsonl --per-track 200 --json report.json
+        """
+    )
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--db', type=Path, default=DEFAULT_DB, help=f'SQLite database (default: {DEFAULT_DB})')
+    source.add_argument('--catalog', type=Path, help='Catalog file instead of the database (.json, .jsonl, .csv)')
+    parser.add_argument(
+        '--stored',
+        action='store_true',
+        help='Use the answers stored in the database instead of regenerating them'
+    )
+    parser.add_argument('--guesses', type=Path, help='Recorded guesses (JSON Lines) instead of synthetic ones')
+    parser.add_argument('--per-track', type=int, default=50, help='Synthetic guesses per track (default: 50)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed of synthetic guesses')
+    parser.add_argument('--largest', type=int, default=5, help='Largest answer sets to report')
+    parser.add_argument('--json', metavar='FILE', help='Also write the report as JSON')
+    args = parser.parse_args()
+
+    if args.catalog:
+        if args.stored:
+            parser.error('--stored needs the database (not --catalog)')
+        tracks = load_tracks_from_catalog(args.catalog)
+    else:
+        if not args.db.is_file():
+            parser.error(f'Database not found: {args.db}')
+        tracks = load_tracks_from_db(args.db, stored=args.stored)
+
+    if not tracks:
+        print("No tracks to evaluate")
+        sys.exit(1)
+
+    if args.guesses:
+        guesses = recorded_guesses(args.guesses, tracks)
+    else:
+        guesses = synthetic_guesses(tracks, args.per_track, args.seed)
+
+    report = replay(tracks, guesses, args.largest)
+    print_report(report)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\nReport written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
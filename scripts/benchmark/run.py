@@ -0,0 +1,197 @@
+"""
+Offline import benchmark.
+Runs FilmsImporter against local fakes (OMDb, tracks API, audio source)
+on synthetic catalogs and reports throughput and per-stage latencies,
+so import changes can be compared without network access.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+MODES = ('serial', 'prefetch', 'pipeline', 'async')
+STAGE_NAMES = ('metadata', 'audio', 'image', 'create', 'create_batch')
+
+
+def write_catalog(path: Path, size: int):
+    """Write a synthetic JSON Lines catalog of `size` IMDb IDs."""
+    with open(path, 'w', encoding='utf-8') as f:
+        for number in range(1, size + 1):
+            f.write(json.dumps({'id': f"tt{number:07d}", 'titleVF': f"Film {number}"}) + '\n')
+
+
+def reset_scratch(scratch: Path):
+    """Empty the media and cache directories between runs."""
+    for name in ('audio', 'images', 'cache'):
+        shutil.rmtree(scratch / name, ignore_errors=True)
+        (scratch / name).mkdir(parents=True)
+
+
+def run_once(mode: str, size: int, args: argparse.Namespace, scratch: Path) -> Dict[str, Any]:
+    """
+    Import a synthetic catalog once against fresh fakes.
+
+    Args:
+        mode: "serial", "prefetch", "pipeline" or "async"
+        size: Catalog size
+        args: Benchmark options
+        scratch: Scratch directory (media and caches)
+
+    Returns:
+        Result dictionary (stats, throughput, stage latencies, fake service counters)
+    """
+    from scripts.importers.films import FilmsImporter
+    from scripts.utils.ratelimit import TokenBucket
+    from scripts.benchmark.fakes import FakeOMDbServer, FakeTracksAPI, StubAudioSource
+
+    reset_scratch(scratch)
+    catalog = scratch / f"catalog-{size}.jsonl"
+    write_catalog(catalog, size)
+
+    api = FakeTracksAPI(latency=args.api_latency).start()
+    omdb = FakeOMDbServer(
+        api.poster_base_url,
+        latency=args.omdb_latency,
+        rate_limit=args.omdb_rate,
+        burst=args.omdb_burst,
+        missing_every=args.missing_every
+    ).start()
+
+    importer = FilmsImporter(omdb_api_key='benchmark', api_base_url=api.url)
+    importer.omdb_client.api_url = omdb.api_url
+    importer.omdb_client.cache = None
+    # Client limiter matches the server's limit, plus a small margin
+    importer.omdb_client.rate_limiter = TokenBucket(
+        args.omdb_rate * 0.95 if args.omdb_rate else 1e6, args.omdb_burst, 'omdb'
+    )
+    importer.youtube_dl.search_cache = None
+    StubAudioSource(args.download_latency, args.encode_latency, args.audio_size).install(importer.youtube_dl)
+    if not args.images:
+        importer.poster_processor = None
+
+    options = {
+        'serial': {'prefetch': 0},
+        'prefetch': {'prefetch': 8},
+        'pipeline': {'workers': {}},
+        'async': {'async_engine': True},
+    }[mode]
+
+    output = sys.stdout if args.verbose else open(os.devnull, 'w')
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(output):
+            stats = importer.import_all(
+                skip_existing=True, catalog=catalog, restart=True, batch_size=args.batch_size, **options
+            )
+    finally:
+        duration = time.perf_counter() - start
+        if output is not sys.stdout:
+            output.close()
+        importer.audio_store.close()
+        importer.image_store.close()
+        importer.journal.close()
+        omdb.stop()
+        api.stop()
+
+    # Importer stages only (client calls such as omdb_request are timed too)
+    timings = stats['metrics']['timings']
+    return {
+        'mode': mode,
+        'size': size,
+        'duration': duration,
+        'items_per_second': size / duration if duration else 0.0,
+        'successful': stats['successful'],
+        'failed': stats['failed'],
+        'skipped': stats['skipped'],
+        'stages': {stage: timings[stage] for stage in STAGE_NAMES if stage in timings},
+        'counters': stats['metrics']['counters'],
+        'omdb_requests': omdb.requests,
+        'omdb_rejected': omdb.rejected,
+        'api_requests': api.requests,
+    }
+
+
+def print_result(result: Dict[str, Any]):
+    """Print one run's throughput and stage latencies."""
+    print(
+        f"\n{result['mode']:>8} x {result['size']:<6} "
+        f"{result['items_per_second']:8.1f} items/s  ({result['duration']:.2f}s)  "
+        f"ok={result['successful']} failed={result['failed']} skipped={result['skipped']}  "
+        f"omdb={result['omdb_requests']} (429: {result['omdb_rejected']}) api={result['api_requests']}"
+    )
+    for stage, latency in result['stages'].items():
+        print(
+            f"    {stage:<13} n={latency['count']:<6} "
+            f"p50={latency['p50'] * 1000:8.1f}ms  p95={latency['p95'] * 1000:8.1f}ms  "
+            f"p99={latency['p99'] * 1000:8.1f}ms  max={latency['max'] * 1000:8.1f}ms"
+        )
+
+
+def main():
+    """Run the benchmark matrix."""
+    parser = argparse.ArgumentParser(
+        description='Benchmark imports offline against local fake services',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Compare the import modes on 100 and 1000 items
+  python scripts/benchmark/run.py --sizes 100 1000
+
+  # Free-tier OMDb (1 req/s) with slow downloads, batched creates
+  python scripts/benchmark/run.py --modes pipeline async --omdb-rate 1 --download-latency 2 --batch-size 50
+        """
+    )
+    parser.add_argument('--sizes', type=int, nargs='+', default=[50, 200], help='Catalog sizes (default: 50 200)')
+    parser.add_argument('--modes', nargs='+', choices=MODES, default=list(MODES), help='Import modes to run')
+    parser.add_argument('--repeat', type=int, default=1, help='Runs per mode and size')
+    parser.add_argument('--omdb-latency', type=float, default=0.05, help='OMDb response time in seconds')
+    parser.add_argument('--omdb-rate', type=float, help='OMDb requests per second (default: unlimited)')
+    parser.add_argument('--omdb-burst', type=int, default=1, help='OMDb requests allowed back to back')
+    parser.add_argument('--missing-every', type=int, default=0, help='Every Nth ID is unknown to OMDb')
+    parser.add_argument('--api-latency', type=float, default=0.01, help='Tracks API response time in seconds')
+    parser.add_argument('--download-latency', type=float, default=0.2, help='Audio download time in seconds')
+    parser.add_argument('--encode-latency', type=float, default=0.05, help='Audio encode time in seconds')
+    parser.add_argument('--audio-size', type=int, default=64 * 1024, help='Downloaded audio size in bytes')
+    parser.add_argument('--batch-size', '-b', type=int, default=1, help='Tracks per batch create (1: no batching)')
+    parser.add_argument('--no-images', dest='images', action='store_false', help='Skip poster variant generation')
+    parser.add_argument('--json', metavar='FILE', help='Also write results as JSON')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Show importer output')
+    args = parser.parse_args()
+
+    # Media, caches and journal go to a scratch directory (read by config on import)
+    scratch = Path(tempfile.mkdtemp(prefix='blindtest-benchmark-'))
+    os.environ.update({
+        'AUDIO_DIR': str(scratch / 'audio'),
+        'IMAGES_DIR': str(scratch / 'images'),
+        'CACHE_DIR': str(scratch / 'cache'),
+    })
+
+    results = []
+    try:
+        for size in args.sizes:
+            for mode in args.modes:
+                for _ in range(args.repeat):
+                    result = run_once(mode, size, args, scratch)
+                    print_result(result)
+                    results.append(result)
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'options': vars(args), 'results': results}, f, indent=2)
+        print(f"\nResults written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
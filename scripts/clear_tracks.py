@@ -1,60 +1,163 @@
 """
-Script to clear all tracks from the database.
+Script to clear tracks from the database (all of them, or by category or ID).
 """
 
 import sys
 import os
 import argparse
+from typing import List, Set
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from scripts.config import API_DELETE_WORKERS
 from scripts.utils.api_client import TrackAPIClient
+from scripts.utils.journal import ImportJournal
+from scripts.utils.media_store import release_track_media
+
+
+def read_ids(path: str) -> Set[int]:
+    """
+    Read track IDs from a file.
+
+    Args:
+        path: File with one ID per line ("-" for stdin); blank lines and
+            lines starting with "#" are ignored
+
+    Returns:
+        Set of track IDs
+
+    Raises:
+        ValueError: On a line that is not an integer
+    """
+    stream = sys.stdin if path == '-' else open(path, 'r', encoding='utf-8')
+    try:
+        ids = set()
+        for line_number, line in enumerate(stream, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            try:
+                ids.add(int(line))
+            except ValueError:
+                raise ValueError(f"{path}:{line_number}: invalid track ID {line!r}")
+        return ids
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
 
 
 def main():
-    """Clear all tracks from database."""
-    parser = argparse.ArgumentParser(description='Clear all tracks from database')
+    """Clear tracks from database."""
+    parser = argparse.ArgumentParser(
+        description='Clear tracks from database',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Delete all tracks
+  python scripts/clear_tracks.py
+
+  # Delete the tracks of one category, without confirmation
+  python scripts/clear_tracks.py --category films --force
+
+  # Delete the tracks listed in a file (one ID per line)
+  python scripts/clear_tracks.py --ids-from ids.txt
+
+  # Also reclaim the stored files of the deleted tracks
+  python scripts/clear_tracks.py --category films --release-media
+        """
+    )
     parser.add_argument('--force', '-f', action='store_true', help='Skip confirmation prompt')
+    parser.add_argument('--category', '-c', nargs='+', help='Only delete tracks of these categories')
+    parser.add_argument('--ids-from', metavar='FILE', help='Only delete these track IDs (one per line, "-" for stdin)')
+    parser.add_argument(
+        '--release-media',
+        action='store_true',
+        help='Also delete the stored audio/posters no remaining track uses (kept by default, '
+             'so a re-import reuses them)'
+    )
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=API_DELETE_WORKERS,
+        help=f'Concurrent deletes when the server has no bulk endpoint (default: {API_DELETE_WORKERS})'
+    )
     args = parser.parse_args()
 
+    ids = None
+    if args.ids_from:
+        try:
+            ids = read_ids(args.ids_from)
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+
     client = TrackAPIClient()
 
     print("Fetching all tracks...")
     tracks = client.get_tracks()
 
+    if args.category:
+        tracks = [track for track in tracks if track.get('categoryId') in args.category]
+    if ids is not None:
+        tracks = [track for track in tracks if track['id'] in ids]
+
     if not tracks:
-        print("[OK] Database is already empty (no tracks found)")
+        if args.category or ids is not None:
+            print("[OK] No matching tracks")
+        else:
+            print("[OK] Database is already empty (no tracks found)")
         return
 
+    scope = 'ALL' if not (args.category or ids is not None) else 'the selected'
     print(f"Found {len(tracks)} tracks to delete")
 
     if not args.force:
-        confirm = input(f"\nAre you sure you want to delete ALL {len(tracks)} tracks? (yes/no): ")
+        confirm = input(f"\nAre you sure you want to delete {scope} {len(tracks)} tracks? (yes/no): ")
         if confirm.lower() not in ['yes', 'y', 'oui']:
             print("Operation cancelled")
             return
 
     print("\nDeleting tracks...")
-    deleted = 0
-    failed = 0
-
-    for track in tracks:
-        track_id = track['id']
-        title = track.get('title', 'Unknown')
-
-        if client.delete_track(track_id):
-            deleted += 1
-            print(f"  [OK] Deleted: {title}")
+    track_ids = [track['id'] for track in tracks]
+    deleted: List[int] = []
+
+    if args.category and ids is None:
+        # One request (and transaction) per category
+        for category in args.category:
+            deleted += client.delete_tracks(category_id=category, workers=args.workers)
+    else:
+        deleted = client.delete_tracks(track_ids, workers=args.workers)
+
+    # Deleted tracks must be imported again on --resume
+    journal = ImportJournal()
+    if not args.category and ids is None:
+        journal.clear()
+    else:
+        journal.forget_tracks(deleted)
+    journal.close()
+
+    deleted_ids = set(deleted)
+    if args.release_media and deleted_ids:
+        # Files still used by a surviving track (any category) are kept
+        try:
+            remaining = client.get_tracks(strict=True)
+        except Exception as e:
+            print(f"[WARN] Stored media not released, could not list the remaining tracks: {e}")
         else:
-            failed += 1
-            print(f"  [FAIL] Failed: {title}")
+            released = release_track_media([track for track in tracks if track['id'] in deleted_ids], remaining)
+            print(f"Released {released} stored media keys")
+
+    failed = [track for track in tracks if track['id'] not in deleted_ids]
+    for track in failed[:10]:
+        print(f"  [FAIL] Not deleted: {track.get('title', 'Unknown')} (#{track['id']})")
+    if len(failed) > 10:
+        print(f"  ... and {len(failed) - 10} more")
 
     print("\n" + "=" * 50)
-    print(f"Deleted: {deleted}")
-    print(f"Failed:  {failed}")
+    print(f"Deleted: {len(deleted)}")
+    print(f"Failed:  {len(failed)}")
     print("=" * 50)
-    print("\n[OK] Database cleared!")
+    print("\n[OK] Database cleared!" if not failed else "\n[WARN] Some tracks were not deleted")
 
 
 if __name__ == '__main__':
@@ -70,12 +70,111 @@ FFMPEG_PATH = detect_ffmpeg()
 DEFAULT_TIME_LIMIT = 30
 DEFAULT_START_TIME = 0
 
+# asyncio import engine (--async)
+ASYNC_MAX_IN_FLIGHT = int(os.getenv('ASYNC_MAX_IN_FLIGHT', 100))   # Items processed at once
+ASYNC_PER_HOST_LIMIT = int(os.getenv('ASYNC_PER_HOST_LIMIT', 8))   # Open connections per host
+ASYNC_BLOCKING_WORKERS = int(os.getenv('ASYNC_BLOCKING_WORKERS', 4))  # Threads for blocking calls
+
+# Batch track creation (POST /api/import/tracks/batch)
+# IMPORT_BATCH_SIZE=1 creates each track as soon as it is ready
+IMPORT_BATCH_SIZE = int(os.getenv('IMPORT_BATCH_SIZE', 1))
+API_BATCH_CHUNK_SIZE = 100  # Max tracks per batch request (server limit: 500)
+
+# Bulk deletion (DELETE /api/import/tracks/batch, see clear_tracks.py)
+API_DELETE_CHUNK_SIZE = 1000  # Max IDs per request (server limit: 5000)
+API_DELETE_WORKERS = int(os.getenv('API_DELETE_WORKERS', 8))  # Concurrent DELETEs without the bulk endpoint
+
+# Clip mode: download and encode only [startTime - margin, startTime + timeLimit + margin]
+AUDIO_CLIP_MODE = os.getenv('AUDIO_CLIP_MODE', '').lower() in ('1', 'true', 'yes')
+CLIP_MARGIN = 2  # Seconds kept around the played window
+
 # Timeouts
 HTTP_TIMEOUT = 30
 YOUTUBE_DOWNLOAD_TIMEOUT = 120
 
-# OMDb rate limiting (free tier: 1 req/sec)
-OMDB_RATE_LIMIT_DELAY = 1.0
+# Shared HTTP connection pools (scripts/utils/http.py), kept alive between requests
+HTTP_POOL_HOSTS = int(os.getenv('HTTP_POOL_HOSTS', 10))   # Hosts with a cached pool
+HTTP_POOL_SIZE = int(os.getenv('HTTP_POOL_SIZE', 16))     # Connections kept per host
+
+# OMDb rate limiting, shared token bucket (free tier: 1 req/sec, no burst)
+OMDB_RATE_LIMIT = float(os.getenv('OMDB_RATE_LIMIT', 1.0))  # Requests per second
+OMDB_RATE_BURST = int(os.getenv('OMDB_RATE_BURST', 1))      # Requests allowed back to back
+
+# Persistent OMDb metadata cache (SQLite, survives between runs)
+CACHE_DIR = Path(os.getenv('CACHE_DIR', PROJECT_ROOT / 'scripts' / '.cache'))
+OMDB_CACHE_PATH = CACHE_DIR / 'omdb.sqlite'
+OMDB_CACHE_TTL = 30 * 24 * 3600           # 30 days
+OMDB_CACHE_NEGATIVE_TTL = 24 * 3600       # "not found" answers: 1 day
+
+# Persistent YouTube search cache (query -> chosen video), skips ytsearch on a hit
+YOUTUBE_CACHE_PATH = CACHE_DIR / 'youtube.sqlite'
+YOUTUBE_CACHE_TTL = int(os.getenv('YOUTUBE_CACHE_TTL', 180 * 24 * 3600))  # 180 days
+
+# Pooled audio acquisition: yt-dlp downloads in threads, MP3 encodes in processes
+AUDIO_DOWNLOAD_WORKERS = int(os.getenv('AUDIO_DOWNLOAD_WORKERS', 3))
+AUDIO_TRANSCODE_WORKERS = int(os.getenv('AUDIO_TRANSCODE_WORKERS', os.cpu_count() or 1))
+AUDIO_TRANSCODE_TIMEOUT = 300
+
+# Budgets shared by all importers of a run (categories imported concurrently
+# draw from the same slots, see scripts/utils/budget.py)
+IMPORT_DOWNLOAD_SLOTS = int(os.getenv('IMPORT_DOWNLOAD_SLOTS', AUDIO_DOWNLOAD_WORKERS))  # yt-dlp downloads at once
+IMPORT_FFMPEG_SLOTS = int(os.getenv('IMPORT_FFMPEG_SLOTS', AUDIO_TRANSCODE_WORKERS))    # FFmpeg encodes at once
+
+# YouTube request rate shared by all importers (0 disables the limit)
+YOUTUBE_RATE_LIMIT = float(os.getenv('YOUTUBE_RATE_LIMIT', 0))  # Requests per second
+YOUTUBE_RATE_BURST = int(os.getenv('YOUTUBE_RATE_BURST', 1))
+
+# Audio encoding profiles (--audio-profile); a blindtest only plays short
+# excerpts, so low bitrates keep files small and first plays fast
+AUDIO_PROFILES = {
+    'mp3-192': {'codec': 'libmp3lame', 'bitrate': '192k', 'ext': 'mp3', 'sample_rate': 44100},
+    'mp3-128': {'codec': 'libmp3lame', 'bitrate': '128k', 'ext': 'mp3', 'sample_rate': 44100},
+    'aac-96': {'codec': 'aac', 'bitrate': '96k', 'ext': 'm4a', 'sample_rate': 44100},
+    'opus-64': {'codec': 'libopus', 'bitrate': '64k', 'ext': 'opus', 'sample_rate': 48000},
+}
+AUDIO_PROFILE = os.getenv('AUDIO_PROFILE', 'mp3-192')
+
+# Two-pass EBU R128 loudness normalization, so rounds play at the same volume
+# (opt-in: doubles the FFmpeg work of each file)
+AUDIO_LOUDNORM = os.getenv('AUDIO_LOUDNORM', 'false').lower() in ('1', 'true', 'yes')
+LOUDNORM_TARGET = {'I': -16, 'TP': -1.5, 'LRA': 11}  # LUFS, dBTP, LU
+
+# Poster variants generated after download (see scripts/process_images.py)
+IMAGE_PROCESSING = os.getenv('IMAGE_PROCESSING', 'true').lower() in ('1', 'true', 'yes')
+IMAGE_WIDTHS = (185, 342, 500)   # Resized JPEG + WebP widths
+IMAGE_THUMB_WIDTH = 92           # WebP thumbnail (admin lists)
+IMAGE_QUALITY = 82
+IMAGE_WORKERS = int(os.getenv('IMAGE_WORKERS', os.cpu_count() or 1))
+
+# Import journal (per-item stage checkpoints, see --resume / --restart)
+JOURNAL_PATH = CACHE_DIR / 'journal.sqlite'
+
+# Run reports written at the end of fixtures.py (stage timings, counters)
+IMPORT_REPORT_PATH = Path(os.getenv('IMPORT_REPORT_PATH', CACHE_DIR / 'import-report.json'))
+IMPORT_METRICS_PATH = Path(os.getenv('IMPORT_METRICS_PATH', CACHE_DIR / 'import.prom'))  # Prometheus textfile
+
+# Content-addressed media store index (key -> hash -> file, with refcounts)
+MEDIA_INDEX_PATH = CACHE_DIR / 'media.sqlite'
+
+# Staged import pipeline (--pipeline / --workers)
+# Metadata stays at 1 worker by default: OMDb is rate limited anyway
+PIPELINE_WORKERS = {
+    'metadata': 1,
+    'audio': AUDIO_DOWNLOAD_WORKERS + AUDIO_TRANSCODE_WORKERS,
+    'image': 2,
+    'create': 1,
+}
+PIPELINE_QUEUE_SIZE = int(os.getenv('PIPELINE_QUEUE_SIZE', 8))
+
+# Metadata prefetch for the sequential import (--prefetch): items resolved
+# ahead of the one downloading (0 disables)
+METADATA_PREFETCH = int(os.getenv('METADATA_PREFETCH', 0))
+
+# Priority scheduling of items ("priority": "high" first, see scheduler.py)
+# Items read ahead to reorder: kept small so streamed catalogs stay in flat
+# memory and the first item starts at once (raise it for large catalogs)
+PRIORITY_WINDOW = int(os.getenv('PRIORITY_WINDOW', 200))
+PRIORITY_AGING = int(os.getenv('PRIORITY_AGING', 0))        # Items per priority level gained (0: no aging)
 
 def ensure_directories():
     """Ensure required directories exist."""
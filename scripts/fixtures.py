@@ -6,14 +6,27 @@ Can run all categories or specific ones via CLI.
 import argparse
 import sys
 import os
-from typing import List, Optional
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional
 from tqdm import tqdm
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from scripts.config import OMDB_API_KEY, API_BASE_URL, validate_config
+from scripts.config import (
+    OMDB_API_KEY, API_BASE_URL, AUDIO_PROFILE, AUDIO_PROFILES, IMPORT_REPORT_PATH, IMPORT_METRICS_PATH,
+    METADATA_PREFETCH, PRIORITY_AGING, PRIORITY_WINDOW,
+    validate_config
+)
 from scripts.importers.films import FilmsImporter
+from scripts.importers.pipeline import STAGES
+from scripts.utils.budget import shared_budgets
+from scripts.utils.catalog import catalog_format
+from scripts.utils.metrics import format_timings, write_json_report, write_prometheus
+from scripts.utils.ratelimit import shared_limiters
 
 
 # Map category names to importer classes
@@ -26,6 +39,60 @@ IMPORTERS = {
 }
 
 
+class CategoryOutput:
+    """
+    sys.stdout wrapper prefixing the lines printed by category threads.
+
+    Categories imported concurrently print their progress to the same
+    terminal; the prefix tells them apart, and each category's lines are
+    written whole so they do not interleave. Lines printed by other
+    threads (pipeline stage workers, main thread) are written unchanged.
+    """
+
+    def __init__(self, stream):
+        """
+        Initialize wrapper.
+
+        Args:
+            stream: Wrapped stream (sys.stdout)
+        """
+        self.stream = stream
+        self.local = threading.local()
+        self.lock = threading.Lock()
+
+    def set_prefix(self, prefix: Optional[str]):
+        """Set the prefix of the calling thread's lines (None for none)."""
+        self.flush()
+        self.local.prefix = prefix
+        self.local.pending = ''
+
+    def write(self, text: str) -> int:
+        """Write text, buffering a category thread's output to whole prefixed lines."""
+        prefix = getattr(self.local, 'prefix', None)
+        if not prefix:
+            with self.lock:
+                return self.stream.write(text)
+
+        lines = (self.local.pending + text).split('\n')
+        self.local.pending = lines.pop()
+        if lines:
+            with self.lock:
+                self.stream.write(''.join(f"{prefix}{line}\n" if line.strip() else '\n' for line in lines))
+        return len(text)
+
+    def flush(self):
+        """Write the calling thread's incomplete line, then flush the wrapped stream."""
+        pending = getattr(self.local, 'pending', '')
+        if pending:
+            self.local.pending = ''
+            with self.lock:
+                self.stream.write(f"{self.local.prefix}{pending}")
+        self.stream.flush()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.stream, name)
+
+
 def print_stats(category: str, stats: dict):
     """
     Print import statistics.
@@ -43,6 +110,23 @@ def print_stats(category: str, stats: dict):
     print(f"Skipped:     {stats['skipped']}")
     print(f"Duration:    {stats['duration']:.1f}s")
 
+    sync = stats.get('sync')
+    if sync:
+        print(
+            f"Sync:        {sync['new']} new, {sync['changed']} changed, "
+            f"{sync['unchanged']} unchanged, {sync.get('linked', 0)} linked, {sync['removed']} removed"
+        )
+
+    metrics = stats.get('metrics')
+    if metrics and metrics['timings']:
+        print("\nStage timings (p50/p95):")
+        for line in format_timings(metrics['timings']):
+            print(f"  {line}")
+    if metrics and metrics['counters']:
+        print("\nCounters:")
+        for name, value in sorted(metrics['counters'].items()):
+            print(f"  {name:<20} {value:g}")
+
     if stats['errors']:
         print(f"\nErrors ({len(stats['errors'])}):")
         for error in stats['errors'][:5]:  # Show first 5 errors
@@ -51,13 +135,58 @@ def print_stats(category: str, stats: dict):
             print(f"  ... and {len(stats['errors']) - 5} more")
 
 
+def parse_workers(values: List[str]) -> Dict[str, int]:
+    """
+    Parse --workers values into per-stage worker counts.
+
+    Args:
+        values: Items like "audio=4" (one stage) or "4" (all stages)
+
+    Returns:
+        Dictionary mapping stage name to worker count
+    """
+    workers = {}
+    for value in values:
+        stage, sep, count = value.rpartition('=')
+        stages = [stage] if sep else list(STAGES)
+        if sep and stage not in STAGES:
+            raise argparse.ArgumentTypeError(
+                f"Unknown stage '{stage}' (available: {', '.join(STAGES)})"
+            )
+        try:
+            n = int(count)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"Invalid worker count: '{value}'")
+        if n < 1:
+            raise argparse.ArgumentTypeError(f"Worker count must be at least 1: '{value}'")
+        for s in stages:
+            workers[s] = n
+    return workers
+
+
 def run_importer(
     category: str,
     api_key: Optional[str] = None,
     api_url: Optional[str] = None,
     skip_existing: bool = True,
     limit: Optional[int] = None,
-    verbose: bool = False
+    verbose: bool = False,
+    workers: Optional[Dict[str, int]] = None,
+    batch_size: Optional[int] = None,
+    async_engine: bool = False,
+    resume: bool = False,
+    restart: bool = False,
+    clip: Optional[bool] = None,
+    audio_profile: Optional[str] = None,
+    loudnorm: Optional[bool] = None,
+    catalog: Optional[str] = None,
+    sync: bool = False,
+    release_media: bool = False,
+    prefetch: Optional[int] = None,
+    priority: bool = True,
+    priority_aging: Optional[int] = None,
+    priority_window: Optional[int] = None,
+    shared_stats: bool = True
 ) -> dict:
     """
     Run a single category importer.
@@ -69,6 +198,22 @@ def run_importer(
         skip_existing: Skip existing tracks
         limit: Limit number of items
         verbose: Verbose output
+        workers: Per-stage worker counts for the pipeline (None for sequential)
+        batch_size: Tracks created per batch request (None for config default)
+        async_engine: Use the asyncio engine
+        resume: Resume from the import journal
+        restart: Clear the import journal first
+        clip: Download only the played section of each theme
+        audio_profile: Audio encoding profile (None for config default)
+        loudnorm: Normalize audio loudness (None for config default)
+        catalog: Catalog file (JSONL/NDJSON/CSV) streamed instead of the category's list
+        sync: Only import new/changed entries and delete removed ones
+        release_media: On sync, also delete the stored files of removed tracks
+        prefetch: Metadata look-ahead of the sequential import (None for config default)
+        priority: Import "priority": "high" items first
+        priority_aging: Priority aging step (None for config default, 0 disables)
+        priority_window: Items read ahead to reorder (None for config default)
+        shared_stats: Print the stats of the process-wide rate limiters
 
     Returns:
         Statistics dictionary
@@ -84,11 +229,91 @@ def run_importer(
     importer = importer_class(omdb_api_key=api_key, api_base_url=api_url)
 
     # Run import
-    stats = importer.import_all(skip_existing=skip_existing, max_items=limit)
+    stats = importer.import_all(
+        skip_existing=skip_existing, max_items=limit,
+        workers=workers, batch_size=batch_size, async_engine=async_engine,
+        resume=resume, restart=restart, clip=clip,
+        audio_profile=audio_profile, loudnorm=loudnorm, catalog=catalog,
+        sync=sync, release_media=release_media, prefetch=prefetch,
+        priority=priority, priority_aging=priority_aging, priority_window=priority_window,
+        shared_stats=shared_stats
+    )
 
     return stats
 
 
+def run_importers(
+    categories: List[str],
+    parallel: int,
+    verbose: bool = False,
+    **options
+) -> Dict[str, dict]:
+    """
+    Run several category importers concurrently.
+
+    Each category runs in its own thread with its own importer (and
+    metrics); YouTube downloads, FFmpeg encodes and upstream rate limits
+    are budgets shared by all of them (IMPORT_DOWNLOAD_SLOTS,
+    IMPORT_FFMPEG_SLOTS, OMDB_RATE_LIMIT, YOUTUBE_RATE_LIMIT). Progress
+    lines are prefixed with the category; summaries are printed once all
+    categories are done, in the given order.
+
+    Args:
+        categories: Category names
+        parallel: Categories imported at once
+        verbose: Print tracebacks of failed categories
+        **options: run_importer() arguments shared by all categories
+
+    Returns:
+        Statistics dictionary per category (failed categories left out)
+    """
+    output = CategoryOutput(sys.stdout)
+    width = max(len(category) for category in categories)
+
+    def run(category: str) -> dict:
+        output.set_prefix(f"[{category:<{width}}] ")
+        try:
+            return run_importer(category=category, verbose=verbose, shared_stats=False, **options)
+        finally:
+            output.set_prefix(None)
+
+    results: Dict[str, dict] = {}
+    errors: Dict[str, str] = {}
+    executor = ThreadPoolExecutor(max_workers=parallel, thread_name_prefix='category')
+    sys.stdout = output
+    try:
+        futures = {executor.submit(run, category): category for category in categories}
+        for future in as_completed(futures):
+            category = futures[future]
+            try:
+                results[category] = future.result()
+                print(f"[OK] {category} done")
+            except Exception as e:
+                errors[category] = f"{e}\n{traceback.format_exc()}" if verbose else str(e)
+    except KeyboardInterrupt:
+        print("\n\nImport interrupted by user (waiting for running categories, Ctrl-C again to abort)")
+        executor.shutdown(wait=False, cancel_futures=True)
+    finally:
+        sys.stdout = output.stream
+    executor.shutdown()
+
+    # Shared by all categories: printed once, not in each category's output
+    shared = [limiter.stats_line() for limiter in shared_limiters()]
+    shared += [budget.stats_line() for budget in shared_budgets()]
+    if shared:
+        print()
+        print('\n'.join(shared))
+
+    all_stats = {}
+    for category in categories:
+        if category in results:
+            all_stats[category] = results[category]
+            print_stats(category, results[category])
+        elif category in errors:
+            print(f"\n[FAIL] Error importing {category}: {errors[category]}")
+    return all_stats
+
+
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -107,6 +332,33 @@ Examples:
 
   # Force re-import existing tracks
   python scripts/fixtures.py --categories films --no-skip-existing
+
+  # Staged pipeline with 4 concurrent YouTube downloads
+  python scripts/fixtures.py --categories films --pipeline --workers audio=4
+
+  # Sequential import, metadata of the next 8 films resolved during downloads
+  python scripts/fixtures.py --categories films --prefetch 8
+
+  # Two categories at a time, sharing download/FFmpeg budgets and rate limits
+  python scripts/fixtures.py --categories films series --parallel 2
+
+  # asyncio engine (many concurrent OMDb/poster/API requests)
+  python scripts/fixtures.py --categories films --async
+
+  # Stream a large exported catalog (one {"id": ...} per line)
+  python scripts/fixtures.py --categories films --catalog export.jsonl
+
+  # Smaller, loudness-normalized audio files (Opus 64k)
+  python scripts/fixtures.py --categories films --audio-profile opus-64 --loudnorm
+
+  # Only import new/changed films and delete removed ones (by IMDb ID)
+  python scripts/fixtures.py --categories films --sync
+
+  # Resume an interrupted import without redoing finished items
+  python scripts/fixtures.py --categories films --resume
+
+  # Write the run's Prometheus metrics for node_exporter's textfile collector
+  python scripts/fixtures.py --categories films --prometheus /var/lib/node_exporter/blindtest.prom
         """
     )
 
@@ -140,6 +392,113 @@ Examples:
         action='store_true',
         help='Preview without importing (not implemented yet)'
     )
+    parser.add_argument(
+        '--catalog',
+        metavar='FILE',
+        help='Stream items from a catalog file (.jsonl/.ndjson/.csv) instead of the category list'
+    )
+    parser.add_argument(
+        '--pipeline',
+        action='store_true',
+        help='Run metadata, audio, image and create stages concurrently'
+    )
+    parser.add_argument(
+        '--workers', '-w',
+        nargs='+',
+        metavar='STAGE=N',
+        help=f'Pipeline workers per stage (stages: {", ".join(STAGES)}), implies --pipeline'
+    )
+    parser.add_argument(
+        '--async',
+        dest='async_engine',
+        action='store_true',
+        help='Run with the asyncio engine (many concurrent HTTP requests, audio in threads)'
+    )
+    parser.add_argument(
+        '--parallel', '-p',
+        type=int,
+        metavar='N',
+        help='Categories imported at once (default: all of them, 1 for one after another)'
+    )
+    parser.add_argument(
+        '--no-priority',
+        dest='priority',
+        action='store_false',
+        help='Import in list order, ignoring "priority": "high"'
+    )
+    parser.add_argument(
+        '--priority-window',
+        type=int,
+        metavar='N',
+        help=f'Items read ahead to put "priority": "high" ones first (default: {PRIORITY_WINDOW}; '
+             f'raise it for large catalogs, at the cost of memory and a later first item)'
+    )
+    parser.add_argument(
+        '--priority-aging',
+        type=int,
+        metavar='N',
+        help=f'A waiting item gains one priority level every N items read after it '
+             f'(default: {PRIORITY_AGING}, 0 disables)'
+    )
+    parser.add_argument(
+        '--prefetch',
+        type=int,
+        metavar='N',
+        help=f'Sequential import: resolve metadata of the next N items while downloading '
+             f'(default: {METADATA_PREFETCH}, 0 disables)'
+    )
+    parser.add_argument(
+        '--batch-size', '-b',
+        type=int,
+        help='Create tracks in batches of N with the batch endpoint (default: 1, no batching)'
+    )
+    parser.add_argument(
+        '--clip',
+        action='store_true',
+        default=None,
+        help='Download and encode only the played window of each theme (startTime/timeLimit)'
+    )
+    parser.add_argument(
+        '--audio-profile',
+        choices=list(AUDIO_PROFILES),
+        help=f'Audio encoding profile (default: {AUDIO_PROFILE})'
+    )
+    parser.add_argument(
+        '--loudnorm',
+        dest='loudnorm',
+        action='store_true',
+        default=None,
+        help='Normalize loudness (EBU R128, two passes) so rounds play at the same volume'
+    )
+    parser.add_argument(
+        '--no-loudnorm',
+        dest='loudnorm',
+        action='store_false',
+        default=None,
+        help='Keep the source volume, even if AUDIO_LOUDNORM is set'
+    )
+    parser.add_argument(
+        '--sync',
+        action='store_true',
+        help='Diff the list against the database by external ID (IMDb ID): import new entries, '
+             'update changed ones and delete tracks of removed ones'
+    )
+    parser.add_argument(
+        '--release-media',
+        action='store_true',
+        help='With --sync, also delete the stored audio/posters of removed tracks that no other track uses'
+    )
+    journal_group = parser.add_mutually_exclusive_group()
+    journal_group.add_argument(
+        '--resume',
+        action='store_true',
+        help='Resume an interrupted import: skip stages already recorded in the journal'
+    )
+    journal_group.add_argument(
+        '--restart',
+        action='store_true',
+        help='Clear the import journal and start from scratch'
+    )
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -150,6 +509,18 @@ Examples:
         default=API_BASE_URL,
         help=f'Override API URL (default: {API_BASE_URL})'
     )
+    parser.add_argument(
+        '--report',
+        metavar='FILE',
+        default=IMPORT_REPORT_PATH,
+        help=f'JSON report of counts, stage timings and counters (default: {IMPORT_REPORT_PATH})'
+    )
+    parser.add_argument(
+        '--prometheus',
+        metavar='FILE',
+        default=IMPORT_METRICS_PATH,
+        help=f'Prometheus textfile of the same metrics (default: {IMPORT_METRICS_PATH})'
+    )
 
     args = parser.parse_args()
 
@@ -179,9 +550,42 @@ Examples:
         print(f"Available categories: {', '.join(IMPORTERS.keys())}")
         sys.exit(1)
 
+    # A catalog holds the items of one category
+    if args.catalog:
+        if len(categories) != 1:
+            parser.error('--catalog needs exactly one category (--categories)')
+        if not os.path.isfile(args.catalog):
+            parser.error(f'Catalog not found: {args.catalog}')
+        try:
+            catalog_format(args.catalog)
+        except ValueError as e:
+            parser.error(str(e))
+
     # Handle skip_existing
     skip_existing = not args.no_skip_existing
 
+    # Pipeline workers (None keeps the sequential import)
+    workers = None
+    if args.async_engine and (args.pipeline or args.workers):
+        parser.error('--async cannot be combined with --pipeline / --workers')
+    if args.prefetch is not None and (args.async_engine or args.pipeline or args.workers):
+        parser.error('--prefetch only applies to the sequential import (not --async / --pipeline)')
+    if args.release_media and not args.sync:
+        parser.error('--release-media only applies with --sync')
+    if args.prefetch is not None and args.prefetch < 0:
+        parser.error('--prefetch must be 0 or more')
+    if args.parallel is not None and args.parallel < 1:
+        parser.error('--parallel must be at least 1')
+    if args.priority_window is not None and args.priority_window < 1:
+        parser.error('--priority-window must be at least 1')
+    if args.priority_aging is not None and args.priority_aging < 0:
+        parser.error('--priority-aging must be 0 or more')
+    if args.pipeline or args.workers:
+        try:
+            workers = parse_workers(args.workers or [])
+        except argparse.ArgumentTypeError as e:
+            parser.error(str(e))
+
     # Dry run
     if args.dry_run:
         print("DRY RUN MODE - No files will be downloaded or created")
@@ -195,22 +599,42 @@ Examples:
     print(f"Starting import for: {', '.join(categories)}")
     print()
 
+    options = dict(
+        api_key=api_key,
+        api_url=args.api_url,
+        skip_existing=skip_existing,
+        limit=args.limit,
+        workers=workers,
+        batch_size=args.batch_size,
+        async_engine=args.async_engine,
+        resume=args.resume,
+        restart=args.restart,
+        clip=args.clip,
+        audio_profile=args.audio_profile,
+        loudnorm=args.loudnorm,
+        catalog=args.catalog,
+        sync=args.sync,
+        release_media=args.release_media,
+        prefetch=args.prefetch,
+        priority=args.priority,
+        priority_aging=args.priority_aging,
+        priority_window=args.priority_window
+    )
+    parallel = min(args.parallel or len(categories), len(categories))
+
     all_stats = {}
+    start_time = time.time()
 
-    for category in categories:
+    if parallel > 1:
+        all_stats = run_importers(categories, parallel, verbose=args.verbose, **options)
+
+    for category in (categories if parallel == 1 else []):
         print(f"\n{'=' * 60}")
         print(f"Category: {category.upper()}")
         print('=' * 60)
 
         try:
-            stats = run_importer(
-                category=category,
-                api_key=api_key,
-                api_url=args.api_url,
-                skip_existing=skip_existing,
-                limit=args.limit,
-                verbose=args.verbose
-            )
+            stats = run_importer(category=category, verbose=args.verbose, **options)
 
             all_stats[category] = stats
             print_stats(category, stats)
@@ -221,7 +645,6 @@ Examples:
         except Exception as e:
             print(f"\n[FAIL] Error importing {category}: {e}")
             if args.verbose:
-                import traceback
                 traceback.print_exc()
 
     # Print overall summary
@@ -234,7 +657,8 @@ Examples:
         total_success = sum(s['successful'] for s in all_stats.values())
         total_failed = sum(s['failed'] for s in all_stats.values())
         total_skipped = sum(s['skipped'] for s in all_stats.values())
-        total_duration = sum(s['duration'] for s in all_stats.values())
+        # Wall-clock time: categories may have run at the same time
+        total_duration = time.time() - start_time
 
         print(f"Total items:     {total_items}")
         print(f"Successful:      {total_success}")
@@ -242,6 +666,12 @@ Examples:
         print(f"Skipped:         {total_skipped}")
         print(f"Total duration:  {total_duration:.1f}s")
 
+    if all_stats:
+        write_json_report(args.report, all_stats)
+        write_prometheus(args.prometheus, all_stats)
+        print(f"\nReport: {args.report}")
+        print(f"Metrics: {args.prometheus}")
+
     print("\n[OK] Import completed!")
 
 
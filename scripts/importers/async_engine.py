@@ -0,0 +1,174 @@
+"""
+asyncio import engine.
+Runs metadata lookups, poster downloads and track creation as coroutines
+over one pooled aiohttp session, and hands yt-dlp/ffmpeg work to the downloader pools.
+"""
+
+import asyncio
+import inspect
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Any
+
+try:
+    from scripts.config import ASYNC_MAX_IN_FLIGHT, ASYNC_PER_HOST_LIMIT, ASYNC_BLOCKING_WORKERS, HTTP_TIMEOUT
+    from scripts.importers.scheduler import is_high_priority
+except ImportError:
+    from ..config import ASYNC_MAX_IN_FLIGHT, ASYNC_PER_HOST_LIMIT, ASYNC_BLOCKING_WORKERS, HTTP_TIMEOUT
+    from .scheduler import is_high_priority
+
+
+async def _resolved(value):
+    """Await value if it is awaitable, otherwise return it as is."""
+    return await value if inspect.isawaitable(value) else value
+
+
+class AsyncImportEngine:
+    """Imports a BaseImporter's items with many I/O operations in flight."""
+
+    def __init__(
+        self,
+        importer,
+        max_in_flight: int = ASYNC_MAX_IN_FLIGHT,
+        per_host_limit: int = ASYNC_PER_HOST_LIMIT,
+        blocking_workers: int = ASYNC_BLOCKING_WORKERS
+    ):
+        """
+        Initialize engine.
+
+        Args:
+            importer: BaseImporter instance
+            max_in_flight: Max items being processed at the same time
+            per_host_limit: Max open connections per host (OMDb, posters, API)
+            blocking_workers: Threads for blocking work (existence checks,
+                batched track creation, sync updates)
+        """
+        self.importer = importer
+        self.max_in_flight = max_in_flight
+        self.per_host_limit = per_host_limit
+        self.blocking_workers = blocking_workers
+        self.completed = 0
+
+    async def _run_job(self, job: Dict[str, Any], session, executor, skip_existing: bool) -> List[Dict[str, Any]]:
+        """
+        Run all stages for one job.
+
+        Args:
+            job: Job dictionary with 'item' and 'item_id' keys
+            session: aiohttp.ClientSession
+            executor: Executor for blocking work
+            skip_existing: Skip if track already exists
+
+        Returns:
+            Jobs finished by this call (see BaseImporter.stage_create)
+        """
+        importer = self.importer
+        loop = asyncio.get_running_loop()
+
+        if importer.resume_job(job):
+            return [job]
+
+        metadata = job.get('metadata')
+        if not metadata:
+            with importer.metrics.timer('metadata'):
+                metadata = await importer.fetch_metadata_async(job['item'], session)
+            if not metadata:
+                job['result'] = {'status': 'failed', 'error': 'Failed to fetch metadata'}
+                return [job]
+
+            job['metadata'] = metadata
+
+            # Usually a local lookup, but may call the API (title index loaded
+            # on first lookup of a sync run, legacy tracks linked): off the loop
+            if await loop.run_in_executor(executor, importer.skip_existing_track, job, skip_existing):
+                job['result'] = {'status': 'skipped', 'reason': 'already exists'}
+                importer.journal_update(job, metadata=metadata, status='skipped')
+                return [job]
+
+            importer.journal_update(job, metadata=metadata)
+
+        # Audio (yt-dlp threads + ffmpeg processes) and poster (async HTTP) run side by side
+        audio = job.get('audio_path') or asyncio.wrap_future(importer.submit_audio(metadata))
+        image = job.get('image_path') or importer.download_poster_async(metadata, session)
+        job['audio_path'], job['image_path'] = await asyncio.gather(_resolved(audio), _resolved(image))
+        importer.journal_update(
+            job, audio_path=job['audio_path'], audio_key=importer.audio_settings(metadata),
+            image_path=job['image_path']
+        )
+
+        # Batched creation and sync updates go through the importer
+        # (high-priority items are created right away, see stage_create)
+        batched = importer.batch_size > 1 and not is_high_priority(job['item'])
+        if batched or importer.sync_target(job) is not None:
+            return await loop.run_in_executor(executor, importer.stage_create, job)
+
+        track_data = importer.build_track_data(metadata, job['audio_path'], job['image_path'], job['item'])
+        if not track_data:
+            job['result'] = {'status': 'failed', 'error': 'Failed to create track'}
+            return [job]
+
+        with importer.metrics.timer('create'):
+            track = await importer.api_client.create_track_async(session, track_data)
+        if track:
+            print(f"  [OK] {job['item_id']}: track created with ID: {track.get('id')}")
+        importer.finish_job(job, track)
+        return [job]
+
+    async def _import_item(self, job: Dict[str, Any], session, executor, stats: Dict[str, Any], skip_existing: bool):
+        """Run one job and record the jobs it finished."""
+        try:
+            finished = await self._run_job(job, session, executor, skip_existing)
+        except Exception as e:
+            print(f"  [FAIL] {job['item_id']}: {e}")
+            job['result'] = {'status': 'failed', 'error': str(e), 'traceback': traceback.format_exc()}
+            finished = [job]
+
+        self._record(finished, stats)
+
+    def _record(self, jobs: List[Dict[str, Any]], stats: Dict[str, Any]):
+        """Add finished jobs to the statistics (event loop thread only)."""
+        for job in jobs:
+            self.importer.record_result(stats, job['item_id'], job['result'])
+            self.completed += 1
+            print(f"[{self.completed}/{stats['total']}] {job['item_id']}: {job['result']['status']}")
+
+    async def _run(self, media_list: Iterable[Dict[str, Any]], stats: Dict[str, Any], skip_existing: bool):
+        """Import all items inside the event loop."""
+        import aiohttp
+
+        connector = aiohttp.TCPConnector(limit=0, limit_per_host=self.per_host_limit)
+        timeout = aiohttp.ClientTimeout(total=HTTP_TIMEOUT)
+        slots = asyncio.Semaphore(self.max_in_flight)
+        tasks = set()
+
+        with ThreadPoolExecutor(max_workers=self.blocking_workers, thread_name_prefix='blocking') as executor:
+            async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+                for i, item in enumerate(media_list, 1):
+                    # Only start a new item when one of the slots is free
+                    await slots.acquire()
+                    job = {'item': item, 'item_id': item.get('id', item.get('title', f'item_{i}'))}
+                    task = asyncio.create_task(self._import_item(job, session, executor, stats, skip_existing))
+                    task.add_done_callback(lambda t: slots.release())
+                    task.add_done_callback(tasks.discard)
+                    tasks.add(task)
+
+                await asyncio.gather(*tasks)
+
+            # Tracks still buffered for a batch create
+            self._record(await asyncio.get_running_loop().run_in_executor(executor, self.importer.flush_tracks), stats)
+
+    def run(self, media_list: Iterable[Dict[str, Any]], stats: Dict[str, Any], skip_existing: bool = True):
+        """
+        Import all items.
+
+        Args:
+            media_list: Items to import (list or lazy iterator)
+            stats: Statistics dictionary (updated in place)
+            skip_existing: Skip tracks that already exist
+        """
+        print(
+            f"Async engine: {self.max_in_flight} items in flight, "
+            f"{self.per_host_limit} connections per host"
+        )
+        self.completed = 0
+        asyncio.run(self._run(media_list, stats, skip_existing))
@@ -3,27 +3,58 @@ Abstract base class for category-specific importers.
 Provides common functionality and enforces interface.
 """
 
+import asyncio
+import hashlib
+import json
+import threading
 import time
+import uuid
 import traceback
+from concurrent.futures import Future
 from abc import ABC, abstractmethod
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 from slugify import slugify
 
 try:
-    from scripts.config import DEFAULT_TIME_LIMIT, DEFAULT_START_TIME, IMAGES_DIR
+    from scripts.config import (
+        DEFAULT_TIME_LIMIT, DEFAULT_START_TIME, AUDIO_DIR, IMAGES_DIR, IMPORT_BATCH_SIZE,
+        AUDIO_CLIP_MODE, CLIP_MARGIN, IMAGE_PROCESSING, METADATA_PREFETCH, PRIORITY_WINDOW, PRIORITY_AGING
+    )
     from scripts.utils.api_client import TrackAPIClient
     from scripts.utils.omdb import OMDbClient
     from scripts.utils.youtube import YouTubeDownloader
-    from scripts.utils.answers import generate_accepted_answers
-    from scripts.utils.files import download_image
+    from scripts.utils.answers import generate_accepted_answers, build_match_index
+    from scripts.utils.files import download_image, download_image_async, media_file_path
+    from scripts.utils.journal import ImportJournal
+    from scripts.utils.media_store import MediaStore, release_track_media
+    from scripts.utils.images import PosterProcessor
+    from scripts.utils.catalog import iter_catalog, count_catalog
+    from scripts.utils.metrics import Metrics
+    from scripts.importers.pipeline import ImportPipeline
+    from scripts.importers.async_engine import AsyncImportEngine
+    from scripts.importers.prefetch import MetadataPrefetcher
+    from scripts.importers.scheduler import PriorityScheduler, is_high_priority
 except ImportError:
-    from ..config import DEFAULT_TIME_LIMIT, DEFAULT_START_TIME, IMAGES_DIR
+    from ..config import (
+        DEFAULT_TIME_LIMIT, DEFAULT_START_TIME, AUDIO_DIR, IMAGES_DIR, IMPORT_BATCH_SIZE,
+        AUDIO_CLIP_MODE, CLIP_MARGIN, IMAGE_PROCESSING, METADATA_PREFETCH, PRIORITY_WINDOW, PRIORITY_AGING
+    )
     from ..utils.api_client import TrackAPIClient
     from ..utils.omdb import OMDbClient
     from ..utils.youtube import YouTubeDownloader
-    from ..utils.answers import generate_accepted_answers
-    from ..utils.files import download_image
+    from ..utils.answers import generate_accepted_answers, build_match_index
+    from ..utils.files import download_image, download_image_async, media_file_path
+    from ..utils.journal import ImportJournal
+    from ..utils.media_store import MediaStore, release_track_media
+    from ..utils.images import PosterProcessor
+    from ..utils.catalog import iter_catalog, count_catalog
+    from ..utils.metrics import Metrics
+    from .pipeline import ImportPipeline
+    from .async_engine import AsyncImportEngine
+    from .prefetch import MetadataPrefetcher
+    from .scheduler import PriorityScheduler, is_high_priority
 
 
 class BaseImporter(ABC):
@@ -39,9 +70,44 @@ class BaseImporter(ABC):
             api_base_url: API base URL (optional)
         """
         self.category_id = category_id
-        self.api_client = TrackAPIClient(api_base_url)
-        self.omdb_client = OMDbClient(omdb_api_key) if omdb_api_key else None
-        self.youtube_dl = YouTubeDownloader()
+
+        # Stage timings and counters of the current run, shared with the clients
+        self.metrics = Metrics()
+
+        self.api_client = TrackAPIClient(api_base_url, metrics=self.metrics)
+        self.omdb_client = OMDbClient(omdb_api_key, metrics=self.metrics) if omdb_api_key else None
+        self.youtube_dl = YouTubeDownloader(metrics=self.metrics)
+
+        # Content-addressed storage for downloaded files (see media_key)
+        self.audio_store = MediaStore('audio', AUDIO_DIR)
+        self.image_store = MediaStore('images', IMAGES_DIR)
+
+        # Resized/WebP poster variants, generated in background processes
+        self.poster_processor = PosterProcessor(IMAGES_DIR) if IMAGE_PROCESSING else None
+
+        # Jobs waiting for a batch create (see stage_create / flush_tracks)
+        self.batch_size = IMPORT_BATCH_SIZE
+        self._pending_tracks: List[Dict[str, Any]] = []
+        self._pending_lock = threading.Lock()
+
+        # Download only the played section of each theme (see clip_window)
+        self.clip_mode = AUDIO_CLIP_MODE
+
+        # Stage checkpoints (set up by import_all, see resume_job)
+        self.journal: Optional[ImportJournal] = None
+        self.resume = False
+
+        # Streamed catalog file replacing get_media_list() (see media_source)
+        self.catalog: Optional[Path] = None
+
+        # Delta sync state (set up by import_all, see sync_items)
+        self.sync = False
+        self._sync_tracks: Dict[str, Dict[str, Any]] = {}
+        self._sync_updates: Dict[str, int] = {}
+        self._sync_seen: set = set()
+        self._sync_linked: set = set()
+        self._sync_counts: Dict[str, int] = {}
+        self._sync_lock = threading.Lock()
 
     @abstractmethod
     def get_media_list(self) -> List[Dict[str, Any]]:
@@ -53,6 +119,22 @@ class BaseImporter(ABC):
         """
         pass
 
+    def media_source(self) -> Tuple[int, Iterator[Dict[str, Any]]]:
+        """
+        Get the items to import.
+
+        A catalog file (JSON Lines or CSV) is read lazily, one item at a
+        time; otherwise get_media_list() is used.
+
+        Returns:
+            Tuple of (item count, item iterator)
+        """
+        if self.catalog:
+            return count_catalog(self.catalog), iter_catalog(self.catalog)
+
+        media_list = self.get_media_list()
+        return len(media_list), iter(media_list)
+
     @abstractmethod
     def build_search_query(self, metadata: Dict[str, Any]) -> str:
         """
@@ -83,6 +165,23 @@ class BaseImporter(ABC):
         """
         pass
 
+    async def fetch_metadata_async(self, item: Dict[str, Any], session) -> Optional[Dict[str, Any]]:
+        """
+        Fetch metadata for a media item from a coroutine.
+
+        Runs fetch_metadata() in the default executor; importers with an
+        async-capable client should override this.
+
+        Args:
+            item: Item from get_media_list()
+            session: aiohttp.ClientSession shared by the async engine
+
+        Returns:
+            Same as fetch_metadata()
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.fetch_metadata, item)
+
     def generate_slug(self, title: str) -> str:
         """
         Generate slug from title for filenames.
@@ -95,6 +194,253 @@ class BaseImporter(ABC):
         """
         return slugify(title, separator='-', lowercase=True)
 
+    def external_id(self, item: Dict[str, Any]) -> Optional[str]:
+        """
+        Get the catalog key of an item, stored with its track.
+
+        Args:
+            item: Item dictionary from the catalog
+
+        Returns:
+            The item's 'id' (the IMDb ID for films), or None without one
+        """
+        item_id = item.get('id')
+        return str(item_id) if item_id not in (None, '') else None
+
+    def source_hash(self, item: Dict[str, Any]) -> str:
+        """
+        Fingerprint a catalog item, to detect changed entries on sync.
+
+        Scheduling fields ("priority") are left out: they do not change the track.
+
+        Args:
+            item: Item dictionary from the catalog
+
+        Returns:
+            Short hex digest of the item's canonical JSON
+        """
+        fields = {key: value for key, value in item.items() if key != 'priority'}
+        canonical = json.dumps(fields, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+        return hashlib.sha1(canonical.encode('utf-8')).hexdigest()[:16]
+
+    def media_key(self, metadata: Dict[str, Any]) -> str:
+        """
+        Build the media store key for an item.
+
+        Uses the external ID when available, so remakes sharing a title
+        do not share files.
+
+        Args:
+            metadata: Metadata dictionary
+
+        Returns:
+            Key like "films:tt0111161" or "films:the-shawshank-redemption-1994"
+        """
+        external_id = metadata.get('imdb_id')
+        if external_id:
+            key = f"{self.category_id}:{external_id}"
+        else:
+            key = f"{self.category_id}:{self.generate_slug(metadata['title'])}-{metadata.get('year') or ''}"
+        return key
+
+    def audio_key(self, metadata: Dict[str, Any]) -> str:
+        """
+        Build the audio store key for an item.
+
+        A clip or another encoding profile is a different file than the
+        full theme, so both are part of the key.
+
+        Args:
+            metadata: Metadata dictionary
+
+        Returns:
+            Key like "films:tt0111161#mp3-192" or "films:tt0111161@58-92#opus-64"
+        """
+        key = self.media_key(metadata)
+        clip = self.clip_window(metadata)
+        if clip:
+            key += f"@{clip[0]}-{clip[1]}"
+        return f"{key}#{self.youtube_dl.profile_name}"
+
+    def audio_settings(self, metadata: Dict[str, Any]) -> str:
+        """
+        Describe the settings an item's audio is encoded with.
+
+        Stored in the journal next to audio_path: a resumed import only
+        reuses the file if profile, clip and loudness normalization match.
+
+        Args:
+            metadata: Metadata dictionary
+
+        Returns:
+            audio_key() with "+loudnorm" appended when normalization is on
+        """
+        key = self.audio_key(metadata)
+        return f"{key}+loudnorm" if self.youtube_dl.loudnorm else key
+
+    def clip_window(self, metadata: Dict[str, Any]) -> Optional[Tuple[int, int]]:
+        """
+        Get the audio section to download in clip mode.
+
+        Covers the played window (startTime, startTime + timeLimit) plus
+        CLIP_MARGIN seconds on each side.
+
+        Args:
+            metadata: Metadata dictionary
+
+        Returns:
+            (start, end) in seconds, or None when clip mode is off
+        """
+        if not self.clip_mode:
+            return None
+
+        start = metadata.get('startTime', DEFAULT_START_TIME)
+        time_limit = metadata.get('timeLimit', DEFAULT_TIME_LIMIT)
+        return max(0, start - CLIP_MARGIN), start + time_limit + CLIP_MARGIN
+
+    def staging_name(self, metadata: Dict[str, Any]) -> str:
+        """
+        Build a unique temporary filename for a download.
+
+        Args:
+            metadata: Metadata dictionary
+
+        Returns:
+            Filename without extension (and without dots, which yt-dlp
+            treats as one), moved into the media store once complete
+        """
+        return f"{self.generate_slug(metadata['title'])}-staging-{uuid.uuid4().hex[:8]}"
+
+    def _store_media(self, store: MediaStore, key: str, path: Optional[str]) -> Optional[str]:
+        """Move a downloaded file into a media store, returning its public path."""
+        if not path:
+            return None
+
+        # Encode settings and loudness written by the downloader
+        source = media_file_path(path)
+        sidecar = source.with_name(source.name + '.json')
+        info = None
+        if sidecar.exists():
+            info = json.loads(sidecar.read_text(encoding='utf-8'))
+            sidecar.unlink()
+
+        self.metrics.inc(f"{store.kind}_bytes", source.stat().st_size)
+        return store.ingest(key, source, info)
+
+    def _process_poster(self, path: Optional[str]) -> Optional[str]:
+        """Queue a stored poster's variants (without waiting), returning its path."""
+        if path and self.poster_processor:
+            self.poster_processor.submit(path)
+        return path
+
+    def download_audio(self, metadata: Dict[str, Any]) -> Optional[str]:
+        """
+        Search and download the theme audio for a media item.
+
+        Args:
+            metadata: Metadata dictionary
+
+        Returns:
+            Relative path to audio file or None on failure
+        """
+        key = self.audio_key(metadata)
+        stored = self.audio_store.lookup(key)
+        if stored:
+            print(f"  -> Audio already stored: {stored}")
+            self.metrics.inc('audio_store_hits')
+            return stored
+
+        search_query = self.build_search_query(metadata)
+        with self.metrics.timer('audio'):
+            path = self.youtube_dl.download_audio(search_query, self.staging_name(metadata), self.clip_window(metadata))
+        return self._store_media(self.audio_store, key, path)
+
+    def submit_audio(self, metadata: Dict[str, Any]) -> Future:
+        """
+        Queue the theme audio download on the downloader's pools.
+
+        Args:
+            metadata: Metadata dictionary
+
+        Returns:
+            Future resolving to the relative audio path or None on failure
+        """
+        key = self.audio_key(metadata)
+        result: Future = Future()
+
+        stored = self.audio_store.lookup(key)
+        if stored:
+            print(f"  -> Audio already stored: {stored}")
+            self.metrics.inc('audio_store_hits')
+            result.set_result(stored)
+            return result
+
+        submitted = time.perf_counter()
+
+        def on_downloaded(download: Future):
+            self.metrics.observe('audio', time.perf_counter() - submitted)
+            try:
+                result.set_result(self._store_media(self.audio_store, key, download.result()))
+            except Exception as e:
+                result.set_exception(e)
+
+        search_query = self.build_search_query(metadata)
+        self.youtube_dl.submit_audio(
+            search_query, self.staging_name(metadata), clip=self.clip_window(metadata)
+        ).add_done_callback(on_downloaded)
+        return result
+
+    def download_poster(self, metadata: Dict[str, Any]) -> Optional[str]:
+        """
+        Download the poster image for a media item.
+
+        Args:
+            metadata: Metadata dictionary
+
+        Returns:
+            Relative path to image file or None if unavailable
+        """
+        if not metadata.get('poster_url'):
+            return None
+
+        key = self.media_key(metadata)
+        stored = self.image_store.lookup(key)
+        if stored:
+            print(f"  -> Image already stored: {stored}")
+            self.metrics.inc('image_store_hits')
+            return self._process_poster(stored)
+
+        image_output = IMAGES_DIR / f"{self.staging_name(metadata)}.jpg"
+        with self.metrics.timer('image'):
+            path = download_image(metadata['poster_url'], image_output)
+        return self._process_poster(self._store_media(self.image_store, key, path))
+
+    async def download_poster_async(self, metadata: Dict[str, Any], session) -> Optional[str]:
+        """
+        Download the poster image for a media item from a coroutine.
+
+        Args:
+            metadata: Metadata dictionary
+            session: aiohttp.ClientSession shared by the async engine
+
+        Returns:
+            Relative path to image file or None if unavailable
+        """
+        if not metadata.get('poster_url'):
+            return None
+
+        key = self.media_key(metadata)
+        stored = self.image_store.lookup(key)
+        if stored:
+            print(f"  -> Image already stored: {stored}")
+            self.metrics.inc('image_store_hits')
+            return self._process_poster(stored)
+
+        image_output = IMAGES_DIR / f"{self.staging_name(metadata)}.jpg"
+        with self.metrics.timer('image'):
+            path = await download_image_async(session, metadata['poster_url'], image_output)
+        return self._process_poster(self._store_media(self.image_store, key, path))
+
     def download_media(self, metadata: Dict[str, Any]) -> tuple[Optional[str], Optional[str]]:
         """
         Download audio and image for a media item.
@@ -105,53 +451,59 @@ class BaseImporter(ABC):
         Returns:
             Tuple of (audio_path, image_path), either can be None on failure
         """
-        title = metadata['title']
-        slug = self.generate_slug(title)
-
-        # Download audio
         print(f"  Downloading audio...")
-        search_query = self.build_search_query(metadata)
-        audio_path = self.youtube_dl.download_audio(search_query, slug)
+        audio_path = self.download_audio(metadata)
 
-        # Download image
         print(f"  Downloading image...")
-        image_path = None
-        if metadata.get('poster_url'):
-            image_filename = f"{slug}.jpg"
-            image_output = IMAGES_DIR / image_filename
-            image_path = download_image(metadata['poster_url'], image_output)
+        image_path = self.download_poster(metadata)
 
         return audio_path, image_path
 
-    def create_track(self, metadata: Dict[str, Any], audio_path: Optional[str], image_path: Optional[str]) -> bool:
+    def build_track_data(
+        self,
+        metadata: Dict[str, Any],
+        audio_path: Optional[str],
+        image_path: Optional[str],
+        item: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
         """
-        Create track via API.
+        Build the API payload for a track.
 
         Args:
             metadata: Media metadata
             audio_path: Relative path to audio file
             image_path: Relative path to image file
+            item: Catalog item, recorded as the track's external ID and
+                source hash (see sync_items)
 
         Returns:
-            True if created successfully, False otherwise
+            Track data dictionary, or None if the track cannot be created
         """
         if not audio_path:
             print(f"  [FAIL] Cannot create track without audio file")
-            return False
+            return None
 
         # Generate accepted answers
         title = metadata['title']
         title_vf = metadata.get('titleVF')
         accepted_answers = generate_accepted_answers(title, title_vf)
 
+        # Clips start CLIP_MARGIN seconds before the played window
+        start_time = metadata.get('startTime', DEFAULT_START_TIME)
+        clip = self.clip_window(metadata)
+        if clip:
+            start_time -= clip[0]
+
         # Build track data
         track_data = {
             'title': title,
             'acceptedAnswers': accepted_answers,
+            # Pre-normalized answers and trigram index for server.js
+            'matchIndex': build_match_index(accepted_answers),
             'audioFile': audio_path,
             'categoryId': self.category_id,
-            'timeLimit': DEFAULT_TIME_LIMIT,
-            'startTime': DEFAULT_START_TIME,
+            'timeLimit': metadata.get('timeLimit', DEFAULT_TIME_LIMIT),
+            'startTime': start_time,
         }
 
         # Add optional fields
@@ -159,22 +511,309 @@ class BaseImporter(ABC):
             track_data['titleVF'] = title_vf
         if image_path:
             track_data['imageFile'] = image_path
+        if item is not None and self.external_id(item):
+            track_data['externalId'] = self.external_id(item)
+            track_data['sourceHash'] = self.source_hash(item)
+
+        return track_data
+
+    def create_track(self, metadata: Dict[str, Any], audio_path: Optional[str], image_path: Optional[str]) -> bool:
+        """
+        Create track via API.
+
+        Args:
+            metadata: Media metadata
+            audio_path: Relative path to audio file
+            image_path: Relative path to image file
 
-        # Create via API
+        Returns:
+            True if created successfully, False otherwise
+        """
+        track_data = self.build_track_data(metadata, audio_path, image_path)
+        if not track_data:
+            return False
+
+        return self._post_track(track_data) is not None
+
+    def _post_track(self, track_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Create a track from its payload via API.
+
+        Args:
+            track_data: Track data from build_track_data()
+
+        Returns:
+            Created track dictionary, or None on failure
+        """
         print(f"  Creating track in database...")
-        result = self.api_client.create_track(track_data)
+        with self.metrics.timer('create'):
+            result = self.api_client.create_track(track_data)
 
         if result:
             print(f"  [OK] Track created with ID: {result.get('id')}")
-            return True
         else:
             print(f"  [FAIL] Failed to create track")
+        return result
+
+    def _put_track(self, track_id: int, track_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Replace a track's data with a new payload via API.
+
+        Args:
+            track_id: ID of the track to update
+            track_data: Track data from build_track_data()
+
+        Returns:
+            Updated track dictionary, or None on failure
+        """
+        print(f"  Updating track #{track_id} in database...")
+        with self.metrics.timer('update'):
+            result = self.api_client.update_track(track_id, track_data)
+
+        if result:
+            print(f"  [OK] Track #{track_id} updated")
+        else:
+            print(f"  [FAIL] Failed to update track #{track_id}")
+        return result
+
+    def finish_job(self, job: Dict[str, Any], track: Optional[Dict[str, Any]], error: str = 'Failed to create track'):
+        """
+        Set a job's result from its track creation and journal it.
+
+        Args:
+            job: Job dictionary
+            track: Created track dictionary, or None on failure
+            error: Error message used on failure
+        """
+        if track:
+            job['result'] = {'status': 'success'}
+            self.journal_update(job, track_id=track.get('id'), status='done')
+        else:
+            job['result'] = {'status': 'failed', 'error': error}
+
+    def flush_tracks(self) -> List[Dict[str, Any]]:
+        """
+        Create all buffered tracks with the batch endpoint.
+
+        Returns:
+            The flushed jobs, each with its 'result' set
+        """
+        with self._pending_lock:
+            jobs, self._pending_tracks = self._pending_tracks, []
+
+        if not jobs:
+            return []
+
+        print(f"  Creating {len(jobs)} tracks in database (batch)...")
+        with self.metrics.timer('create_batch'):
+            results = self.api_client.create_tracks_batch([job['track_data'] for job in jobs])
+
+        for job, result in zip(jobs, results):
+            self.finish_job(job, result.get('track'), f"Failed to create track: {result.get('error')}")
+
+        created = sum(1 for job in jobs if job['result']['status'] == 'success')
+        print(f"  [OK] Batch created {created}/{len(jobs)} tracks")
+        return jobs
+
+    def journal_update(self, job: Dict[str, Any], **fields):
+        """
+        Record completed stages of a job in the import journal.
+
+        Args:
+            job: Job dictionary with an 'item_id' key
+            **fields: Journal fields (see ImportJournal.FIELDS)
+        """
+        if self.journal:
+            self.journal.update(self.category_id, job['item_id'], **fields)
+
+    def resume_job(self, job: Dict[str, Any]) -> bool:
+        """
+        Fill a job with the stages already completed in the journal.
+
+        Only used with resume enabled. Audio and image paths are reused
+        only if the file is still on disk, and audio only if it was
+        encoded with the current settings (see audio_settings).
+
+        Args:
+            job: Job dictionary with an 'item_id' key
+
+        Returns:
+            True if the item is already finished (job['result'] is set)
+        """
+        if not (self.journal and self.resume):
+            return False
+
+        entry = self.journal.get(self.category_id, job['item_id'])
+        if not entry:
             return False
 
+        if entry['status'] in ('done', 'skipped'):
+            print("  -> Already imported (journal), skipped")
+            job['result'] = {'status': 'skipped', 'reason': 'journal'}
+            return True
+
+        if entry['metadata']:
+            job['metadata'] = entry['metadata']
+        for key in ('audio_path', 'image_path'):
+            if entry[key] and media_file_path(entry[key]).exists():
+                job[key] = entry[key]
+
+        if job.get('audio_path') and entry['audio_key'] != self.audio_settings(job['metadata']):
+            print("  -> Journal audio encoded with other settings, downloading again")
+            del job['audio_path']
+
+        return False
+
+    def stage_metadata(self, job: Dict[str, Any], skip_existing: bool = True):
+        """
+        Pipeline stage: resolve metadata and check for an existing track.
+
+        Sets job['metadata'], or job['result'] when the item stops here.
+        With resume enabled, stages found in the journal are reused.
+        Metadata already resolved by a MetadataPrefetcher ('prefetched' or
+        'prefetch_error') is used instead of fetching it.
+
+        Args:
+            job: Job dictionary with 'item' and 'item_id' keys
+            skip_existing: Skip if track already exists
+        """
+        if self.resume_job(job) or 'metadata' in job:
+            return
+
+        if 'prefetch_error' in job:
+            job['result'] = {'status': 'failed', **job.pop('prefetch_error')}
+            print(f"  [FAIL] Error: {job['result']['error']}")
+            return
+        if 'prefetched' in job:
+            metadata = job.pop('prefetched')
+        else:
+            with self.metrics.timer('metadata'):
+                metadata = self.fetch_metadata(job['item'])
+
+        if not metadata:
+            job['result'] = {'status': 'failed', 'error': 'Failed to fetch metadata'}
+            return
+
+        job['metadata'] = metadata
+        print(f"  Title: {metadata['title']}")
+
+        if self.skip_existing_track(job, skip_existing):
+            print("  -> Already exists, skipped")
+            job['result'] = {'status': 'skipped', 'reason': 'already exists'}
+            self.journal_update(job, metadata=metadata, status='skipped')
+        else:
+            self.journal_update(job, metadata=metadata)
+
+    def stage_audio(self, job: Dict[str, Any], pooled: bool = False):
+        """
+        Pipeline stage: download audio into job['audio_path'].
+
+        Args:
+            job: Job dictionary with a 'metadata' key
+            pooled: Use the downloader's thread/process pools (submit_audio)
+        """
+        if job.get('audio_path'):
+            return
+
+        if pooled:
+            job['audio_path'] = self.submit_audio(job['metadata']).result()
+        else:
+            job['audio_path'] = self.download_audio(job['metadata'])
+
+        if job['audio_path']:
+            self.journal_update(job, audio_path=job['audio_path'], audio_key=self.audio_settings(job['metadata']))
+
+    def stage_image(self, job: Dict[str, Any]):
+        """
+        Pipeline stage: download poster into job['image_path'].
+
+        Args:
+            job: Job dictionary with a 'metadata' key
+        """
+        if job.get('image_path'):
+            return
+
+        job['image_path'] = self.download_poster(job['metadata'])
+
+        if job['image_path']:
+            self.journal_update(job, image_path=job['image_path'])
+
+    def stage_create(self, job: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Pipeline stage: create the track and set job['result'].
+
+        A changed entry of a sync run updates its existing track instead.
+        With batching enabled (batch_size > 1) the track is buffered and
+        its job is returned by a later call or by flush_tracks(), except
+        for high-priority items, created right away so they are playable
+        before the rest of the import completes.
+
+        Args:
+            job: Job dictionary with 'metadata', 'audio_path' and 'image_path' keys
+
+        Returns:
+            Jobs finished by this call, each with its 'result' set
+        """
+        track_data = self.build_track_data(job['metadata'], job.get('audio_path'), job.get('image_path'), job['item'])
+        if not track_data:
+            job['result'] = {'status': 'failed', 'error': 'Failed to create track'}
+            return [job]
+
+        # Changed catalog entries replace their track in place (never batched)
+        track_id = self.sync_target(job)
+        if track_id is not None:
+            self.finish_job(job, self._put_track(track_id, track_data), 'Failed to update track')
+            return [job]
+
+        if self.batch_size <= 1 or is_high_priority(job['item']):
+            self.finish_job(job, self._post_track(track_data))
+            return [job]
+
+        job['track_data'] = track_data
+        with self._pending_lock:
+            self._pending_tracks.append(job)
+            batch_full = len(self._pending_tracks) >= self.batch_size
+
+        return self.flush_tracks() if batch_full else []
+
+    def import_job(self, job: Dict[str, Any], skip_existing: bool = True) -> List[Dict[str, Any]]:
+        """
+        Run all stages for one job, one after the other.
+
+        Args:
+            job: Job dictionary with 'item' and 'item_id' keys
+            skip_existing: Skip if track already exists
+
+        Returns:
+            Jobs finished by this call (see stage_create)
+        """
+        try:
+            print(f"  Fetching metadata...")
+            self.stage_metadata(job, skip_existing)
+            if 'result' in job:
+                return [job]
+
+            print("  Downloading audio...")
+            self.stage_audio(job)
+
+            print("  Downloading image...")
+            self.stage_image(job)
+
+            return self.stage_create(job)
+
+        except Exception as e:
+            error_msg = str(e)
+            tb = traceback.format_exc()
+            print(f"  [FAIL] Error: {error_msg}")
+            job['result'] = {'status': 'failed', 'error': error_msg, 'traceback': tb}
+            return [job]
+
     def import_single(self, item: Dict[str, Any], skip_existing: bool = True) -> Dict[str, Any]:
         """
         Import a single media item.
 
+        The track is created immediately, flushing any buffered batch.
+
         Args:
             item: Item dictionary from get_media_list()
             skip_existing: Skip if track already exists
@@ -182,57 +821,291 @@ class BaseImporter(ABC):
         Returns:
             Status dictionary with 'status' and optional 'error' keys
         """
-        try:
-            # Fetch metadata
-            print(f"  Fetching metadata...")
-            metadata = self.fetch_metadata(item)
+        job = {'item': item, 'item_id': item.get('id', item.get('title'))}
+        self.import_job(job, skip_existing)
+
+        if 'result' not in job:
+            self.flush_tracks()
+        return job['result']
+
+    def skip_existing_track(self, job: Dict[str, Any], skip_existing: bool = True) -> bool:
+        """
+        Check whether a job's track already exists and must be skipped.
+
+        Changed entries of a sync run are never skipped. During a sync, a
+        track with the same title but no external ID (imported before
+        external IDs were stored) is linked to the entry, so the next sync
+        recognizes it; a track already linked to another entry (e.g., a
+        remake) does not count.
+
+        Args:
+            job: Job dictionary with 'item' and 'metadata' keys
+            skip_existing: Skip if track already exists
+
+        Returns:
+            True if the job should be skipped
+        """
+        if not skip_existing or self.sync_target(job) is not None:
+            return False
+
+        track_id = self.api_client.find_track(job['metadata']['title'])
+        if track_id is None:
+            return False
+        if not self.sync:
+            return True
+
+        if track_id in self._sync_linked:
+            return False
+
+        external_id = self.external_id(job['item'])
+        if external_id:
+            track = self.api_client.update_track(track_id, {
+                'externalId': external_id,
+                'sourceHash': self.source_hash(job['item']),
+            })
+            if track:
+                self._link_sync_track(external_id, track)
+        return True
+
+    def _count_sync(self, outcome: str, delta: int = 1):
+        """Update a sync counter (called from the item feed and stage workers)."""
+        with self._sync_lock:
+            self._sync_counts[outcome] += delta
+
+    def _link_sync_track(self, external_id: str, track: Dict[str, Any]):
+        """
+        Record a legacy track linked to a catalog entry during a sync run.
+
+        The entry was counted as new by sync_items(); it is now tracked like
+        the entries matched by external ID (seen, linked, not pruned).
+        """
+        with self._sync_lock:
+            self._sync_tracks[external_id] = track
+            self._sync_linked.add(track['id'])
+            self._sync_seen.add(external_id)
+            self._sync_counts['new'] -= 1
+            self._sync_counts['linked'] += 1
+
+    def sync_target(self, job: Dict[str, Any]) -> Optional[int]:
+        """
+        Get the track a job updates during a sync run.
+
+        Args:
+            job: Job dictionary with an 'item' key
+
+        Returns:
+            ID of the track of a changed catalog entry, or None to create one
+        """
+        if not self._sync_updates:
+            return None
+        return self._sync_updates.get(self.external_id(job['item']))
 
-            if not metadata:
-                return {'status': 'failed', 'error': 'Failed to fetch metadata'}
+    def load_sync_state(self):
+        """Index this category's tracks by external ID for a sync run."""
+        self._sync_tracks, self._sync_updates, self._sync_seen = {}, {}, set()
+        self._sync_counts = {'new': 0, 'changed': 0, 'unchanged': 0, 'linked': 0, 'removed': 0}
 
-            title = metadata['title']
-            print(f"  Title: {title}")
+        for track in self.api_client.get_tracks():
+            if track.get('categoryId') == self.category_id and track.get('externalId'):
+                self._sync_tracks[track['externalId']] = track
+        self._sync_linked = {track['id'] for track in self._sync_tracks.values()}
 
-            # Check if exists
-            if skip_existing and self.api_client.track_exists(title):
-                print(f"  -> Already exists, skipped")
-                return {'status': 'skipped', 'reason': 'already exists'}
+    def sync_items(self, media: Iterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Keep only the catalog entries that are new or changed since the last import.
 
-            # Download media
-            audio_path, image_path = self.download_media(metadata)
+        Entries are matched to tracks by external ID (see external_id) and
+        compared by source hash, so unchanged entries cost no API call at all.
+        Changed entries are recorded in _sync_updates and update their track.
 
-            # Create track
-            success = self.create_track(metadata, audio_path, image_path)
+        Args:
+            media: Catalog items
 
-            if success:
-                return {'status': 'success'}
+        Yields:
+            New and changed items
+        """
+        for item in media:
+            external_id = self.external_id(item)
+            if external_id is None:
+                self._count_sync('new')
+                yield item
+                continue
+
+            self._sync_seen.add(external_id)
+            track = self._sync_tracks.get(external_id)
+            if track is None:
+                self._count_sync('new')
+                yield item
+            elif track.get('sourceHash') == self.source_hash(item):
+                self._count_sync('unchanged')
             else:
-                return {'status': 'failed', 'error': 'Failed to create track'}
+                self._count_sync('changed')
+                self._sync_updates[external_id] = track['id']
+                # Stages journaled for the previous version are stale
+                if self.journal:
+                    self.journal.forget_tracks([track['id']])
+                yield item
 
-        except Exception as e:
-            error_msg = str(e)
-            tb = traceback.format_exc()
-            print(f"  [FAIL] Error: {error_msg}")
-            return {'status': 'failed', 'error': error_msg, 'traceback': tb}
+    def prune_removed(self, release_media: bool = False) -> List[int]:
+        """
+        Delete the tracks whose entry is no longer in the catalog.
+
+        Only tracks with an external ID are considered; call after
+        sync_items() has gone through the whole catalog.
+
+        Args:
+            release_media: Also delete their stored files that no remaining
+                track uses (see release_track_media)
+
+        Returns:
+            IDs of the deleted tracks
+        """
+        removed = [track['id'] for key, track in self._sync_tracks.items() if key not in self._sync_seen]
+        if not removed:
+            return []
+
+        print(f"\nDeleting {len(removed)} tracks removed from the catalog...")
+        deleted = self.api_client.delete_tracks(removed)
+        if self.journal:
+            self.journal.forget_tracks(deleted)
+        deleted_ids = set(deleted)
+        if release_media and deleted_ids:
+            try:
+                remaining = self.api_client.get_tracks(strict=True)
+            except Exception as e:
+                print(f"  [WARN] Stored media not released, could not list the remaining tracks: {e}")
+            else:
+                release_track_media(
+                    [track for track in self._sync_tracks.values() if track['id'] in deleted_ids],
+                    remaining,
+                    audio_store=self.audio_store,
+                    image_store=self.image_store
+                )
+        self._sync_counts['removed'] = len(deleted)
+        return deleted
 
-    def import_all(self, skip_existing: bool = True, max_items: Optional[int] = None) -> Dict[str, Any]:
+    def record_result(self, stats: Dict[str, Any], item_id: str, result: Dict[str, Any]):
+        """
+        Add an import result to the statistics dictionary.
+
+        Args:
+            stats: Statistics dictionary (updated in place)
+            item_id: Item identifier used in error reports
+            result: Status dictionary from import_single() or a pipeline job
+        """
+        if result['status'] == 'success':
+            stats['successful'] += 1
+        elif result['status'] == 'skipped':
+            stats['skipped'] += 1
+        else:
+            stats['failed'] += 1
+            stats['errors'].append({
+                'id': item_id,
+                'error': result.get('error', 'Unknown error'),
+                'traceback': result.get('traceback', '')
+            })
+
+    def import_all(
+        self,
+        skip_existing: bool = True,
+        max_items: Optional[int] = None,
+        workers: Optional[Dict[str, int]] = None,
+        batch_size: Optional[int] = None,
+        async_engine: bool = False,
+        resume: bool = False,
+        restart: bool = False,
+        clip: Optional[bool] = None,
+        audio_profile: Optional[str] = None,
+        loudnorm: Optional[bool] = None,
+        catalog: Optional[Path] = None,
+        sync: bool = False,
+        release_media: bool = False,
+        prefetch: Optional[int] = None,
+        priority: bool = True,
+        priority_aging: Optional[int] = None,
+        priority_window: Optional[int] = None,
+        shared_stats: bool = True
+    ) -> Dict[str, Any]:
         """
         Import all media items.
 
         Args:
             skip_existing: Skip tracks that already exist
             max_items: Maximum number of items to import (None for all)
+            workers: Per-stage worker counts to run the staged pipeline
+                (e.g. {'audio': 4}), or None for one item at a time
+            batch_size: Tracks created per batch request (default from config)
+            async_engine: Run with the asyncio engine (AsyncImportEngine)
+            resume: Skip stages already completed in the import journal
+            restart: Clear this category's journal before importing
+            clip: Download only the played section of each theme (default from config)
+            audio_profile: Audio encoding profile name (default from config, see AUDIO_PROFILES)
+            loudnorm: Normalize audio loudness (default from config)
+            catalog: Catalog file to stream items from instead of get_media_list()
+            sync: Only import new and changed entries (matched by external ID)
+                and delete the tracks of removed ones, see sync_items. Nothing
+                is deleted when max_items is set.
+            release_media: On sync, also delete the stored files of removed
+                tracks that no remaining track uses
+            prefetch: Items whose metadata is resolved ahead of the one
+                downloading, in a background thread (sequential import only;
+                default from config, 0 disables)
+            priority: Import "priority": "high" items first (see
+                PriorityScheduler); False keeps the catalog order
+            priority_aging: Items read after a waiting item for it to gain
+                one priority level (default from config, 0 disables)
+            priority_window: Items read ahead to reorder (default from config)
+            shared_stats: Print the stats of the process-wide OMDb rate
+                limiter; False when other importers run at the same time
+                (their caller prints it once)
 
         Returns:
-            Statistics dictionary with counts and errors
+            Statistics dictionary with counts, errors and the run's metrics
+            report ('metrics': stage timings and counters, see Metrics.report).
+            A sync run adds 'sync': {'new', 'changed', 'unchanged', 'removed'};
+            unchanged entries are counted as skipped.
         """
-        media_list = self.get_media_list()
+        self.metrics.reset()
+
+        if batch_size is not None:
+            self.batch_size = batch_size
+        if clip is not None:
+            self.clip_mode = clip
+        if audio_profile is not None or loudnorm is not None:
+            self.youtube_dl.set_profile(audio_profile or self.youtube_dl.profile_name, loudnorm)
+
+        # Every run records its progress; resume decides whether it is read back
+        if self.journal is None:
+            self.journal = ImportJournal()
+        if restart:
+            cleared = self.journal.clear(self.category_id)
+            print(f"Journal cleared for {self.category_id} ({cleared} items)")
+        self.resume = resume and not restart
+
+        if catalog is not None:
+            self.catalog = Path(catalog)
+
+        self.sync = sync
+        self._sync_updates = {}
+        if sync:
+            self.load_sync_state()
 
+        # Items are pulled one at a time, so the list is never held in memory
+        total, media = self.media_source()
+        if priority:
+            scheduler = PriorityScheduler(
+                window=PRIORITY_WINDOW if priority_window is None else priority_window,
+                aging=PRIORITY_AGING if priority_aging is None else priority_aging
+            )
+            media = scheduler.schedule(media)
         if max_items:
-            media_list = media_list[:max_items]
+            total = min(total, max_items)
+        media = islice(media, max_items or None)
+        if sync:
+            media = self.sync_items(media)
 
         stats = {
-            'total': len(media_list),
+            'total': total,
             'successful': 0,
             'failed': 0,
             'skipped': 0,
@@ -242,27 +1115,66 @@ class BaseImporter(ABC):
 
         start_time = time.time()
 
-        print(f"\nImporting {self.category_id.title()} ({len(media_list)} items)")
+        # One snapshot of existing titles for the whole run (a sync run only
+        # needs it for new entries, so it is loaded on first lookup)
+        if skip_existing and not sync:
+            self.api_client.load_title_index()
+
+        print(f"\nImporting {self.category_id.title()} ({total} items)")
         print("=" * 60)
 
-        for i, item in enumerate(media_list, 1):
-            item_id = item.get('id', item.get('title', f'item_{i}'))
-            print(f"\n[{i}/{len(media_list)}] {item_id}")
+        if async_engine:
+            AsyncImportEngine(self).run(media, stats, skip_existing)
+            self.youtube_dl.shutdown()
+        elif workers is not None:
+            ImportPipeline(self, workers).run(media, stats, skip_existing)
+            self.youtube_dl.shutdown()
+        else:
+            prefetch = METADATA_PREFETCH if prefetch is None else prefetch
+            if prefetch > 0:
+                print(f"Metadata prefetch: {prefetch} items ahead")
+                jobs = MetadataPrefetcher(self, prefetch).jobs(media)
+            else:
+                jobs = (
+                    {'item': item, 'item_id': item.get('id', item.get('title', f'item_{i}'))}
+                    for i, item in enumerate(media, 1)
+                )
 
-            result = self.import_single(item, skip_existing)
+            for i, job in enumerate(jobs, 1):
+                print(f"\n[{i}/{total}] {job['item_id']}")
 
-            if result['status'] == 'success':
-                stats['successful'] += 1
-            elif result['status'] == 'skipped':
-                stats['skipped'] += 1
-            else:
-                stats['failed'] += 1
-                stats['errors'].append({
-                    'id': item_id,
-                    'error': result.get('error', 'Unknown error'),
-                    'traceback': result.get('traceback', '')
-                })
+                for finished in self.import_job(job, skip_existing):
+                    self.record_result(stats, finished['item_id'], finished['result'])
+
+            for job in self.flush_tracks():
+                self.record_result(stats, job['item_id'], job['result'])
+
+        # Posters still being resized
+        if self.poster_processor:
+            self.poster_processor.shutdown()
+
+        if sync:
+            if not max_items:
+                self.prune_removed(release_media)
+            stats['skipped'] += self._sync_counts['unchanged']
+            stats['sync'] = dict(self._sync_counts)
 
         stats['duration'] = time.time() - start_time
+        stats['metrics'] = self.metrics.report()
+
+        if self.poster_processor and (self.poster_processor.processed or self.poster_processor.failed):
+            print()
+            print(self.poster_processor.stats_line())
+
+        if self.omdb_client:
+            print()
+            if self.omdb_client.cache_stats():
+                print(self.omdb_client.cache_stats())
+            if shared_stats:
+                print(self.omdb_client.rate_limiter.stats_line())
+
+        search_cache = self.youtube_dl.search_cache
+        if search_cache and search_cache.cache.hit_rate()[1]:
+            print(search_cache.stats_line())
 
         return stats
@@ -55,6 +55,23 @@ class FilmsImporter(BaseImporter):
         year = metadata.get('year', '')
         return f"{title} ({year}) main theme"
 
+    def apply_item_fields(self, item: Dict[str, Any], metadata: Dict[str, Any]):
+        """
+        Copy fields set in films_list.json onto fetched metadata.
+
+        Args:
+            item: Item from films_list.json
+            metadata: OMDb metadata (updated in place)
+        """
+        # Add titleVF from JSON if provided
+        if 'titleVF' in item and item['titleVF']:
+            metadata['titleVF'] = item['titleVF']
+
+        # Played window, if the theme does not start at 0
+        for key in ('startTime', 'timeLimit'):
+            if key in item:
+                metadata[key] = int(item[key])
+
     def fetch_metadata(self, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Fetch film metadata from OMDb API.
@@ -72,9 +89,28 @@ class FilmsImporter(BaseImporter):
         metadata = self.omdb_client.fetch_by_imdb_id(imdb_id)
 
         if metadata:
-            # Add titleVF from JSON if provided
-            if 'titleVF' in item and item['titleVF']:
-                metadata['titleVF'] = item['titleVF']
+            self.apply_item_fields(item, metadata)
+
+        return metadata
+
+    async def fetch_metadata_async(self, item: Dict[str, Any], session) -> Optional[Dict[str, Any]]:
+        """
+        Fetch film metadata from OMDb API from a coroutine.
+
+        Args:
+            item: Item from films_list.json
+            session: aiohttp.ClientSession shared by the async engine
+
+        Returns:
+            Metadata dictionary or None on error
+        """
+        if not self.omdb_client:
+            raise ValueError("OMDb API key required for films import")
+
+        metadata = await self.omdb_client.fetch_by_imdb_id_async(session, item['id'])
+
+        if metadata:
+            self.apply_item_fields(item, metadata)
 
         return metadata
 
@@ -0,0 +1,148 @@
+"""
+Staged concurrent import pipeline.
+Runs metadata, audio, image and track creation as separate worker pools
+connected by bounded queues, so throughput is set by the slowest stage.
+"""
+
+import queue
+import threading
+import traceback
+from typing import Dict, Iterable, List, Optional, Any
+
+try:
+    from scripts.config import PIPELINE_WORKERS, PIPELINE_QUEUE_SIZE
+except ImportError:
+    from ..config import PIPELINE_WORKERS, PIPELINE_QUEUE_SIZE
+
+
+# Stage names, in processing order
+STAGES = ('metadata', 'audio', 'image', 'create')
+
+# Queue marker telling a worker to exit
+_DONE = object()
+
+
+class ImportPipeline:
+    """Runs a BaseImporter's stages concurrently on a list of items."""
+
+    def __init__(self, importer, workers: Optional[Dict[str, int]] = None, queue_size: int = PIPELINE_QUEUE_SIZE):
+        """
+        Initialize pipeline.
+
+        Args:
+            importer: BaseImporter instance providing the stage_* methods
+            workers: Worker count per stage, missing stages use config defaults
+            queue_size: Max items waiting in front of each stage
+        """
+        self.importer = importer
+        self.workers = {**PIPELINE_WORKERS, **(workers or {})}
+        self.queue_size = queue_size
+
+        for stage in STAGES:
+            if self.workers[stage] < 1:
+                raise ValueError(f"Stage '{stage}' needs at least 1 worker")
+
+        self.queues: List[queue.Queue] = []
+        self.remaining: Dict[str, int] = {}
+        self.completed = 0
+        self.lock = threading.Lock()
+
+    def _stage_func(self, stage: str, skip_existing: bool):
+        """Get the importer method for a stage."""
+        if stage == 'metadata':
+            return lambda job: self.importer.stage_metadata(job, skip_existing)
+        if stage == 'audio':
+            # Audio workers wait on the downloader's pools (encodes run in processes)
+            return lambda job: self.importer.stage_audio(job, pooled=True)
+        return getattr(self.importer, f'stage_{stage}')
+
+    def _worker(self, index: int, func, stats: Dict[str, Any]):
+        """
+        Process jobs from one stage queue until told to stop.
+
+        Args:
+            index: Stage index in STAGES
+            func: Stage function applied to each job
+            stats: Statistics dictionary (updated in place)
+        """
+        stage = STAGES[index]
+        inbox = self.queues[index]
+        is_last = index == len(STAGES) - 1
+
+        while True:
+            job = inbox.get()
+            if job is _DONE:
+                break
+
+            try:
+                finished = func(job)
+            except Exception as e:
+                print(f"  [FAIL] {job['item_id']} ({stage}): {e}")
+                job['result'] = {'status': 'failed', 'error': str(e), 'traceback': traceback.format_exc()}
+                finished = [job]
+
+            # The create stage returns the jobs it finished (batches finish several)
+            if is_last:
+                self._record(finished, stats)
+            elif 'result' in job:
+                self._record([job], stats)
+            else:
+                self.queues[index + 1].put(job)
+
+        # Last worker out of a stage stops the next one
+        with self.lock:
+            self.remaining[stage] -= 1
+            stage_finished = self.remaining[stage] == 0
+        if stage_finished and not is_last:
+            for _ in range(self.workers[STAGES[index + 1]]):
+                self.queues[index + 1].put(_DONE)
+
+    def _record(self, jobs: List[Dict[str, Any]], stats: Dict[str, Any]):
+        """Add finished jobs to the statistics."""
+        with self.lock:
+            for job in jobs:
+                self.importer.record_result(stats, job['item_id'], job['result'])
+                self.completed += 1
+                print(f"[{self.completed}/{stats['total']}] {job['item_id']}: {job['result']['status']}")
+
+    def run(self, media_list: Iterable[Dict[str, Any]], stats: Dict[str, Any], skip_existing: bool = True):
+        """
+        Import all items through the pipeline.
+
+        Args:
+            media_list: Items to import (list or lazy iterator)
+            stats: Statistics dictionary (updated in place)
+            skip_existing: Skip tracks that already exist
+        """
+        self.queues = [queue.Queue(maxsize=self.queue_size) for _ in STAGES]
+        self.remaining = {stage: self.workers[stage] for stage in STAGES}
+        self.completed = 0
+
+        print("Pipeline workers: " + ", ".join(f"{s}={self.workers[s]}" for s in STAGES))
+
+        threads = []
+        for index, stage in enumerate(STAGES):
+            func = self._stage_func(stage, skip_existing)
+            for n in range(self.workers[stage]):
+                thread = threading.Thread(
+                    target=self._worker,
+                    args=(index, func, stats),
+                    name=f'{stage}-{n}',
+                    daemon=True
+                )
+                thread.start()
+                threads.append(thread)
+
+        # Feeding blocks while the first stage is saturated
+        for i, item in enumerate(media_list, 1):
+            item_id = item.get('id', item.get('title', f'item_{i}'))
+            self.queues[0].put({'item': item, 'item_id': item_id})
+
+        for _ in range(self.workers[STAGES[0]]):
+            self.queues[0].put(_DONE)
+
+        for thread in threads:
+            thread.join()
+
+        # Tracks still buffered for a batch create
+        self._record(self.importer.flush_tracks(), stats)
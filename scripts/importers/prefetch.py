@@ -0,0 +1,111 @@
+"""
+Metadata prefetch for the sequential import.
+A background thread resolves metadata for the next items (at the rate the
+OMDb limiter allows) while the current item downloads, keeping a bounded
+look-ahead window of ready jobs.
+"""
+
+import queue
+import threading
+import traceback
+from typing import Any, Dict, Iterable, Iterator
+
+# Queue marker: no more items
+_DONE = object()
+
+
+class MetadataPrefetcher:
+    """Resolves a BaseImporter's metadata ahead of the sequential import."""
+
+    def __init__(self, importer, window: int):
+        """
+        Initialize prefetcher.
+
+        Args:
+            importer: BaseImporter instance providing fetch_metadata()
+            window: Max jobs resolved ahead of the one being imported
+
+        Raises:
+            ValueError: If window is less than 1
+        """
+        if window < 1:
+            raise ValueError("Prefetch window must be at least 1")
+        self.importer = importer
+        self.window = window
+        self.ready: queue.Queue = queue.Queue(maxsize=window)
+        self.stopped = threading.Event()
+        self.thread = None
+
+    def _needs_fetch(self, job: Dict[str, Any]) -> bool:
+        """Check whether a job's metadata must be fetched (not reusable from the journal)."""
+        importer = self.importer
+        if not (importer.journal and importer.resume):
+            return True
+        entry = importer.journal.get(importer.category_id, job['item_id'])
+        return not (entry and (entry['metadata'] or entry['status'] in ('done', 'skipped')))
+
+    def _put(self, job) -> bool:
+        """Queue a job, waiting for room in the window. Returns False once stopped."""
+        while not self.stopped.is_set():
+            try:
+                self.ready.put(job, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce(self, media: Iterable[Dict[str, Any]]):
+        """Resolve metadata for each item, in catalog order."""
+        importer = self.importer
+        try:
+            for i, item in enumerate(media, 1):
+                job = {'item': item, 'item_id': item.get('id', item.get('title', f'item_{i}'))}
+                if self._needs_fetch(job):
+                    try:
+                        with importer.metrics.timer('metadata'):
+                            job['prefetched'] = importer.fetch_metadata(item)
+                    except Exception as e:
+                        job['prefetch_error'] = {'error': str(e), 'traceback': traceback.format_exc()}
+                if not self._put(job):
+                    return
+        except Exception as e:
+            # Catalog read error: ends the import like in the sequential loop
+            self._put({'error': e})
+        finally:
+            self._put(_DONE)
+
+    def jobs(self, media: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate jobs whose metadata is already resolved.
+
+        Each job has 'item' and 'item_id' keys, plus 'prefetched' (the
+        fetch_metadata() result) or 'prefetch_error' (see
+        BaseImporter.stage_metadata).
+
+        Args:
+            media: Items to import (list or lazy iterator)
+
+        Yields:
+            Jobs in catalog order
+
+        Raises:
+            Exception: Any error raised while reading the items
+        """
+        self.thread = threading.Thread(target=self._produce, args=(media,), name='metadata-prefetch', daemon=True)
+        self.thread.start()
+        try:
+            while True:
+                job = self.ready.get()
+                if job is _DONE:
+                    return
+                if 'error' in job and 'item' not in job:
+                    raise job['error']
+                yield job
+        finally:
+            self.close()
+
+    def close(self):
+        """Stop the producer (after an interruption) and wait for it."""
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join()
@@ -0,0 +1,61 @@
+"""
+Script to generate poster variants (resized JPEG/WebP, thumbnail, manifest)
+for the images already in public/images.
+"""
+
+import sys
+import os
+import argparse
+from concurrent.futures import as_completed
+from pathlib import Path
+from tqdm import tqdm
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scripts.config import IMAGES_DIR, IMAGE_WORKERS
+from scripts.utils.images import PosterProcessor, is_source_image
+
+
+def main():
+    """Backfill poster variants."""
+    parser = argparse.ArgumentParser(description='Generate resized, WebP and thumbnail variants of posters')
+    parser.add_argument('--force', '-f', action='store_true', help='Regenerate variants that already exist')
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=IMAGE_WORKERS,
+        help=f'Resizing processes (default: {IMAGE_WORKERS})'
+    )
+    parser.add_argument(
+        '--dir',
+        type=Path,
+        default=IMAGES_DIR,
+        help=f'Images directory (default: {IMAGES_DIR})'
+    )
+    args = parser.parse_args()
+
+    sources = sorted(p for p in args.dir.iterdir() if p.is_file() and is_source_image(p))
+    if not sources:
+        print(f"[OK] No images found in {args.dir}")
+        return
+
+    processor = PosterProcessor(args.dir, args.workers)
+    futures = [f for f in (processor.submit(f"/images/{p.name}", args.force) for p in sources) if f]
+
+    print(f"Found {len(sources)} images, {len(futures)} to process")
+
+    if futures:
+        for _ in tqdm(as_completed(futures), total=len(futures), unit='img'):
+            pass
+
+    processor.shutdown()
+
+    print("\n" + "=" * 50)
+    print(processor.stats_line())
+    print(f"Up to date: {len(sources) - len(futures)}")
+    print("=" * 50)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""
+Tests for TrackAPIClient against a local fake of the import API.
+Run with: python -m unittest discover -s scripts/tests -t .
+"""
+
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from scripts.utils.api_client import TrackAPIClient
+
+
+class LegacyServer(BaseHTTPRequestHandler):
+    """Import API without DELETE /batch: the path reaches the [id] handler."""
+
+    tracks = {}
+    requests = []
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status: int, body):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        self._send(200, list(self.tracks.values()))
+
+    def do_PUT(self):
+        updates = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        track = self.tracks[int(self.path.rsplit('/', 1)[-1])]
+        track.update(updates)
+        self._send(200, track)
+
+    def do_DELETE(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        self.rfile.read(length)
+        self.requests.append(self.path)
+
+        # Like app/api/import/tracks/[id]/route.ts: parseInt("batch") is NaN
+        track_id = self.path.rsplit('/', 1)[-1]
+        if not track_id.isdigit():
+            return self._send(400, {'error': 'ID invalide'})
+        if self.tracks.pop(int(track_id), None) is None:
+            return self._send(404, {'error': 'Track non trouvé'})
+        self._send(200, {'success': True})
+
+
+class LegacyServerTestCase(unittest.TestCase):
+    """Runs LegacyServer with five tracks (1-3 in films, 4-5 in series)."""
+
+    def setUp(self):
+        LegacyServer.tracks = {
+            i: {'id': i, 'title': f'Film {i}', 'categoryId': 'films' if i <= 3 else 'series'}
+            for i in range(1, 6)
+        }
+        LegacyServer.requests = []
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), LegacyServer)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.client = TrackAPIClient(base_url=f'http://127.0.0.1:{self.server.server_address[1]}', api_token='token')
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class DeleteTracksFallbackTest(LegacyServerTestCase):
+    """delete_tracks() against a server that predates the bulk endpoint."""
+
+    def test_400_on_batch_falls_back_to_one_delete_per_track(self):
+        deleted = self.client.delete_tracks([1, 2, 4], workers=2)
+
+        self.assertEqual(sorted(deleted), [1, 2, 4])
+        self.assertEqual(sorted(LegacyServer.tracks), [3, 5])
+        self.assertEqual(LegacyServer.requests.count('/api/import/tracks/batch'), 1)
+
+    def test_missing_endpoint_is_remembered(self):
+        self.client.delete_tracks([1])
+        self.client.delete_tracks([2])
+
+        self.assertEqual(LegacyServer.requests.count('/api/import/tracks/batch'), 1)
+        self.assertEqual(sorted(LegacyServer.tracks), [3, 4, 5])
+
+    def test_category_delete_falls_back(self):
+        deleted = self.client.delete_tracks(category_id='series')
+
+        self.assertEqual(sorted(deleted), [4, 5])
+        self.assertEqual(sorted(LegacyServer.tracks), [1, 2, 3])
+
+
+class TitleIndexTest(LegacyServerTestCase):
+    """The title index follows updates and deletes made through the client."""
+
+    def test_renamed_track_is_found_by_its_new_title(self):
+        self.client.load_title_index()
+        self.client.update_track(2, {'title': 'Nouveau titre'})
+
+        self.assertIsNone(self.client.find_track('Film 2'))
+        self.assertEqual(self.client.find_track('nouveau titre'), 2)
+
+    def test_duplicate_title_survives_one_delete(self):
+        LegacyServer.tracks[3]['title'] = 'Film 1'
+        self.client.load_title_index()
+
+        self.client.delete_track(1)
+        self.assertEqual(self.client.find_track('Film 1'), 3)
+
+        self.client.delete_track(3)
+        self.assertIsNone(self.client.find_track('Film 1'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,13 +1,67 @@
 """
 Generate accepted answer variations for track titles.
 Handles multiple languages, transliterations, and common variations.
+
+Patterns are compiled once at import time and each title is cleaned once
+(articles, punctuation) for all of its variants; results are memoized, so
+regenerating answers for a whole catalog stays cheap.
 """
 
 import re
 import unicodedata
-from typing import List, Set, Optional
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+# Leading articles in multiple languages
+ARTICLES = (
+    'the', 'a', 'an',           # English
+    'le', 'la', 'les', 'l',     # French
+    'el', 'los', 'las',         # Spanish (+ la)
+    'der', 'die', 'das',        # German
+    'il', 'lo', 'i',            # Italian (+ la)
+)
+
+# Common words left out of keyword answers
+STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'of', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'le', 'la', 'les', 'de', 'des', 'du', 'et', 'ou', 'dans', 'sur', 'avec',
+    'part', 'volume', 'chapter', 'episode', 'season', 'series',
+    'partie', 'tome', 'chapitre', 'saison',
+})
+
+# Titles kept in the memoization caches
+ANSWER_CACHE_SIZE = 65536
+
+# One alternation for all articles, matched against the lowercased title
+ARTICLE_PATTERN = re.compile(rf"^({'|'.join(ARTICLES)})\s+")
+PUNCTUATION_PATTERN = re.compile(r'[^\w\s]')
+
+# Match index stored with each track (Track.matchIndex, read by server.js)
+MATCH_INDEX_VERSION = 1
+MATCH_MAX_DISTANCE = 2  # "Close" guesses: Levenshtein distance 1 or 2
+TRIGRAM_SIZE = 3
+
+# Whitespace as matched by JavaScript's \s and String.trim()
+_JS_SPACE = '[\t\n\v\f\r \u00a0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000\ufeff]'
+JS_SPACE_PATTERN = re.compile(f'{_JS_SPACE}+')
+JS_TRIM_PATTERN = re.compile(f'^{_JS_SPACE}+|{_JS_SPACE}+$')
+JS_ACCENT_PATTERN = re.compile('[\u0300-\u036f]')
 
 
+class _CombiningMarkTable(dict):
+    """str.translate() table deleting combining marks (category Mn), filled on first use of each character."""
+
+    def __missing__(self, code: int) -> Optional[int]:
+        value = None if unicodedata.category(chr(code)) == 'Mn' else code
+        self[code] = value
+        return value
+
+
+_COMBINING_MARKS = _CombiningMarkTable()
+
+
+@lru_cache(maxsize=ANSWER_CACHE_SIZE)
 def normalize_title(title: str) -> str:
     """
     Normalize a title for comparison.
@@ -21,9 +75,10 @@ def normalize_title(title: str) -> str:
     # Lowercase
     title = title.lower()
 
-    # Remove accents
-    title = unicodedata.normalize('NFD', title)
-    title = ''.join(c for c in title if unicodedata.category(c) != 'Mn')
+    # Remove accents (ASCII titles have none)
+    if not title.isascii():
+        title = unicodedata.normalize('NFD', title)
+        title = title.translate(_COMBINING_MARKS)
 
     # Normalize whitespace
     title = ' '.join(title.split())
@@ -41,20 +96,9 @@ def remove_articles(title: str) -> str:
     Returns:
         Title without leading articles
     """
-    # Articles in multiple languages
-    articles = [
-        'the', 'a', 'an',           # English
-        'le', 'la', 'les', 'l',     # French
-        'el', 'la', 'los', 'las',   # Spanish
-        'der', 'die', 'das',        # German
-        'il', 'lo', 'la', 'i',      # Italian
-    ]
-
-    title_lower = title.lower()
-    for article in articles:
-        pattern = rf'^{article}\s+'
-        if re.match(pattern, title_lower):
-            return title[len(article):].strip()
+    match = ARTICLE_PATTERN.match(title.lower())
+    if match:
+        return title[len(match.group(1)):].strip()
 
     return title
 
@@ -70,7 +114,33 @@ def remove_punctuation(title: str) -> str:
         Title without punctuation
     """
     # Keep letters, numbers, and spaces
-    return re.sub(r'[^\w\s]', '', title)
+    return PUNCTUATION_PATTERN.sub('', title)
+
+
+def _keywords(clean_title: str, max_keywords: int = 3) -> List[str]:
+    """Pick keywords from a title without articles and punctuation."""
+    keywords = [word for word in clean_title.lower().split() if word not in STOP_WORDS and len(word) > 2]
+
+    # Longer words first
+    keywords.sort(key=len, reverse=True)
+    return keywords[:max_keywords]
+
+
+def _acronym(clean_title: str) -> Optional[str]:
+    """Build the acronym of a title without articles and punctuation."""
+    words = clean_title.split()
+
+    if len(words) < 2:
+        return None
+
+    # Take first letter of each word
+    acronym = ''.join(word[0].upper() for word in words if len(word) > 0)
+
+    # Only return if reasonable length
+    if 2 <= len(acronym) <= 6:
+        return acronym.lower()
+
+    return None
 
 
 def extract_keywords(title: str, max_keywords: int = 3) -> List[str]:
@@ -84,52 +154,68 @@ def extract_keywords(title: str, max_keywords: int = 3) -> List[str]:
     Returns:
         List of keywords
     """
-    # Remove articles and punctuation
-    clean_title = remove_punctuation(remove_articles(title))
+    return _keywords(remove_punctuation(remove_articles(title)), max_keywords)
 
-    # Split into words
-    words = clean_title.lower().split()
 
-    # Filter out common words
-    stop_words = {
-        'the', 'a', 'an', 'of', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-        'le', 'la', 'les', 'de', 'des', 'du', 'et', 'ou', 'dans', 'sur', 'avec',
-        'part', 'volume', 'chapter', 'episode', 'season', 'series',
-        'partie', 'tome', 'chapitre', 'saison',
-    }
+def generate_acronym(title: str) -> Optional[str]:
+    """
+    Generate acronym from title.
 
-    keywords = [word for word in words if word not in stop_words and len(word) > 2]
+    Args:
+        title: Input title
 
-    # Return top keywords (sorted by length, longer first)
-    keywords.sort(key=len, reverse=True)
-    return keywords[:max_keywords]
+    Returns:
+        Acronym or None if too short
+    """
+    return _acronym(remove_punctuation(remove_articles(title)))
 
 
-def generate_acronym(title: str) -> Optional[str]:
+@lru_cache(maxsize=ANSWER_CACHE_SIZE)
+def _title_answers(title: str, acronym: bool) -> Tuple[str, ...]:
     """
-    Generate acronym from title.
+    Get the answer variants of one title.
 
     Args:
         title: Input title
+        acronym: Also include the acronym
 
     Returns:
-        Acronym or None if too short
+        Full, without articles, without punctuation and clean variants,
+        then keywords (and acronym) when there are any
     """
-    # Remove punctuation and articles
-    clean_title = remove_punctuation(remove_articles(title))
-    words = clean_title.split()
+    # Articles and punctuation are removed once for every variant
+    without_articles = remove_articles(title)
+    clean = remove_punctuation(without_articles)
+
+    answers = [
+        normalize_title(title),
+        normalize_title(without_articles),
+        normalize_title(remove_punctuation(title)),
+        normalize_title(clean),
+    ]
 
-    if len(words) < 2:
-        return None
+    keywords = _keywords(clean)
+    if keywords:
+        answers.append(' '.join(keywords))
 
-    # Take first letter of each word
-    acronym = ''.join(word[0].upper() for word in words if len(word) > 0)
+    if acronym:
+        title_acronym = _acronym(clean)
+        if title_acronym:
+            answers.append(title_acronym)
 
-    # Only return if reasonable length
-    if 2 <= len(acronym) <= 6:
-        return acronym.lower()
+    return tuple(answers)
 
-    return None
+
+@lru_cache(maxsize=ANSWER_CACHE_SIZE)
+def _accepted_answers(title: str, title_vf: Optional[str]) -> Tuple[str, ...]:
+    """Memoized generate_accepted_answers()."""
+    answers: Set[str] = set(_title_answers(title, True))
+    if title_vf:
+        answers.update(_title_answers(title_vf, False))
+
+    # Remove empty strings and sort by length (shorter first for better UX)
+    answers = {a.strip() for a in answers if a.strip()}
+    return tuple(sorted(answers, key=len))
 
 
 def generate_accepted_answers(title: str, title_vf: Optional[str] = None) -> List[str]:
@@ -158,64 +244,183 @@ def generate_accepted_answers(title: str, title_vf: Optional[str] = None) -> Lis
             ...
         ]
     """
-    answers: Set[str] = set()
+    return list(_accepted_answers(title, title_vf or None))
 
-    # Process original title
-    normalized = normalize_title(title)
-    answers.add(normalized)
 
-    # Without articles
-    without_articles = normalize_title(remove_articles(title))
-    if without_articles != normalized:
-        answers.add(without_articles)
+def generate_accepted_answers_batch(
+    titles: Iterable[Union[str, Sequence[Optional[str]]]]
+) -> List[List[str]]:
+    """
+    Generate accepted answers for many titles.
 
-    # Without punctuation
-    without_punct = normalize_title(remove_punctuation(title))
-    if without_punct != normalized:
-        answers.add(without_punct)
+    Titles shared by several tracks (remakes, French titles reused across
+    entries) are processed once.
 
-    # Without articles and punctuation
-    clean = normalize_title(remove_punctuation(remove_articles(title)))
-    if clean != without_articles and clean != without_punct:
-        answers.add(clean)
+    Args:
+        titles: Titles, or (title, title_vf) pairs
 
-    # Keywords only
-    keywords = extract_keywords(title)
-    if keywords:
-        keywords_str = ' '.join(keywords)
-        answers.add(keywords_str)
+    Returns:
+        Accepted answers of each title, in input order
+    """
+    results = []
+    for entry in titles:
+        if isinstance(entry, str):
+            title, title_vf = entry, None
+        else:
+            title, title_vf = entry
+        results.append(generate_accepted_answers(title, title_vf))
+    return results
 
-    # Acronym
-    acronym = generate_acronym(title)
-    if acronym:
-        answers.add(acronym)
 
-    # Process French title if provided
-    if title_vf:
-        normalized_vf = normalize_title(title_vf)
-        answers.add(normalized_vf)
-
-        # Without articles (French)
-        without_articles_vf = normalize_title(remove_articles(title_vf))
-        if without_articles_vf != normalized_vf:
-            answers.add(without_articles_vf)
-
-        # Without punctuation (French)
-        without_punct_vf = normalize_title(remove_punctuation(title_vf))
-        if without_punct_vf != normalized_vf:
-            answers.add(without_punct_vf)
-
-        # Clean French
-        clean_vf = normalize_title(remove_punctuation(remove_articles(title_vf)))
-        if clean_vf != without_articles_vf and clean_vf != without_punct_vf:
-            answers.add(clean_vf)
-
-        # French keywords
-        keywords_vf = extract_keywords(title_vf)
-        if keywords_vf:
-            keywords_vf_str = ' '.join(keywords_vf)
-            answers.add(keywords_vf_str)
+def normalize_answer(text: str) -> str:
+    """
+    Normalize an answer like server.js normalizeAnswer() does.
 
-    # Remove empty strings and sort by length (shorter first for better UX)
-    answers = {a.strip() for a in answers if a.strip()}
-    return sorted(answers, key=len)
+    Unlike normalize_title(), only the combining diacritical marks block
+    (U+0300-U+036F) is removed and whitespace follows JavaScript rules,
+    so the result is exactly what the game server compares.
+
+    Args:
+        text: Answer or guess
+
+    Returns:
+        Normalized answer
+    """
+    text = JS_ACCENT_PATTERN.sub('', unicodedata.normalize('NFD', text.lower()))
+    return JS_SPACE_PATTERN.sub(' ', JS_TRIM_PATTERN.sub('', text))
+
+
+def answer_trigrams(text: str) -> Counter:
+    """
+    Count the character trigrams of a normalized answer.
+
+    Args:
+        text: Normalized answer
+
+    Returns:
+        Counter of trigrams (empty below 3 characters)
+    """
+    return Counter(text[i:i + TRIGRAM_SIZE] for i in range(len(text) - TRIGRAM_SIZE + 1))
+
+
+def build_match_index(accepted_answers: Iterable[str]) -> Dict[str, Any]:
+    """
+    Build the match index stored with a track.
+
+    The game server checks exact guesses with a set lookup on 'answers'
+    and only runs the (bounded) Levenshtein distance on answers sharing
+    enough trigrams with the guess: strings within distance k share at
+    least max(len) - 2 - 3k trigrams.
+
+    Args:
+        accepted_answers: Accepted answers of the track
+
+    Returns:
+        {'version', 'maxDistance', 'answers': normalized unique answers,
+        'trigrams': {trigram: [[answer index, count], ...]}}
+    """
+    answers = list(dict.fromkeys(normalize_answer(answer) for answer in accepted_answers))
+
+    trigrams: Dict[str, List[List[int]]] = {}
+    for index, answer in enumerate(answers):
+        for trigram, count in answer_trigrams(answer).items():
+            trigrams.setdefault(trigram, []).append([index, count])
+
+    return {
+        'version': MATCH_INDEX_VERSION,
+        'maxDistance': MATCH_MAX_DISTANCE,
+        'answers': answers,
+        'trigrams': dict(sorted(trigrams.items())),
+    }
+
+
+def bounded_levenshtein(a: Sequence[str], b: Sequence[str], max_distance: int) -> int:
+    """
+    Levenshtein distance, computed only within max_distance (as server.js does).
+
+    Args:
+        a: First string
+        b: Second string
+        max_distance: Largest distance of interest
+
+    Returns:
+        The distance, or max_distance + 1 when it is larger
+    """
+    m, n = len(a), len(b)
+    if abs(m - n) > max_distance:
+        return max_distance + 1
+
+    previous = list(range(n + 1))
+    for i in range(1, m + 1):
+        current = [max_distance + 1] * (n + 1)
+        current[0] = i
+        for j in range(max(1, i - max_distance), min(n, i + max_distance) + 1):
+            if a[i - 1] == b[j - 1]:
+                current[j] = previous[j - 1]
+            else:
+                current[j] = min(previous[j], current[j - 1], previous[j - 1]) + 1
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous = current
+
+    return min(previous[n], max_distance + 1)
+
+
+class AnswerMatcher:
+    """Checks guesses against one track like the game server (server.js)."""
+
+    def __init__(self, match_index: Dict[str, Any]):
+        """
+        Initialize matcher.
+
+        Args:
+            match_index: Index from build_match_index()
+        """
+        self.answers = set(match_index['answers'])
+        self.ordered = list(match_index['answers'])
+        self.trigrams = match_index['trigrams']
+        self.max_distance = match_index['maxDistance']
+
+    @classmethod
+    def from_answers(cls, accepted_answers: Iterable[str]) -> 'AnswerMatcher':
+        """Build a matcher from accepted answers."""
+        return cls(build_match_index(accepted_answers))
+
+    def is_close(self, normalized_guess: str) -> bool:
+        """
+        Check whether a normalized guess is 1 to maxDistance edits from an answer.
+
+        Only answers sharing enough trigrams with the guess are compared.
+        """
+        max_distance = self.max_distance
+        shared: Dict[int, int] = {}
+        for trigram, count in answer_trigrams(normalized_guess).items():
+            for index, answer_count in self.trigrams.get(trigram, ()):
+                shared[index] = shared.get(index, 0) + min(count, answer_count)
+
+        for index, answer in enumerate(self.ordered):
+            if abs(len(answer) - len(normalized_guess)) > max_distance:
+                continue
+            required = max(len(answer), len(normalized_guess)) - (TRIGRAM_SIZE - 1) - TRIGRAM_SIZE * max_distance
+            if required > 0 and shared.get(index, 0) < required:
+                continue
+            if 0 < bounded_levenshtein(normalized_guess, answer, max_distance) <= max_distance:
+                return True
+        return False
+
+    def check(self, guess: str) -> str:
+        """
+        Check a guess.
+
+        Args:
+            guess: Raw player guess
+
+        Returns:
+            "correct", "close" (the server's hint) or "wrong"
+        """
+        normalized = normalize_answer(guess)
+        if normalized in self.answers:
+            return 'correct'
+        if self.is_close(normalized):
+            return 'close'
+        return 'wrong'
@@ -3,20 +3,51 @@ API client for communicating with the blindtest backend.
 Handles all HTTP requests to the Next.js API.
 """
 
+import asyncio
 import requests
+import threading
 import time
-from typing import Optional, List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Iterable
 
 try:
-    from scripts.config import API_TRACKS_ENDPOINT, API_CATEGORIES_ENDPOINT, HTTP_TIMEOUT, API_TOKEN
+    from scripts.config import (
+        API_TRACKS_ENDPOINT, API_CATEGORIES_ENDPOINT, API_BATCH_CHUNK_SIZE, API_DELETE_CHUNK_SIZE,
+        API_DELETE_WORKERS, HTTP_TIMEOUT, API_TOKEN
+    )
+    from scripts.utils.http import create_session
+    from scripts.utils.metrics import Metrics
 except ImportError:
-    from ..config import API_TRACKS_ENDPOINT, API_CATEGORIES_ENDPOINT, HTTP_TIMEOUT, API_TOKEN
+    from ..config import (
+        API_TRACKS_ENDPOINT, API_CATEGORIES_ENDPOINT, API_BATCH_CHUNK_SIZE, API_DELETE_CHUNK_SIZE,
+        API_DELETE_WORKERS, HTTP_TIMEOUT, API_TOKEN
+    )
+    from .http import create_session
+    from .metrics import Metrics
+
+
+# Client errors worth retrying (others fail the same way every time)
+RETRYABLE_CLIENT_ERRORS = (408, 429)
+
+
+def _is_retryable(error: requests.exceptions.RequestException) -> bool:
+    """Whether a failed request may succeed when sent again."""
+    response = getattr(error, 'response', None)
+    if response is None:
+        return True
+    return response.status_code >= 500 or response.status_code in RETRYABLE_CLIENT_ERRORS
 
 
 class TrackAPIClient:
     """Client for interacting with the track API."""
 
-    def __init__(self, base_url: Optional[str] = None, timeout: int = HTTP_TIMEOUT, api_token: Optional[str] = None):
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        timeout: int = HTTP_TIMEOUT,
+        api_token: Optional[str] = None,
+        metrics: Optional[Metrics] = None
+    ):
         """
         Initialize API client.
 
@@ -24,13 +55,26 @@ class TrackAPIClient:
             base_url: Base URL for API (default from config)
             timeout: Request timeout in seconds
             api_token: API token for authentication (default from config)
+            metrics: Records request times and retries (default: a private instance)
         """
         self.base_url = base_url or API_TRACKS_ENDPOINT.rsplit('/api/import/tracks', 1)[0]
         self.tracks_endpoint = f'{self.base_url}/api/import/tracks'
         self.categories_endpoint = f'{self.base_url}/api/categories'
         self.timeout = timeout
         self.api_token = api_token or API_TOKEN
-        self.session = requests.Session()
+        self.session = create_session()
+        self.metrics = metrics or Metrics()
+
+        # Normalized title -> track ID, loaded once per run (see load_title_index)
+        self._title_index: Optional[Dict[str, int]] = None
+        # Track ID -> indexed title and title -> all its track IDs, so deletes
+        # do not scan the index and duplicate titles survive one delete
+        self._index_titles: Dict[int, str] = {}
+        self._title_ids: Dict[str, List[int]] = {}
+        self._index_lock = threading.Lock()
+
+        # Whether the server has DELETE /batch (None until the first bulk delete)
+        self._bulk_delete: Optional[bool] = None
 
         # Add authorization header if token is provided
         if self.api_token:
@@ -56,31 +100,42 @@ class TrackAPIClient:
 
         for attempt in range(max_retries):
             try:
-                response = self.session.request(
-                    method=method,
-                    url=url,
-                    timeout=self.timeout,
-                    **kwargs
-                )
+                with self.metrics.timer('api_request'):
+                    response = self.session.request(
+                        method=method,
+                        url=url,
+                        timeout=self.timeout,
+                        **kwargs
+                    )
                 response.raise_for_status()
                 return response
             except requests.exceptions.RequestException as e:
-                if attempt == max_retries - 1:
+                if attempt == max_retries - 1 or not _is_retryable(e):
+                    self.metrics.inc('api_errors')
                     raise
+                self.metrics.inc('api_retries')
                 print(f"Request failed (attempt {attempt + 1}/{max_retries}): {e}")
                 time.sleep(retry_delay * (attempt + 1))
 
-    def get_tracks(self) -> List[Dict[str, Any]]:
+    def get_tracks(self, strict: bool = False) -> List[Dict[str, Any]]:
         """
         Get all tracks from the API.
 
+        Args:
+            strict: Raise on failure instead of returning an empty list
+
         Returns:
             List of track dictionaries
+
+        Raises:
+            requests.RequestException: On failure, with strict=True
         """
         try:
             response = self._request('GET', self.tracks_endpoint)
             return response.json()
         except Exception as e:
+            if strict:
+                raise
             print(f"Error fetching tracks: {e}")
             return []
 
@@ -121,6 +176,7 @@ class TrackAPIClient:
                 - imageFile (str): Path to image file
                 - timeLimit (int): Time limit in seconds
                 - startTime (int): Start time in seconds
+                - matchIndex (dict): Answer match index (see build_match_index)
 
         Returns:
             Created track dictionary with ID, or None on failure
@@ -132,7 +188,9 @@ class TrackAPIClient:
                 json=track_data,
                 headers={'Content-Type': 'application/json'}
             )
-            return response.json()
+            track = response.json()
+            self._index_add(track)
+            return track
         except requests.exceptions.HTTPError as e:
             print(f"HTTP error creating track: {e}")
             if e.response:
@@ -146,6 +204,94 @@ class TrackAPIClient:
             print(f"Error creating track: {e}")
             return None
 
+    async def create_track_async(self, session, track_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Create a new track from a coroutine.
+
+        Args:
+            session: aiohttp.ClientSession
+            track_data: Track data dictionary (see create_track)
+
+        Returns:
+            Created track dictionary with ID, or None on failure
+        """
+        import aiohttp
+
+        headers = {'Content-Type': 'application/json'}
+        if self.api_token:
+            headers['Authorization'] = f'Bearer {self.api_token}'
+
+        max_retries = 3
+        retry_delay = 1
+
+        for attempt in range(max_retries):
+            try:
+                with self.metrics.timer('api_request'):
+                    async with session.post(self.tracks_endpoint, json=track_data, headers=headers) as response:
+                        if 400 <= response.status < 500:
+                            print(f"HTTP error creating track: {response.status}")
+                            print(f"Response text: {await response.text()}")
+                            self.metrics.inc('api_errors')
+                            return None
+                        response.raise_for_status()
+                        track = await response.json()
+                self._index_add(track)
+                return track
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt == max_retries - 1:
+                    print(f"Error creating track: {e}")
+                    self.metrics.inc('api_errors')
+                    return None
+                self.metrics.inc('api_retries')
+                print(f"Request failed (attempt {attempt + 1}/{max_retries}): {e}")
+                await asyncio.sleep(retry_delay * (attempt + 1))
+
+    def create_tracks_batch(
+        self,
+        tracks: List[Dict[str, Any]],
+        chunk_size: int = API_BATCH_CHUNK_SIZE
+    ) -> List[Dict[str, Any]]:
+        """
+        Create several tracks with the batch endpoint.
+
+        Tracks are sent in chunks of chunk_size, each chunk being inserted
+        in a single database transaction.
+
+        Args:
+            tracks: List of track data dictionaries (see create_track)
+            chunk_size: Max tracks per request
+
+        Returns:
+            One result per input track, in the same order:
+            {'status': 'created', 'track': {...}} or
+            {'status': 'invalid' | 'failed', 'error': str}
+        """
+        results: List[Dict[str, Any]] = []
+
+        for start in range(0, len(tracks), chunk_size):
+            chunk = tracks[start:start + chunk_size]
+
+            try:
+                response = self._request(
+                    'POST',
+                    f'{self.tracks_endpoint}/batch',
+                    json={'tracks': chunk},
+                    headers={'Content-Type': 'application/json'}
+                )
+                chunk_results = response.json()['results']
+            except Exception as e:
+                # The whole chunk shares one transaction: nothing was inserted
+                print(f"Error creating tracks batch ({len(chunk)} tracks): {e}")
+                results.extend({'status': 'failed', 'error': str(e)} for _ in chunk)
+                continue
+
+            for result in chunk_results:
+                if result.get('status') == 'created':
+                    self._index_add(result['track'])
+                results.append({k: v for k, v in result.items() if k != 'index'})
+
+        return results
+
     def update_track(self, track_id: int, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Update an existing track.
@@ -165,7 +311,11 @@ class TrackAPIClient:
                 json=updates,
                 headers={'Content-Type': 'application/json'}
             )
-            return response.json()
+            track = response.json()
+            if updates.get('title'):
+                # Renamed: the index must answer for the new title only
+                self._index_add({'id': track_id, 'title': (track or {}).get('title') or updates['title']})
+            return track
         except Exception as e:
             print(f"Error updating track {track_id}: {e}")
             return None
@@ -183,27 +333,225 @@ class TrackAPIClient:
         try:
             url = f'{self.tracks_endpoint}/{track_id}'
             self._request('DELETE', url)
+            self._index_remove(track_id)
             return True
         except Exception as e:
             print(f"Error deleting track {track_id}: {e}")
             return False
 
+    def delete_tracks(
+        self,
+        track_ids: Optional[Iterable[int]] = None,
+        category_id: Optional[str] = None,
+        workers: int = API_DELETE_WORKERS,
+        chunk_size: int = API_DELETE_CHUNK_SIZE
+    ) -> List[int]:
+        """
+        Delete many tracks with the bulk endpoint.
+
+        Each request deletes its tracks in a single transaction. Servers
+        without the endpoint get one DELETE per track instead, `workers` at
+        a time: they answer 404/405, or 400 when /batch is routed to the
+        single-track handler as an invalid ID. The outcome is remembered
+        for the following calls.
+
+        Args:
+            track_ids: Tracks to delete
+            category_id: Delete the tracks of this category (only those in
+                track_ids when both are given)
+            workers: Concurrent requests of the fallback
+            chunk_size: Max IDs per bulk request
+
+        Returns:
+            IDs of the deleted tracks
+
+        Raises:
+            ValueError: If neither track_ids nor category_id is given
+        """
+        if track_ids is None and category_id is None:
+            raise ValueError("delete_tracks() needs track_ids and/or category_id")
+
+        ids = [int(track_id) for track_id in track_ids] if track_ids is not None else None
+        chunks = [ids[start:start + chunk_size] for start in range(0, len(ids), chunk_size)] if ids is not None else [None]
+
+        if self._bulk_delete is False:
+            return self._delete_each(ids, category_id, workers)
+
+        deleted: List[int] = []
+        for chunk in chunks:
+            if chunk is not None and not chunk:
+                continue
+
+            body: Dict[str, Any] = {}
+            if chunk is not None:
+                body['ids'] = chunk
+            if category_id:
+                body['categoryId'] = category_id
+
+            try:
+                response = self._request(
+                    'DELETE',
+                    f'{self.tracks_endpoint}/batch',
+                    json=body,
+                    headers={'Content-Type': 'application/json'}
+                )
+            except requests.exceptions.HTTPError as e:
+                status = e.response.status_code if e.response is not None else None
+                # A 400 once the endpoint answered is a real error, not a missing route
+                if status in (404, 405) or (status == 400 and self._bulk_delete is None):
+                    self._bulk_delete = False
+                    print("Bulk delete endpoint not available, deleting tracks one by one")
+                    return deleted + self._delete_each(ids, category_id, workers, exclude=set(deleted))
+                print(f"Error deleting tracks: {e}")
+                break
+            except Exception as e:
+                print(f"Error deleting tracks: {e}")
+                break
+
+            self._bulk_delete = True
+            for track_id in response.json()['ids']:
+                self._index_remove(track_id)
+                deleted.append(track_id)
+
+        return deleted
+
+    def _delete_each(
+        self,
+        track_ids: Optional[List[int]],
+        category_id: Optional[str],
+        workers: int,
+        exclude: Optional[set] = None
+    ) -> List[int]:
+        """Delete tracks with one request each (fallback of delete_tracks)."""
+        if category_id:
+            tracks = [track for track in self.get_tracks() if track.get('categoryId') == category_id]
+            in_category = {track['id'] for track in tracks}
+            track_ids = [i for i in track_ids if i in in_category] if track_ids is not None else sorted(in_category)
+
+        pending = [track_id for track_id in track_ids if track_id not in (exclude or set())]
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            results = pool.map(self.delete_track, pending)
+            return [track_id for track_id, ok in zip(pending, results) if ok]
+
+    @staticmethod
+    def normalize_title(title: str) -> str:
+        """
+        Normalize a title for existence checks.
+
+        Args:
+            title: Track title
+
+        Returns:
+            Lowercased, stripped title
+        """
+        return (title or '').lower().strip()
+
+    def load_title_index(self, refresh: bool = False) -> Optional[Dict[str, int]]:
+        """
+        Load the normalized title -> track ID index.
+
+        The track list is fetched once and then kept up to date locally by
+        create_track() and delete_track(). Pass refresh=True to reload it
+        after the database was changed by something else.
+
+        Args:
+            refresh: Reload from the API even if already loaded
+
+        Returns:
+            Title index, or None if the API could not be reached
+        """
+        with self._index_lock:
+            if self._title_index is not None and not refresh:
+                return self._title_index
+
+            try:
+                response = self._request('GET', self.tracks_endpoint)
+                tracks = response.json()
+            except Exception as e:
+                print(f"Error fetching tracks: {e}")
+                return None
+
+            self._title_index = {}
+            self._index_titles = {}
+            self._title_ids = {}
+            for track in tracks:
+                self._index(track.get('id'), track.get('title', ''))
+            return self._title_index
+
+    def refresh_title_index(self) -> Optional[Dict[str, int]]:
+        """
+        Reload the title index from the API.
+
+        Returns:
+            Title index, or None if the API could not be reached
+        """
+        return self.load_title_index(refresh=True)
+
+    def _index_add(self, track: Dict[str, Any]):
+        """Record a newly created track in the loaded title index."""
+        with self._index_lock:
+            if self._title_index is not None and track.get('title'):
+                # An updated track may have been renamed
+                self._unindex(track.get('id'))
+                self._index(track.get('id'), track['title'])
+
+    def _index_remove(self, track_id: int):
+        """Drop a deleted track from the loaded title index."""
+        with self._index_lock:
+            if self._title_index is not None:
+                self._unindex(track_id)
+
+    def _index(self, track_id: int, title: str):
+        """Add a track's title to the index (lock held)."""
+        title = self.normalize_title(title)
+        self._title_index[title] = track_id
+        self._index_titles[track_id] = title
+        self._title_ids.setdefault(title, []).append(track_id)
+
+    def _unindex(self, track_id: int):
+        """Remove a track's title from the index, unless another track has it (lock held)."""
+        title = self._index_titles.pop(track_id, None)
+        if title is None:
+            return
+        ids = self._title_ids.get(title, [])
+        if track_id in ids:
+            ids.remove(track_id)
+        if ids:
+            self._title_index[title] = ids[-1]
+        else:
+            self._title_ids.pop(title, None)
+            self._title_index.pop(title, None)
+
+    def find_track(self, title: str) -> Optional[int]:
+        """
+        Find the track with the given title.
+
+        Uses the title index, loading it on first call.
+
+        Args:
+            title: Track title to look up (case-insensitive)
+
+        Returns:
+            Track ID, or None if there is no such track
+        """
+        index = self.load_title_index()
+        if index is None:
+            return None
+        return index.get(self.normalize_title(title))
+
     def track_exists(self, title: str) -> bool:
         """
         Check if a track with the given title exists.
 
+        Uses the title index, loading it on first call.
+
         Args:
             title: Track title to check (case-insensitive)
 
         Returns:
             True if track exists, False otherwise
         """
-        tracks = self.get_tracks()
-        normalized_title = title.lower().strip()
-        return any(
-            track.get('title', '').lower().strip() == normalized_title
-            for track in tracks
-        )
+        return self.find_track(title) is not None
 
     def get_categories(self) -> List[Dict[str, Any]]:
         """
@@ -0,0 +1,168 @@
+"""
+Audio transcoding with FFmpeg.
+Functions here run in worker processes, so they only take picklable
+arguments and never print progress themselves.
+"""
+
+import json
+import subprocess
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Encoding profile used when none is given
+DEFAULT_PROFILE = {'codec': 'libmp3lame', 'bitrate': '192k', 'ext': 'mp3', 'sample_rate': 44100}
+
+
+def _run_ffmpeg(cmd: list, timeout: Optional[float]) -> str:
+    """
+    Run an FFmpeg command.
+
+    Args:
+        cmd: Command line
+        timeout: Max run time in seconds
+
+    Returns:
+        FFmpeg stderr output
+
+    Raises:
+        RuntimeError: If FFmpeg fails or times out
+    """
+    try:
+        return subprocess.run(cmd, check=True, capture_output=True, text=True, timeout=timeout).stderr
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"FFmpeg failed: {e.stderr.strip() or e}")
+    except (subprocess.TimeoutExpired, OSError) as e:
+        raise RuntimeError(f"FFmpeg failed: {e}")
+
+
+def _loudnorm_filter(target: Dict[str, float], **extra) -> str:
+    """Build a loudnorm filter string (target is {'I', 'TP', 'LRA'})."""
+    options = {'I': target['I'], 'TP': target['TP'], 'LRA': target['LRA'], **extra}
+    return 'loudnorm=' + ':'.join(f'{name}={value}' for name, value in options.items())
+
+
+def measure_loudness(
+    source: str,
+    target: Dict[str, float],
+    ffmpeg_path: Optional[str] = None,
+    timeout: Optional[float] = None
+) -> Dict[str, float]:
+    """
+    Measure EBU R128 loudness (first loudnorm pass).
+
+    Args:
+        source: Input file path
+        target: Loudness target {'I': LUFS, 'TP': dBTP, 'LRA': LU}
+        ffmpeg_path: Path to ffmpeg executable (default: "ffmpeg" from PATH)
+        timeout: Max analysis time in seconds
+
+    Returns:
+        Measured values: input_i, input_tp, input_lra, input_thresh, target_offset
+
+    Raises:
+        RuntimeError: If FFmpeg fails or prints no measurement
+    """
+    cmd = [
+        ffmpeg_path or 'ffmpeg',
+        '-hide_banner',
+        '-nostats',
+        '-i', source,
+        '-vn',
+        '-af', _loudnorm_filter(target, print_format='json'),
+        '-f', 'null', '-',
+    ]
+    stderr = _run_ffmpeg(cmd, timeout)
+
+    # The measurement is the last JSON object FFmpeg prints
+    start, end = stderr.rfind('{'), stderr.rfind('}')
+    if start < 0 or end < start:
+        raise RuntimeError("FFmpeg printed no loudness measurement")
+
+    try:
+        measured = json.loads(stderr[start:end + 1])
+        return {
+            name: float(measured[name])
+            for name in ('input_i', 'input_tp', 'input_lra', 'input_thresh', 'target_offset')
+        }
+    except (ValueError, KeyError) as e:
+        raise RuntimeError(f"Invalid loudness measurement: {e}")
+
+
+def transcode_audio(
+    source: str,
+    output: str,
+    ffmpeg_path: Optional[str] = None,
+    profile: Optional[Dict[str, Any]] = None,
+    loudnorm: Optional[Dict[str, float]] = None,
+    timeout: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    Encode an audio/video file with an encoding profile.
+
+    With a loudness target, the file is measured first and then encoded
+    with linear normalization to that target (two-pass EBU R128), so all
+    themes play at the same volume.
+
+    Args:
+        source: Input file path (any format FFmpeg reads)
+        output: Output file path (extension should match the profile)
+        ffmpeg_path: Path to ffmpeg executable (default: "ffmpeg" from PATH)
+        profile: Encoding profile {'codec', 'bitrate', 'ext', 'sample_rate'} (see AUDIO_PROFILES)
+        loudnorm: Loudness target {'I', 'TP', 'LRA'}, or None to keep the source volume
+        timeout: Max time in seconds for each FFmpeg pass
+
+    Returns:
+        Encode settings and loudness: {'output', 'codec', 'bitrate',
+        'sample_rate', 'loudness': {'measured', 'target'} or None}
+
+    Raises:
+        RuntimeError: If FFmpeg fails or times out
+    """
+    profile = profile or DEFAULT_PROFILE
+    output_path = Path(output)
+    temp_path = output_path.with_name(output_path.stem + '.encoding' + output_path.suffix)
+
+    loudness = None
+    filters = []
+    if loudnorm:
+        measured = measure_loudness(source, loudnorm, ffmpeg_path, timeout)
+        filters = ['-af', _loudnorm_filter(
+            loudnorm,
+            measured_I=measured['input_i'],
+            measured_TP=measured['input_tp'],
+            measured_LRA=measured['input_lra'],
+            measured_thresh=measured['input_thresh'],
+            offset=measured['target_offset'],
+            linear='true',
+        )]
+        loudness = {'measured': measured, 'target': dict(loudnorm)}
+
+    cmd = [
+        ffmpeg_path or 'ffmpeg',
+        '-y',
+        '-loglevel', 'error',
+        '-i', source,
+        '-vn',
+        *filters,
+        # loudnorm resamples to 192 kHz internally, so the rate is always set
+        '-ar', str(profile['sample_rate']),
+        '-codec:a', profile['codec'],
+        '-b:a', profile['bitrate'],
+        str(temp_path),
+    ]
+
+    try:
+        _run_ffmpeg(cmd, timeout)
+    except RuntimeError:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+    # Atomic rename
+    temp_path.replace(output_path)
+    return {
+        'output': str(output_path),
+        'codec': profile['codec'],
+        'bitrate': profile['bitrate'],
+        'sample_rate': profile['sample_rate'],
+        'loudness': loudness,
+    }
@@ -0,0 +1,116 @@
+"""
+Concurrency budgets shared by threads.
+Caps how many operations of a kind (YouTube downloads, FFmpeg processes)
+run at once across all importers of a process, so categories imported
+concurrently share one budget instead of multiplying it. Budgets are
+registered by name, like rate limiters.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List
+
+
+class Budget:
+    """Counting semaphore with wait statistics."""
+
+    def __init__(self, name: str, size: int):
+        """
+        Initialize budget.
+
+        Args:
+            name: Name used in stats output
+            size: Operations allowed at once
+
+        Raises:
+            ValueError: If size is less than 1
+        """
+        if size < 1:
+            raise ValueError(f"Budget size must be at least 1, got {size}")
+
+        self.name = name
+        self.size = size
+        self.semaphore = threading.BoundedSemaphore(size)
+
+        # Wait statistics
+        self.lock = threading.Lock()
+        self.acquired = 0
+        self.waited = 0
+        self.total_wait = 0.0
+
+    def acquire(self) -> float:
+        """
+        Take a slot, blocking until one is free.
+
+        Returns:
+            Seconds waited
+        """
+        start = time.perf_counter()
+        self.semaphore.acquire()
+        wait = time.perf_counter() - start
+
+        with self.lock:
+            self.acquired += 1
+            if wait > 0.001:
+                self.waited += 1
+                self.total_wait += wait
+        return wait
+
+    def release(self):
+        """Give a slot back."""
+        self.semaphore.release()
+
+    @contextmanager
+    def slot(self):
+        """Hold a slot for the duration of a block."""
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def stats_line(self) -> str:
+        """
+        Format wait statistics for display.
+
+        Returns:
+            Line like "ffmpeg budget (4): 120 slots, 35 waited, 42.0s total"
+        """
+        return (
+            f"{self.name} budget ({self.size}): {self.acquired} slots, "
+            f"{self.waited} waited, {self.total_wait:.1f}s total"
+        )
+
+
+# Shared budgets by name
+_budgets: Dict[str, Budget] = {}
+_budgets_lock = threading.Lock()
+
+
+def get_budget(name: str, size: int) -> Budget:
+    """
+    Get the shared budget for a kind of operation, creating it on first use.
+
+    Args:
+        name: Budget name (e.g. "downloads", "ffmpeg")
+        size: Operations allowed at once (used on creation only)
+
+    Returns:
+        Shared Budget instance
+    """
+    with _budgets_lock:
+        if name not in _budgets:
+            _budgets[name] = Budget(name, size)
+        return _budgets[name]
+
+
+def shared_budgets() -> List[Budget]:
+    """
+    List the shared budgets created so far.
+
+    Returns:
+        Budgets, in creation order
+    """
+    with _budgets_lock:
+        return list(_budgets.values())
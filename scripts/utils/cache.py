@@ -0,0 +1,194 @@
+"""
+Persistent key/value cache backed by a local SQLite file.
+Used to keep API lookups across runs, with per-entry TTL and
+negative caching ("not found" answers are cached too).
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+
+# Marker returned by get() for a cached "not found" entry
+NOT_FOUND = object()
+
+
+class SQLiteCache:
+    """JSON value cache with expiry, safe to share between threads."""
+
+    def __init__(self, path: Path, name: str, ttl: float, negative_ttl: Optional[float] = None):
+        """
+        Initialize cache.
+
+        Args:
+            path: SQLite file path (created if missing)
+            name: Cache name, used as table name and in stats output
+            ttl: Default lifetime of an entry in seconds
+            negative_ttl: Lifetime of "not found" entries (default: ttl)
+        """
+        self.path = Path(path)
+        self.name = name
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl if negative_ttl is not None else ttl
+
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute(
+            f'CREATE TABLE IF NOT EXISTS "{self.name}" ('
+            '  key TEXT PRIMARY KEY,'
+            '  value TEXT,'  # NULL for negative entries
+            '  created_at REAL NOT NULL,'
+            '  expires_at REAL NOT NULL'
+            ')'
+        )
+        self.conn.commit()
+
+    def get(self, key: str) -> Any:
+        """
+        Look up a key.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, NOT_FOUND for a cached negative entry,
+            or None on a miss (absent or expired)
+        """
+        with self.lock:
+            row = self.conn.execute(
+                f'SELECT value, expires_at FROM "{self.name}" WHERE key = ?', (key,)
+            ).fetchone()
+
+            if not row or row[1] < time.time():
+                self.misses += 1
+                return None
+
+            if row[0] is None:
+                self.negative_hits += 1
+                return NOT_FOUND
+
+            self.hits += 1
+            return json.loads(row[0])
+
+    def peek(self, key: str) -> Any:
+        """
+        Look up a key without counting it in the hit rate.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Same as get()
+        """
+        with self.lock:
+            row = self.conn.execute(
+                f'SELECT value, expires_at FROM "{self.name}" WHERE key = ?', (key,)
+            ).fetchone()
+
+        if not row or row[1] < time.time():
+            return None
+        return NOT_FOUND if row[0] is None else json.loads(row[0])
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+            ttl: Lifetime in seconds (default: cache TTL)
+        """
+        self._store(key, json.dumps(value), ttl if ttl is not None else self.ttl)
+
+    def set_not_found(self, key: str, ttl: Optional[float] = None):
+        """
+        Store a negative entry ("not found") for a key.
+
+        Args:
+            key: Cache key
+            ttl: Lifetime in seconds (default: negative TTL)
+        """
+        self._store(key, None, ttl if ttl is not None else self.negative_ttl)
+
+    def _store(self, key: str, value: Optional[str], ttl: float):
+        """Insert or replace an entry."""
+        now = time.time()
+        with self.lock:
+            self.conn.execute(
+                f'INSERT OR REPLACE INTO "{self.name}" (key, value, created_at, expires_at) VALUES (?, ?, ?, ?)',
+                (key, value, now, now + ttl)
+            )
+            self.conn.commit()
+
+    def delete(self, key: str):
+        """
+        Remove an entry.
+
+        Args:
+            key: Cache key
+        """
+        with self.lock:
+            self.conn.execute(f'DELETE FROM "{self.name}" WHERE key = ?', (key,))
+            self.conn.commit()
+
+    def entries(self) -> List[Tuple[str, Any, float, float]]:
+        """
+        List the live (not expired, not negative) entries.
+
+        Returns:
+            List of (key, value, created_at, expires_at), oldest first
+        """
+        with self.lock:
+            rows = self.conn.execute(
+                f'SELECT key, value, created_at, expires_at FROM "{self.name}" '
+                'WHERE value IS NOT NULL AND expires_at >= ? ORDER BY created_at',
+                (time.time(),)
+            ).fetchall()
+        return [(key, json.loads(value), created_at, expires_at) for key, value, created_at, expires_at in rows]
+
+    def purge_expired(self) -> int:
+        """
+        Delete expired entries.
+
+        Returns:
+            Number of entries deleted
+        """
+        with self.lock:
+            cursor = self.conn.execute(f'DELETE FROM "{self.name}" WHERE expires_at < ?', (time.time(),))
+            self.conn.commit()
+            return cursor.rowcount
+
+    def hit_rate(self) -> Tuple[int, int]:
+        """
+        Get lookup counts since the cache was opened.
+
+        Returns:
+            Tuple of (hits including negative hits, total lookups)
+        """
+        hits = self.hits + self.negative_hits
+        return hits, hits + self.misses
+
+    def stats_line(self) -> str:
+        """
+        Format hit rate for display.
+
+        Returns:
+            Line like "omdb cache: 95/100 hits (95.0%), 3 negative"
+        """
+        hits, total = self.hit_rate()
+        rate = (hits / total * 100) if total else 0.0
+        return f"{self.name} cache: {hits}/{total} hits ({rate:.1f}%), {self.negative_hits} negative"
+
+    def close(self):
+        """Close the database connection."""
+        with self.lock:
+            self.conn.close()
@@ -0,0 +1,114 @@
+"""
+Streaming catalog input.
+Reads media items one at a time from JSON Lines (.jsonl/.ndjson) or CSV
+files, so catalogs of any size can be imported with flat memory use.
+"""
+
+import csv
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator
+
+# Catalog formats by file extension
+JSONL_SUFFIXES = ('.jsonl', '.ndjson')
+CSV_SUFFIXES = ('.csv',)
+JSON_SUFFIXES = ('.json',)
+
+# Columns converted from CSV strings
+INT_FIELDS = ('startTime', 'timeLimit')
+
+
+def catalog_format(path: Path) -> str:
+    """
+    Detect a catalog's format from its extension.
+
+    Args:
+        path: Catalog file path
+
+    Returns:
+        "jsonl", "csv" or "json"
+
+    Raises:
+        ValueError: If the extension is not supported
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix in JSONL_SUFFIXES:
+        return 'jsonl'
+    if suffix in CSV_SUFFIXES:
+        return 'csv'
+    if suffix in JSON_SUFFIXES:
+        return 'json'
+    raise ValueError(
+        f"Unsupported catalog format: {path} "
+        f"(expected {', '.join(JSONL_SUFFIXES + CSV_SUFFIXES + JSON_SUFFIXES)})"
+    )
+
+
+def _csv_item(row: Dict[str, str]) -> Dict[str, Any]:
+    """Convert a CSV row to an item (empty cells are left out)."""
+    item = {key.strip(): value.strip() for key, value in row.items() if key and value and value.strip()}
+    for key in INT_FIELDS:
+        if key in item:
+            item[key] = int(item[key])
+    return item
+
+
+def iter_catalog(path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Read catalog items lazily.
+
+    JSON Lines: one item object per line (blank lines and lines starting
+    with "#" are ignored). CSV: a header row with item fields ("id",
+    "titleVF", "startTime"...). JSON: a file like films_list.json, with
+    an "items" array (loaded at once).
+
+    Args:
+        path: Catalog file path
+
+    Yields:
+        Item dictionaries
+
+    Raises:
+        ValueError: On an unsupported format or an invalid JSON line
+    """
+    path = Path(path)
+    fmt = catalog_format(path)
+
+    if fmt == 'json':
+        with open(path, 'r', encoding='utf-8') as f:
+            yield from json.load(f)['items']
+        return
+
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if fmt == 'csv':
+            for row in csv.DictReader(f):
+                item = _csv_item(row)
+                if item:
+                    yield item
+            return
+
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path.name}:{line_number}: invalid JSON ({e})")
+
+
+def count_catalog(path: Path) -> int:
+    """
+    Count catalog items without keeping them in memory.
+
+    Args:
+        path: Catalog file path
+
+    Returns:
+        Number of items
+    """
+    if catalog_format(path) == 'jsonl':
+        # Lines are counted, not parsed
+        with open(path, 'r', encoding='utf-8') as f:
+            return sum(1 for line in f if line.strip() and not line.lstrip().startswith('#'))
+    return sum(1 for _ in iter_catalog(path))
@@ -2,6 +2,7 @@
 File management utilities for downloads and media storage.
 """
 
+import asyncio
 import requests
 from pathlib import Path
 from typing import Optional
@@ -9,8 +10,10 @@ from slugify import slugify
 
 try:
     from scripts.config import AUDIO_DIR, IMAGES_DIR, HTTP_TIMEOUT
+    from scripts.utils.http import get_session
 except ImportError:
     from ..config import AUDIO_DIR, IMAGES_DIR, HTTP_TIMEOUT
+    from .http import get_session
 
 
 def ensure_directories_exist(audio_dir: Optional[Path] = None, images_dir: Optional[Path] = None):
@@ -45,7 +48,7 @@ def download_image(url: str, output_path: Path) -> Optional[str]:
         return f"/images/{output_path.name}"
 
     try:
-        response = requests.get(url, timeout=HTTP_TIMEOUT, stream=True)
+        response = get_session().get(url, timeout=HTTP_TIMEOUT, stream=True)
         response.raise_for_status()
 
         # Write to temporary file first
@@ -71,6 +74,65 @@ def download_image(url: str, output_path: Path) -> Optional[str]:
         return None
 
 
+async def download_image_async(session, url: str, output_path: Path) -> Optional[str]:
+    """
+    Download image from URL from a coroutine.
+
+    Args:
+        session: aiohttp.ClientSession
+        url: Image URL
+        output_path: Output file path
+
+    Returns:
+        Same as download_image()
+    """
+    import aiohttp
+
+    if output_path.exists():
+        print(f"  -> Image already exists: {output_path.name}")
+        return f"/images/{output_path.name}"
+
+    temp_path = output_path.with_suffix('.tmp')
+
+    try:
+        async with session.get(url) as response:
+            response.raise_for_status()
+
+            # Write to temporary file first
+            with open(temp_path, 'wb') as f:
+                async for chunk in response.content.iter_chunked(8192):
+                    f.write(chunk)
+
+        # Atomic rename
+        temp_path.rename(output_path)
+
+        print(f"  [OK] Image downloaded: {output_path.name}")
+        return f"/images/{output_path.name}"
+
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        print(f"  [FAIL] Image download failed: {e}")
+        if temp_path.exists():
+            temp_path.unlink()
+        return None
+    except Exception as e:
+        print(f"  [FAIL] Unexpected error downloading image: {e}")
+        return None
+
+
+def media_file_path(relative_path: str) -> Path:
+    """
+    Get the local file for a public media path.
+
+    Args:
+        relative_path: Path as stored in a track (e.g., "/audio/filename.mp3")
+
+    Returns:
+        File path in the audio or images directory
+    """
+    folder, _, name = relative_path.lstrip('/').partition('/')
+    return (AUDIO_DIR if folder == 'audio' else IMAGES_DIR) / name
+
+
 def get_file_extension(url: str) -> str:
     """
     Get file extension from URL.
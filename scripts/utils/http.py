@@ -0,0 +1,85 @@
+"""
+Shared HTTP transport.
+Every client mounts the same connection pools (one per host, kept alive
+between requests), so repeated OMDb lookups, poster downloads and API
+calls reuse their TCP/TLS connections instead of opening new ones.
+"""
+
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from typing import Dict, Optional
+
+try:
+    from scripts.config import HTTP_POOL_HOSTS, HTTP_POOL_SIZE
+except ImportError:
+    from ..config import HTTP_POOL_HOSTS, HTTP_POOL_SIZE
+
+# Responses are decompressed by urllib3
+DEFAULT_HEADERS = {
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+}
+
+_adapter: Optional[HTTPAdapter] = None
+_adapter_lock = threading.Lock()
+_local = threading.local()
+
+
+def get_adapter() -> HTTPAdapter:
+    """
+    Get the shared adapter holding the per-host connection pools.
+
+    Returns:
+        HTTPAdapter shared by all sessions (urllib3 pools are thread-safe)
+    """
+    global _adapter
+    with _adapter_lock:
+        if _adapter is None:
+            _adapter = HTTPAdapter(pool_connections=HTTP_POOL_HOSTS, pool_maxsize=HTTP_POOL_SIZE)
+        return _adapter
+
+
+def create_session(headers: Optional[Dict[str, str]] = None) -> requests.Session:
+    """
+    Create a session using the shared connection pools.
+
+    Args:
+        headers: Extra default headers (e.g. Authorization)
+
+    Returns:
+        requests.Session with the shared adapter mounted
+    """
+    session = requests.Session()
+    adapter = get_adapter()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update(DEFAULT_HEADERS)
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Get the calling thread's session for plain requests.
+
+    Sessions keep per-thread state (cookies), while the connection pools
+    behind them are shared.
+
+    Returns:
+        Thread-local requests.Session
+    """
+    session = getattr(_local, 'session', None)
+    if session is None:
+        session = _local.session = create_session()
+    return session
+
+
+def close():
+    """Close all pooled connections."""
+    global _adapter
+    with _adapter_lock:
+        if _adapter is not None:
+            _adapter.close()
+            _adapter = None
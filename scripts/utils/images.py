@@ -0,0 +1,194 @@
+"""
+Poster processing with Pillow.
+Generates resized JPEG/WebP variants and a thumbnail for each stored
+poster, plus a manifest ("<hash>.json") listing them so the app can pick
+the right size. Resizing runs in a process pool, off the import loop.
+"""
+
+import json
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Set
+
+try:
+    from scripts.config import IMAGES_DIR, IMAGE_WIDTHS, IMAGE_THUMB_WIDTH, IMAGE_QUALITY, IMAGE_WORKERS
+except ImportError:
+    from ..config import IMAGES_DIR, IMAGE_WIDTHS, IMAGE_THUMB_WIDTH, IMAGE_QUALITY, IMAGE_WORKERS
+
+# Source images (variants and manifests are skipped)
+SOURCE_SUFFIXES = ('.jpg', '.jpeg', '.png', '.webp')
+# Name suffixes of the generated variants ("-<width>", "-thumb")
+VARIANT_SUFFIXES = tuple(f'-{width}' for width in IMAGE_WIDTHS) + ('-thumb',)
+
+
+def manifest_path(source: Path) -> Path:
+    """Get the manifest file of a source image ("<stem>.json")."""
+    return source.with_suffix('.json')
+
+
+def is_variant(path: Path) -> bool:
+    """
+    Check whether a file is a generated variant of another poster.
+
+    Only the configured suffixes count, and only next to their base poster
+    (or its manifest): uploads ("<name>-<timestamp>") and titles ending in
+    a number ("toy-story-3.jpg") are original posters.
+    """
+    for suffix in VARIANT_SUFFIXES:
+        if path.stem.endswith(suffix):
+            base = path.with_name(path.stem[:-len(suffix)])
+            if manifest_path(base).exists() or any(base.with_suffix(s).exists() for s in SOURCE_SUFFIXES):
+                return True
+    return False
+
+
+def is_source_image(path: Path) -> bool:
+    """Check whether a file is an original poster (not a generated variant)."""
+    return path.suffix.lower() in SOURCE_SUFFIXES and not is_variant(path)
+
+
+def process_poster(
+    source: str,
+    widths: Iterable[int] = IMAGE_WIDTHS,
+    thumb_width: int = IMAGE_THUMB_WIDTH,
+    quality: int = IMAGE_QUALITY
+) -> Dict[str, Any]:
+    """
+    Generate the variants and manifest of a poster.
+
+    Runs in worker processes: only takes picklable arguments and never
+    prints progress itself. Widths larger than the source are skipped.
+
+    Args:
+        source: Poster file path
+        widths: Widths of the resized JPEG and WebP variants
+        thumb_width: Width of the WebP thumbnail
+        quality: JPEG/WebP quality
+
+    Returns:
+        Manifest dictionary (also written next to the poster)
+    """
+    from PIL import Image
+
+    source_path = Path(source)
+    stem = source_path.stem
+    folder = '/images'
+
+    def save(image, width: int, name: str, fmt: str) -> Dict[str, Any]:
+        height = round(image.height * width / image.width)
+        resized = image.resize((width, height), Image.Resampling.LANCZOS)
+        resized.save(source_path.with_name(name), fmt, quality=quality, optimize=True)
+        return {'width': width, 'height': height}
+
+    widths = list(widths)
+    with Image.open(source_path) as original:
+        width, height = original.size
+        # JPEG decoders can scale down while decoding, much cheaper than a full decode
+        original.draft('RGB', (max(widths + [thumb_width]), 1))
+        image = original.convert('RGB')
+
+    variants = []
+    for target in sorted(w for w in widths if w < width):
+        size = save(image, target, f"{stem}-{target}.jpg", 'JPEG')
+        save(image, target, f"{stem}-{target}.webp", 'WEBP')
+        variants.append({
+            **size,
+            'jpeg': f"{folder}/{stem}-{target}.jpg",
+            'webp': f"{folder}/{stem}-{target}.webp",
+        })
+
+    thumbnail = None
+    if thumb_width < width:
+        save(image, thumb_width, f"{stem}-thumb.webp", 'WEBP')
+        thumbnail = f"{folder}/{stem}-thumb.webp"
+
+    manifest = {
+        'source': f"{folder}/{source_path.name}",
+        'width': width,
+        'height': height,
+        'variants': variants,
+        'thumbnail': thumbnail,
+    }
+
+    # Written last, so a manifest means all variants exist
+    output = manifest_path(source_path)
+    temp_path = output.with_suffix('.tmp')
+    temp_path.write_text(json.dumps(manifest), encoding='utf-8')
+    temp_path.replace(output)
+    return manifest
+
+
+class PosterProcessor:
+    """Runs process_poster() for stored posters in a process pool."""
+
+    def __init__(self, directory: Optional[Path] = None, workers: int = IMAGE_WORKERS):
+        """
+        Initialize poster processor.
+
+        Args:
+            directory: Images directory (default from config)
+            workers: Resizing processes
+        """
+        self.directory = Path(directory or IMAGES_DIR)
+        self.workers = workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pending: Set[str] = set()
+        self._lock = threading.Lock()
+
+        self.processed = 0
+        self.failed = 0
+
+    def submit(self, public_path: str, force: bool = False) -> Optional[Future]:
+        """
+        Queue a stored poster for processing.
+
+        Args:
+            public_path: Poster path (e.g., "/images/<hash>.jpg")
+            force: Process again even if the manifest exists
+
+        Returns:
+            Future resolving to the manifest, or None if there is nothing to do
+        """
+        source = self.directory / Path(public_path).name
+        if not source.exists() or (not force and manifest_path(source).exists()):
+            return None
+
+        with self._lock:
+            # Posters are deduplicated by hash, so several items can share one
+            if source.name in self._pending:
+                return None
+            self._pending.add(source.name)
+
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            future = self._pool.submit(process_poster, str(source))
+
+        future.add_done_callback(lambda f: self._on_done(f, source.name))
+        return future
+
+    def _on_done(self, future: Future, name: str):
+        """Count a finished poster."""
+        with self._lock:
+            self._pending.discard(name)
+            if future.exception():
+                self.failed += 1
+                print(f"  [FAIL] Poster processing failed ({name}): {future.exception()}")
+            else:
+                self.processed += 1
+
+    def shutdown(self, wait: bool = True):
+        """
+        Stop the pool.
+
+        Args:
+            wait: Wait for queued posters to finish
+        """
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+    def stats_line(self) -> str:
+        """Format processing counts for display."""
+        return f"Posters: {self.processed} processed, {self.failed} failed"
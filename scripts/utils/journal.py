@@ -0,0 +1,149 @@
+"""
+Import journal: records the stages each item has completed so an
+interrupted import can resume without redoing network work.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+try:
+    from scripts.config import JOURNAL_PATH
+except ImportError:
+    from ..config import JOURNAL_PATH
+
+
+class ImportJournal:
+    """Per-item stage checkpoints stored in a local SQLite file."""
+
+    # Columns that can be set with update()
+    FIELDS = ('metadata', 'audio_path', 'audio_key', 'image_path', 'track_id', 'status')
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Initialize journal.
+
+        Args:
+            path: SQLite file path (default from config)
+        """
+        self.path = Path(path or JOURNAL_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS items ('
+            '  category TEXT NOT NULL,'
+            '  item_id TEXT NOT NULL,'
+            '  metadata TEXT,'      # JSON, set once metadata is resolved
+            '  audio_path TEXT,'
+            '  audio_key TEXT,'     # encoding settings of audio_path (see BaseImporter.audio_settings)
+            '  image_path TEXT,'
+            '  track_id INTEGER,'
+            '  status TEXT,'        # "skipped" or "done" when the item is finished
+            '  updated_at REAL NOT NULL,'
+            '  PRIMARY KEY (category, item_id)'
+            ')'
+        )
+
+        # Journals created before the audio_key column existed
+        columns = [row[1] for row in self.conn.execute('PRAGMA table_info(items)')]
+        if 'audio_key' not in columns:
+            self.conn.execute('ALTER TABLE items ADD COLUMN audio_key TEXT')
+        self.conn.commit()
+
+    def get(self, category: str, item_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the recorded stages of an item.
+
+        Args:
+            category: Category ID
+            item_id: Item identifier
+
+        Returns:
+            Entry dictionary (metadata decoded) or None if unknown
+        """
+        with self.lock:
+            row = self.conn.execute(
+                'SELECT * FROM items WHERE category = ? AND item_id = ?', (category, str(item_id))
+            ).fetchone()
+
+        if not row:
+            return None
+
+        entry = dict(row)
+        entry['metadata'] = json.loads(entry['metadata']) if entry['metadata'] else None
+        return entry
+
+    def update(self, category: str, item_id: str, **fields):
+        """
+        Record completed stages for an item.
+
+        Args:
+            category: Category ID
+            item_id: Item identifier
+            **fields: Columns to set (see FIELDS)
+        """
+        unknown = set(fields) - set(self.FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown journal fields: {', '.join(sorted(unknown))}")
+
+        if 'metadata' in fields and fields['metadata'] is not None:
+            fields['metadata'] = json.dumps(fields['metadata'])
+
+        columns = ', '.join(fields)
+        placeholders = ', '.join('?' for _ in fields)
+        updates = ', '.join(f'{name} = excluded.{name}' for name in fields)
+
+        with self.lock:
+            self.conn.execute(
+                f'INSERT INTO items (category, item_id, {columns}, updated_at) '
+                f'VALUES (?, ?, {placeholders}, ?) '
+                f'ON CONFLICT (category, item_id) DO UPDATE SET {updates}, updated_at = excluded.updated_at',
+                (category, str(item_id), *fields.values(), time.time())
+            )
+            self.conn.commit()
+
+    def clear(self, category: Optional[str] = None) -> int:
+        """
+        Forget recorded items.
+
+        Args:
+            category: Only clear this category (None for all)
+
+        Returns:
+            Number of entries removed
+        """
+        with self.lock:
+            if category:
+                cursor = self.conn.execute('DELETE FROM items WHERE category = ?', (category,))
+            else:
+                cursor = self.conn.execute('DELETE FROM items')
+            self.conn.commit()
+            return cursor.rowcount
+
+    def forget_tracks(self, track_ids: Iterable[int]) -> int:
+        """
+        Forget items whose track was deleted, so they are imported again.
+
+        Args:
+            track_ids: Deleted track IDs
+
+        Returns:
+            Number of entries removed
+        """
+        ids = [(int(track_id),) for track_id in track_ids]
+        with self.lock:
+            before = self.conn.total_changes
+            self.conn.executemany('DELETE FROM items WHERE track_id = ?', ids)
+            self.conn.commit()
+            return self.conn.total_changes - before
+
+    def close(self):
+        """Close the database connection."""
+        with self.lock:
+            self.conn.close()
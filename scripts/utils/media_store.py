@@ -0,0 +1,335 @@
+"""
+Content-addressed media store.
+Files are stored under their content hash, so identical bytes are kept
+once, and a key -> hash index (with reference counts) replaces
+filename-based existence checks.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+try:
+    from scripts.config import AUDIO_DIR, IMAGES_DIR, MEDIA_INDEX_PATH
+except ImportError:
+    from ..config import AUDIO_DIR, IMAGES_DIR, MEDIA_INDEX_PATH
+
+
+def file_hash(path: Path) -> str:
+    """
+    Compute the SHA-256 of a file.
+
+    Args:
+        path: File path
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class MediaStore:
+    """Hash-named files in one public directory, indexed in SQLite."""
+
+    # Hex digits of the hash used in file names
+    NAME_LENGTH = 32
+
+    def __init__(self, kind: str, directory: Path, index_path: Optional[Path] = None):
+        """
+        Initialize media store.
+
+        Args:
+            kind: Public folder name ("audio" or "images"), also the index namespace
+            directory: Local directory served as /<kind>/
+            index_path: SQLite index file (default from config)
+        """
+        self.kind = kind
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        index_path = Path(index_path or MEDIA_INDEX_PATH)
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(str(index_path), check_same_thread=False, timeout=30)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.executescript(
+            'CREATE TABLE IF NOT EXISTS objects ('
+            '  kind TEXT NOT NULL,'
+            '  hash TEXT NOT NULL,'
+            '  filename TEXT NOT NULL,'
+            '  size INTEGER NOT NULL,'
+            '  refcount INTEGER NOT NULL DEFAULT 0,'
+            '  created_at REAL NOT NULL,'
+            '  info TEXT,'  # JSON: encode settings, measured loudness...
+            '  PRIMARY KEY (kind, hash)'
+            ');'
+            'CREATE TABLE IF NOT EXISTS names ('
+            '  kind TEXT NOT NULL,'
+            '  key TEXT NOT NULL,'
+            '  hash TEXT NOT NULL,'
+            '  PRIMARY KEY (kind, key)'
+            ');'
+        )
+
+        # Indexes created before the info column existed
+        columns = [row[1] for row in self.conn.execute('PRAGMA table_info(objects)')]
+        if 'info' not in columns:
+            self.conn.execute('ALTER TABLE objects ADD COLUMN info TEXT')
+        self.conn.commit()
+
+    def public_path(self, filename: str) -> str:
+        """Get the public path of a stored file (e.g., "/audio/<hash>.mp3")."""
+        return f"/{self.kind}/{filename}"
+
+    def lookup(self, key: str) -> Optional[str]:
+        """
+        Find the stored file for a key.
+
+        Args:
+            key: Media key (see BaseImporter.media_key)
+
+        Returns:
+            Public path, or None if the key is unknown or its file is gone
+            (the stale rows are then dropped, so the file is stored again)
+        """
+        with self.lock:
+            row = self.conn.execute(
+                'SELECT o.filename, o.hash FROM names n JOIN objects o ON o.kind = n.kind AND o.hash = n.hash '
+                'WHERE n.kind = ? AND n.key = ?',
+                (self.kind, key)
+            ).fetchone()
+            if row and not (self.directory / row[0]).exists():
+                # Store wiped or partially restored: forget the file and every key mapped to it
+                self.conn.execute('DELETE FROM names WHERE kind = ? AND hash = ?', (self.kind, row[1]))
+                self.conn.execute('DELETE FROM objects WHERE kind = ? AND hash = ?', (self.kind, row[1]))
+                self.conn.commit()
+                return None
+        return self.public_path(row[0]) if row else None
+
+    def info(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get what was recorded about the stored file for a key.
+
+        Args:
+            key: Media key
+
+        Returns:
+            Info dictionary (e.g., encode settings and loudness for audio),
+            or None if the key is unknown or nothing was recorded
+        """
+        with self.lock:
+            row = self.conn.execute(
+                'SELECT o.info FROM names n JOIN objects o ON o.kind = n.kind AND o.hash = n.hash '
+                'WHERE n.kind = ? AND n.key = ?',
+                (self.kind, key)
+            ).fetchone()
+        return json.loads(row[0]) if row and row[0] else None
+
+    def ingest(self, key: str, source: Path, info: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Move a downloaded file into the store and map key to it.
+
+        If a file with the same content is already stored, the source is
+        deleted and the existing file is reused.
+
+        Args:
+            key: Media key
+            source: Downloaded file (moved or deleted)
+            info: Details to record with the file (JSON-serializable)
+
+        Returns:
+            Public path of the stored file
+        """
+        source = Path(source)
+        digest = file_hash(source)
+        filename = f"{digest[:self.NAME_LENGTH]}{source.suffix}"
+        target = self.directory / filename
+
+        with self.lock:
+            row = self.conn.execute(
+                'SELECT filename FROM objects WHERE kind = ? AND hash = ?', (self.kind, digest)
+            ).fetchone()
+
+            if row and (self.directory / row[0]).exists():
+                filename = row[0]
+                source.unlink()
+            else:
+                source.replace(target)
+                self.conn.execute(
+                    'INSERT OR REPLACE INTO objects (kind, hash, filename, size, refcount, created_at, info) '
+                    'VALUES (?, ?, ?, ?, COALESCE((SELECT refcount FROM objects WHERE kind = ? AND hash = ?), 0), ?, ?)',
+                    (
+                        self.kind, digest, filename, target.stat().st_size, self.kind, digest, time.time(),
+                        json.dumps(info) if info else None
+                    )
+                )
+
+            previous = self.conn.execute(
+                'SELECT hash FROM names WHERE kind = ? AND key = ?', (self.kind, key)
+            ).fetchone()
+
+            if not previous or previous[0] != digest:
+                self.conn.execute(
+                    'UPDATE objects SET refcount = refcount + 1 WHERE kind = ? AND hash = ?', (self.kind, digest)
+                )
+                self.conn.execute(
+                    'INSERT OR REPLACE INTO names (kind, key, hash) VALUES (?, ?, ?)', (self.kind, key, digest)
+                )
+                if previous:
+                    self._unref(previous[0])
+
+            self.conn.commit()
+
+        return self.public_path(filename)
+
+    def release(self, key: str) -> bool:
+        """
+        Remove a key, deleting its file when no other key uses it.
+
+        Args:
+            key: Media key
+
+        Returns:
+            True if the key existed
+        """
+        with self.lock:
+            row = self.conn.execute(
+                'SELECT hash FROM names WHERE kind = ? AND key = ?', (self.kind, key)
+            ).fetchone()
+            if not row:
+                return False
+
+            self.conn.execute('DELETE FROM names WHERE kind = ? AND key = ?', (self.kind, key))
+            self._unref(row[0])
+            self.conn.commit()
+            return True
+
+    def release_item(self, key: str, keep: Iterable[str] = ()) -> int:
+        """
+        Remove a media key and the keys derived from it.
+
+        Derived keys add a clip window or an encoding profile to the item
+        key ("<key>@58-92#opus-64", see BaseImporter.audio_key).
+
+        Args:
+            key: Item media key (see BaseImporter.media_key)
+            keep: Public paths still in use: keys mapped to them are kept
+
+        Returns:
+            Number of keys removed
+        """
+        keep = set(keep)
+        with self.lock:
+            rows = self.conn.execute(
+                'SELECT n.key, n.hash, o.filename FROM names n JOIN objects o ON o.kind = n.kind AND o.hash = n.hash '
+                'WHERE n.kind = ? AND (n.key = ? OR substr(n.key, 1, ?) IN (?, ?))',
+                (self.kind, key, len(key) + 1, f"{key}#", f"{key}@")
+            ).fetchall()
+            rows = [row for row in rows if self.public_path(row[2]) not in keep]
+            for name, digest, _ in rows:
+                self.conn.execute('DELETE FROM names WHERE kind = ? AND key = ?', (self.kind, name))
+                self._unref(digest)
+            self.conn.commit()
+        return len(rows)
+
+    def release_file(self, public_path: str) -> int:
+        """
+        Remove every key mapped to a stored file, deleting the file.
+
+        Args:
+            public_path: Public path of the file (e.g., "/audio/<hash>.mp3")
+
+        Returns:
+            Number of keys removed
+        """
+        with self.lock:
+            row = self.conn.execute(
+                'SELECT hash FROM objects WHERE kind = ? AND filename = ?', (self.kind, Path(public_path).name)
+            ).fetchone()
+            if not row:
+                return 0
+            released = self.conn.execute(
+                'DELETE FROM names WHERE kind = ? AND hash = ?', (self.kind, row[0])
+            ).rowcount
+            # Last reference: _unref() deletes the file and its derived files
+            self.conn.execute('UPDATE objects SET refcount = 1 WHERE kind = ? AND hash = ?', (self.kind, row[0]))
+            self._unref(row[0])
+            self.conn.commit()
+        return released
+
+    def _unref(self, digest: str):
+        """Decrement a file's reference count, deleting it at zero (lock held)."""
+        self.conn.execute(
+            'UPDATE objects SET refcount = refcount - 1 WHERE kind = ? AND hash = ?', (self.kind, digest)
+        )
+        row = self.conn.execute(
+            'SELECT filename, refcount FROM objects WHERE kind = ? AND hash = ?', (self.kind, digest)
+        ).fetchone()
+        if row and row[1] <= 0:
+            # Derived files (poster variants, manifest) share the hash prefix
+            for path in self.directory.glob(f"{Path(row[0]).stem}*"):
+                path.unlink(missing_ok=True)
+            self.conn.execute('DELETE FROM objects WHERE kind = ? AND hash = ?', (self.kind, digest))
+
+    def close(self):
+        """Close the index connection."""
+        with self.lock:
+            self.conn.close()
+
+
+def release_track_media(
+    tracks: Iterable[Dict[str, Any]],
+    remaining: Iterable[Dict[str, Any]],
+    audio_store: Optional[MediaStore] = None,
+    image_store: Optional[MediaStore] = None
+) -> int:
+    """
+    Release the stored files of deleted tracks.
+
+    A file still used by a remaining track is always kept (duplicates,
+    tracks created by hand). Otherwise, tracks with an external ID release
+    their item keys (poster, and every clip/profile of the audio), so a
+    file shared with another item is kept by its reference count; older
+    tracks without one release their files directly.
+
+    Args:
+        tracks: Deleted tracks (API dictionaries)
+        remaining: Every track still in the database (all categories)
+        audio_store: Audio store (default: opened from config)
+        image_store: Image store (default: opened from config)
+
+    Returns:
+        Number of media keys released
+    """
+    stores = {
+        'audioFile': audio_store or MediaStore('audio', AUDIO_DIR),
+        'imageFile': image_store or MediaStore('images', IMAGES_DIR),
+    }
+    in_use = {track[field] for track in remaining for field in stores if track.get(field)}
+
+    released = 0
+    try:
+        for track in tracks:
+            linked = track.get('externalId') and track.get('categoryId')
+            for field, store in stores.items():
+                path = track.get(field)
+                if path in in_use:
+                    continue
+                if linked:
+                    released += store.release_item(f"{track['categoryId']}:{track['externalId']}", keep=in_use)
+                elif path:
+                    released += store.release_file(path)
+    finally:
+        if not audio_store:
+            stores['audioFile'].close()
+        if not image_store:
+            stores['imageFile'].close()
+    return released
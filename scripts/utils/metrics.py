@@ -0,0 +1,232 @@
+"""
+Import instrumentation.
+Records wall-time samples per stage and counters (bytes, retries, cache
+hits...), summarizes them as percentiles and exports JSON reports and
+Prometheus textfiles.
+"""
+
+import json
+import threading
+import time
+from bisect import bisect_right
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Histogram bucket bounds in seconds (Prometheus export)
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+# Prefix of exported Prometheus metric names
+PROMETHEUS_PREFIX = 'blindtest_import'
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile.
+
+    Args:
+        samples: Sorted values
+        pct: Percentile (0-100)
+
+    Returns:
+        Value at the percentile (0.0 without samples)
+    """
+    if not samples:
+        return 0.0
+    rank = max(1, round(pct / 100 * len(samples)))
+    return samples[min(rank, len(samples)) - 1]
+
+
+class Metrics:
+    """Thread-safe timings and counters for one import run."""
+
+    def __init__(self):
+        self.timings: Dict[str, List[float]] = {}
+        self.counters: Dict[str, float] = {}
+        self.lock = threading.Lock()
+
+    def observe(self, name: str, seconds: float):
+        """
+        Add a duration sample.
+
+        Args:
+            name: Timing name (e.g., "metadata", "omdb_request")
+            seconds: Duration
+        """
+        with self.lock:
+            self.timings.setdefault(name, []).append(seconds)
+
+    @contextmanager
+    def timer(self, name: str):
+        """Time a block (works across await in coroutines)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def inc(self, name: str, value: float = 1):
+        """
+        Increment a counter.
+
+        Args:
+            name: Counter name (e.g., "api_retries", "audio_bytes")
+            value: Amount to add
+        """
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def reset(self):
+        """Forget all samples and counters."""
+        with self.lock:
+            self.timings.clear()
+            self.counters.clear()
+
+    def summary(self, buckets: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        Summarize timings.
+
+        Args:
+            buckets: Also include cumulative histogram counts ('buckets',
+                one per BUCKETS bound)
+
+        Returns:
+            {name: {'count', 'sum', 'p50', 'p95', 'p99', 'max'}} in seconds
+        """
+        with self.lock:
+            timings = {name: sorted(samples) for name, samples in self.timings.items()}
+
+        summary = {}
+        for name, samples in timings.items():
+            if not samples:
+                continue
+            summary[name] = {
+                'count': len(samples),
+                'sum': sum(samples),
+                'p50': percentile(samples, 50),
+                'p95': percentile(samples, 95),
+                'p99': percentile(samples, 99),
+                'max': samples[-1],
+            }
+            if buckets:
+                summary[name]['buckets'] = [bisect_right(samples, bound) for bound in BUCKETS]
+        return summary
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Get a JSON-serializable report.
+
+        Returns:
+            {'timings': summary(buckets=True), 'counters': {...}}
+        """
+        with self.lock:
+            counters = dict(self.counters)
+        return {'timings': self.summary(buckets=True), 'counters': counters}
+
+    def summary_lines(self) -> List[str]:
+        """
+        Format timing percentiles for display.
+
+        Returns:
+            Lines like "metadata       n=120   p50=   212ms  p95=  1034ms"
+        """
+        return format_timings(self.summary())
+
+
+def format_timings(timings: Dict[str, Dict[str, Any]]) -> List[str]:
+    """
+    Format timing percentiles for display.
+
+    Args:
+        timings: Metrics.summary() or the 'timings' of Metrics.report()
+
+    Returns:
+        One line per timing, slowest p95 first
+    """
+    ordered = sorted(timings.items(), key=lambda entry: entry[1]['p95'], reverse=True)
+    return [
+        f"{name:<20} n={t['count']:<6} p50={t['p50'] * 1000:7.0f}ms  p95={t['p95'] * 1000:7.0f}ms"
+        for name, t in ordered
+    ]
+
+
+def _label_set(labels: Dict[str, Any], **extra) -> str:
+    """Format Prometheus labels (e.g., '{category="films",stage="audio"}')."""
+    return '{' + ','.join(f'{key}="{value}"' for key, value in {**labels, **extra}.items()) + '}'
+
+
+def _report_runs(runs: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Keep counts, duration and metrics of import stats (errors are not exported)."""
+    return {
+        category: {
+            'stats': {key: stats[key] for key in ('total', 'successful', 'failed', 'skipped', 'duration')},
+            'errors': len(stats.get('errors', [])),
+            'metrics': stats.get('metrics') or {'timings': {}, 'counters': {}},
+        }
+        for category, stats in runs.items()
+    }
+
+
+def write_json_report(path: Path, runs: Dict[str, Dict[str, Any]]):
+    """
+    Write a JSON report.
+
+    Args:
+        path: Output file
+        runs: Import statistics per category, as returned by import_all()
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    report = {'generated_at': time.time(), 'buckets': list(BUCKETS), 'categories': _report_runs(runs)}
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+
+def write_prometheus(path: Path, runs: Dict[str, Dict[str, Any]]):
+    """
+    Write a Prometheus textfile (node_exporter textfile collector format).
+
+    The file is replaced atomically so the collector never reads a partial file.
+
+    Args:
+        path: Output file (should end with ".prom")
+        runs: Import statistics per category, as returned by import_all()
+    """
+    runs = _report_runs(runs)
+    metric = f'{PROMETHEUS_PREFIX}_duration_seconds'
+    lines = [
+        f'# HELP {metric} Wall time of import stages and calls',
+        f'# TYPE {metric} histogram',
+    ]
+    for category, run in runs.items():
+        for name, timing in sorted(run['metrics']['timings'].items()):
+            labels = {'category': category, 'stage': name}
+            for bound, count in zip(BUCKETS, timing['buckets']):
+                lines.append(f'{metric}_bucket{_label_set(labels, le=bound)} {count}')
+            lines.append(f'{metric}_bucket{_label_set(labels, le="+Inf")} {timing["count"]}')
+            lines.append(f'{metric}_sum{_label_set(labels)} {timing["sum"]}')
+            lines.append(f'{metric}_count{_label_set(labels)} {timing["count"]}')
+
+    counters = {category: run['metrics']['counters'] for category, run in runs.items()}
+    for name in sorted({name for values in counters.values() for name in values}):
+        lines.append(f'# TYPE {PROMETHEUS_PREFIX}_{name}_total counter')
+        for category, values in counters.items():
+            if name in values:
+                lines.append(f'{PROMETHEUS_PREFIX}_{name}_total{_label_set({"category": category})} {values[name]}')
+
+    lines.append(f'# TYPE {PROMETHEUS_PREFIX}_items gauge')
+    for category, run in runs.items():
+        for status in ('total', 'successful', 'failed', 'skipped'):
+            labels = _label_set({'category': category}, status=status)
+            lines.append(f'{PROMETHEUS_PREFIX}_items{labels} {run["stats"][status]}')
+
+    lines.append(f'# TYPE {PROMETHEUS_PREFIX}_run_duration_seconds gauge')
+    for category, run in runs.items():
+        labels = _label_set({'category': category})
+        lines.append(f'{PROMETHEUS_PREFIX}_run_duration_seconds{labels} {run["stats"]["duration"]}')
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(path.suffix + '.tmp')
+    temp_path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+    temp_path.replace(path)
@@ -3,37 +3,72 @@ Wrapper for the OMDb API (Open Movie Database).
 Fetches movie/series metadata and posters.
 """
 
+import asyncio
 import requests
-import time
 from typing import Optional, Dict, Any, List
 
 try:
-    from scripts.config import OMDB_API_KEY, OMDB_API_URL, OMDB_RATE_LIMIT_DELAY, HTTP_TIMEOUT
+    from scripts.config import (
+        OMDB_API_KEY, OMDB_API_URL, OMDB_RATE_LIMIT, OMDB_RATE_BURST, HTTP_TIMEOUT,
+        OMDB_CACHE_PATH, OMDB_CACHE_TTL, OMDB_CACHE_NEGATIVE_TTL
+    )
+    from scripts.utils.cache import SQLiteCache, NOT_FOUND
+    from scripts.utils.ratelimit import TokenBucket, get_limiter
+    from scripts.utils.http import get_session
+    from scripts.utils.metrics import Metrics
 except ImportError:
-    from ..config import OMDB_API_KEY, OMDB_API_URL, OMDB_RATE_LIMIT_DELAY, HTTP_TIMEOUT
+    from ..config import (
+        OMDB_API_KEY, OMDB_API_URL, OMDB_RATE_LIMIT, OMDB_RATE_BURST, HTTP_TIMEOUT,
+        OMDB_CACHE_PATH, OMDB_CACHE_TTL, OMDB_CACHE_NEGATIVE_TTL
+    )
+    from .cache import SQLiteCache, NOT_FOUND
+    from .ratelimit import TokenBucket, get_limiter
+    from .http import get_session
+    from .metrics import Metrics
+
+# OMDb errors meaning the lookup has no result (cached as negative entries)
+NOT_FOUND_ERRORS = ('not found', 'incorrect imdb id')
 
 
 class OMDbClient:
     """Client for interacting with the OMDb API."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache: Optional[SQLiteCache] = None,
+        use_cache: bool = True,
+        rate_limiter: Optional[TokenBucket] = None,
+        metrics: Optional[Metrics] = None
+    ):
         """
         Initialize OMDb client.
 
         Args:
             api_key: OMDb API key (default from config)
+            cache: Shared metadata cache (default: SQLite file from config)
+            use_cache: Set to False to always query the API
+            rate_limiter: Token bucket (default: limiter shared by all OMDb clients)
+            metrics: Records request times, rate-limit waits and cache hits (default: a private instance)
         """
         self.api_key = api_key or OMDB_API_KEY
         self.api_url = OMDB_API_URL
-        self.cache = {}
-        self.last_request_time = 0
+        self.cache = cache
+        if self.cache is None and use_cache:
+            self.cache = SQLiteCache(OMDB_CACHE_PATH, 'omdb', OMDB_CACHE_TTL, OMDB_CACHE_NEGATIVE_TTL)
+        self.rate_limiter = rate_limiter or get_limiter('omdb', OMDB_RATE_LIMIT, OMDB_RATE_BURST)
+        self.metrics = metrics or Metrics()
 
-    def _rate_limit(self):
-        """Enforce rate limiting (1 request per second for free tier)."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < OMDB_RATE_LIMIT_DELAY:
-            time.sleep(OMDB_RATE_LIMIT_DELAY - elapsed)
-        self.last_request_time = time.time()
+    def _rate_limit(self) -> float:
+        """
+        Wait for the shared OMDb token bucket (thread-safe).
+
+        Returns:
+            Seconds waited
+        """
+        waited = self.rate_limiter.acquire()
+        self.metrics.observe('omdb_ratelimit_wait', waited)
+        return waited
 
     def _request(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -43,7 +78,8 @@ class OMDbClient:
             params: Query parameters
 
         Returns:
-            Response data dictionary or None on error
+            Response data dictionary, an empty dictionary if OMDb has no
+            result for the query, or None on error
         """
         if not self.api_key:
             raise ValueError("OMDb API key not configured. Set OMDB_API_KEY environment variable.")
@@ -55,20 +91,146 @@ class OMDbClient:
         params['apikey'] = self.api_key
 
         try:
-            response = requests.get(self.api_url, params=params, timeout=HTTP_TIMEOUT)
+            with self.metrics.timer('omdb_request'):
+                response = get_session().get(self.api_url, params=params, timeout=HTTP_TIMEOUT)
             response.raise_for_status()
-            data = response.json()
+            return self._check_response(response.json())
+        except requests.RequestException as e:
+            print(f"OMDb request failed: {e}")
+            self.metrics.inc('omdb_errors')
+            return None
 
-            # Check for API error
-            if data.get('Response') == 'False':
-                error = data.get('Error', 'Unknown error')
-                print(f"OMDb API error: {error}")
-                return None
+    async def _request_async(self, session, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Make request to OMDb API from a coroutine.
 
-            return data
-        except requests.RequestException as e:
+        Args:
+            session: aiohttp.ClientSession
+            params: Query parameters
+
+        Returns:
+            Same as _request()
+        """
+        import aiohttp
+
+        if not self.api_key:
+            raise ValueError("OMDb API key not configured. Set OMDB_API_KEY environment variable.")
+
+        self.metrics.observe('omdb_ratelimit_wait', await self.rate_limiter.acquire_async())
+
+        params = {**params, 'apikey': self.api_key}
+
+        try:
+            with self.metrics.timer('omdb_request'):
+                async with session.get(self.api_url, params=params) as response:
+                    response.raise_for_status()
+                    data = await response.json(content_type=None)
+            return self._check_response(data)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             print(f"OMDb request failed: {e}")
+            self.metrics.inc('omdb_errors')
+            return None
+
+    @staticmethod
+    def _check_response(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Check an OMDb response body for API errors.
+
+        Args:
+            data: Decoded JSON response
+
+        Returns:
+            Same as _request()
+        """
+        if data.get('Response') == 'False':
+            error = data.get('Error', 'Unknown error')
+            print(f"OMDb API error: {error}")
+            if any(e in error.lower() for e in NOT_FOUND_ERRORS):
+                return {}
+            return None
+
+        return data
+
+    def _cache_lookup(self, key: str) -> Any:
+        """
+        Look up a key in the cache.
+
+        Returns:
+            Cached value, NOT_FOUND, or None on a miss (or without cache)
+        """
+        if not self.cache:
+            return None
+
+        value = self.cache.get(key)
+        self.metrics.inc('omdb_cache_hits' if value is not None else 'omdb_cache_misses')
+        return value
+
+    def _cache_store(self, key: str, value: Any):
+        """
+        Store a fetched value: NOT_FOUND is cached as a negative entry,
+        None (transient error) is not cached.
+        """
+        if not self.cache or value is None:
+            return
+        if value is NOT_FOUND:
+            self.cache.set_not_found(key)
+        else:
+            self.cache.set(key, value)
+
+    def _cached(self, key: str, fetch):
+        """
+        Get a value from the cache, calling fetch() on a miss.
+
+        fetch() returns the value to cache, NOT_FOUND to cache a negative
+        entry, or None on a transient error (nothing is cached).
+
+        Args:
+            key: Cache key
+            fetch: Function performing the API lookup
+
+        Returns:
+            Cached or fetched value, or None if not found / on error
+        """
+        cached = self._cache_lookup(key)
+        if cached is NOT_FOUND:
             return None
+        if cached is not None:
+            return cached
+
+        value = fetch()
+        self._cache_store(key, value)
+
+        return None if value is NOT_FOUND else value
+
+    @staticmethod
+    def _normalize(data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert an OMDb response to the standard metadata dictionary.
+
+        Args:
+            data: OMDb response data
+
+        Returns:
+            Standardized metadata dictionary
+        """
+        return {
+            'title': data.get('Title'),
+            'titleVF': None,  # Not provided by OMDb, must be added manually
+            'year': data.get('Year'),
+            'poster_url': data.get('Poster') if data.get('Poster') != 'N/A' else None,
+            'imdb_id': data.get('imdbID'),
+            'type': data.get('Type'),  # "movie" or "series"
+            'plot': data.get('Plot') if data.get('Plot') != 'N/A' else None
+        }
+
+    def cache_stats(self) -> Optional[str]:
+        """
+        Get the cache hit rate line.
+
+        Returns:
+            Stats line, or None if caching is disabled
+        """
+        return self.cache.stats_line() if self.cache else None
 
     def fetch_by_imdb_id(self, imdb_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -89,31 +251,37 @@ class OMDbClient:
                 "plot": str | None
             }
         """
-        # Check cache
-        if imdb_id in self.cache:
-            return self.cache[imdb_id]
+        def fetch():
+            data = self._request({'i': imdb_id})
+            if data is None:
+                return None
+            return self._normalize(data) if data else NOT_FOUND
 
-        params = {'i': imdb_id}
-        data = self._request(params)
+        return self._cached(f'imdb:{imdb_id}', fetch)
 
-        if not data:
-            return None
+    async def fetch_by_imdb_id_async(self, session, imdb_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch movie/series data by IMDb ID from a coroutine.
 
-        # Normalize response
-        result = {
-            'title': data.get('Title'),
-            'titleVF': None,  # Not provided by OMDb, must be added manually
-            'year': data.get('Year'),
-            'poster_url': data.get('Poster') if data.get('Poster') != 'N/A' else None,
-            'imdb_id': data.get('imdbID'),
-            'type': data.get('Type'),  # "movie" or "series"
-            'plot': data.get('Plot') if data.get('Plot') != 'N/A' else None
-        }
+        Args:
+            session: aiohttp.ClientSession
+            imdb_id: IMDb ID (e.g., "tt0111161")
 
-        # Cache result
-        self.cache[imdb_id] = result
+        Returns:
+            Same as fetch_by_imdb_id()
+        """
+        key = f'imdb:{imdb_id}'
+        cached = self._cache_lookup(key)
+        if cached is NOT_FOUND:
+            return None
+        if cached is not None:
+            return cached
 
-        return result
+        data = await self._request_async(session, {'i': imdb_id})
+        value = None if data is None else (self._normalize(data) if data else NOT_FOUND)
+        self._cache_store(key, value)
+
+        return None if value is NOT_FOUND else value
 
     def fetch_by_title(self, title: str, year: Optional[int] = None) -> Optional[Dict[str, Any]]:
         """
@@ -130,25 +298,21 @@ class OMDbClient:
         if year:
             params['y'] = str(year)
 
-        data = self._request(params)
-
-        if not data:
-            return None
+        def fetch():
+            data = self._request(params)
+            if data is None:
+                return None
+            return self._normalize(data) if data else NOT_FOUND
 
-        # Normalize response (same as fetch_by_imdb_id)
-        result = {
-            'title': data.get('Title'),
-            'titleVF': None,
-            'year': data.get('Year'),
-            'poster_url': data.get('Poster') if data.get('Poster') != 'N/A' else None,
-            'imdb_id': data.get('imdbID'),
-            'type': data.get('Type'),
-            'plot': data.get('Plot') if data.get('Plot') != 'N/A' else None
-        }
+        result = self._cached(f"title:{title.lower().strip()}|{year or ''}", fetch)
 
-        # Cache by IMDb ID if available
-        if result['imdb_id']:
-            self.cache[result['imdb_id']] = result
+        # Also cache by IMDb ID if available (only when missing or stale,
+        # to keep cache hits free of writes)
+        if result and result['imdb_id'] and self.cache:
+            imdb_key = f"imdb:{result['imdb_id']}"
+            cached = self.cache.peek(imdb_key)
+            if cached is None or cached is NOT_FOUND:
+                self.cache.set(imdb_key, result)
 
         return result
 
@@ -162,19 +326,22 @@ class OMDbClient:
         Returns:
             List of search result dictionaries
         """
-        params = {'s': query}
-        data = self._request(params)
-
-        if not data or 'Search' not in data:
-            return []
-
-        return [
-            {
-                'title': item.get('Title'),
-                'year': item.get('Year'),
-                'imdb_id': item.get('imdbID'),
-                'type': item.get('Type'),
-                'poster_url': item.get('Poster') if item.get('Poster') != 'N/A' else None
-            }
-            for item in data['Search']
-        ]
+        def fetch():
+            data = self._request({'s': query})
+            if data is None:
+                return None
+            if 'Search' not in data:
+                return NOT_FOUND
+
+            return [
+                {
+                    'title': item.get('Title'),
+                    'year': item.get('Year'),
+                    'imdb_id': item.get('imdbID'),
+                    'type': item.get('Type'),
+                    'poster_url': item.get('Poster') if item.get('Poster') != 'N/A' else None
+                }
+                for item in data['Search']
+            ]
+
+        return self._cached(f"search:{query.lower().strip()}", fetch) or []
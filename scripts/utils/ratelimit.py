@@ -0,0 +1,138 @@
+"""
+Token-bucket rate limiter shared by threads and asyncio tasks.
+Limiters are registered by name so every client talking to the same
+upstream draws from the same bucket.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Dict, List
+
+
+class TokenBucket:
+    """Token bucket allowing `rate` requests per second with bursts of `burst`."""
+
+    def __init__(self, rate: float, burst: int = 1, name: str = 'ratelimit'):
+        """
+        Initialize rate limiter.
+
+        Args:
+            rate: Tokens added per second
+            burst: Bucket capacity (requests allowed back to back)
+            name: Name used in stats output
+        """
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}")
+        if burst < 1:
+            raise ValueError(f"Burst must be at least 1, got {burst}")
+
+        self.rate = rate
+        self.burst = burst
+        self.name = name
+
+        self.tokens = float(burst)
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+        # Wait statistics
+        self.acquired = 0
+        self.waited = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _reserve(self) -> float:
+        """
+        Take one token, going into debt if the bucket is empty.
+
+        Callers that get a token "in debt" sleep until it is paid back,
+        so concurrent callers are served in reservation order.
+
+        Returns:
+            Seconds the caller must wait before proceeding
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            self.tokens -= 1
+
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+            self.acquired += 1
+            if wait > 0:
+                self.waited += 1
+                self.total_wait += wait
+                self.max_wait = max(self.max_wait, wait)
+
+            return wait
+
+    def acquire(self) -> float:
+        """
+        Block the calling thread until a request is allowed.
+
+        Returns:
+            Seconds waited
+        """
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """
+        Wait (without blocking the event loop) until a request is allowed.
+
+        Returns:
+            Seconds waited
+        """
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def stats_line(self) -> str:
+        """
+        Format wait statistics for display.
+
+        Returns:
+            Line like "omdb rate limit: 100 requests, 95 waited, 94.2s total (max 1.0s)"
+        """
+        return (
+            f"{self.name} rate limit: {self.acquired} requests, {self.waited} waited, "
+            f"{self.total_wait:.1f}s total (max {self.max_wait:.1f}s)"
+        )
+
+
+# Shared limiters by upstream name
+_limiters: Dict[str, TokenBucket] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(name: str, rate: float, burst: int = 1) -> TokenBucket:
+    """
+    Get the shared limiter for an upstream, creating it on first use.
+
+    Args:
+        name: Upstream name (e.g. "omdb")
+        rate: Requests per second (used on creation only)
+        burst: Burst size (used on creation only)
+
+    Returns:
+        Shared TokenBucket instance
+    """
+    with _limiters_lock:
+        if name not in _limiters:
+            _limiters[name] = TokenBucket(rate, burst, name)
+        return _limiters[name]
+
+
+def shared_limiters() -> List[TokenBucket]:
+    """
+    List the shared limiters created so far.
+
+    Returns:
+        Limiters, in creation order
+    """
+    with _limiters_lock:
+        return list(_limiters.values())
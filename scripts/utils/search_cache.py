@@ -0,0 +1,145 @@
+"""
+Persistent YouTube search cache.
+Remembers which video a search query resolved to, so a re-download (after
+a wipe, or on a new machine) goes straight to the video URL instead of
+running the ytsearch again. Entries can be pinned to force a video.
+"""
+
+import re
+from typing import Any, Dict, List, Optional
+
+try:
+    from scripts.config import YOUTUBE_CACHE_PATH, YOUTUBE_CACHE_TTL
+    from scripts.utils.cache import SQLiteCache
+except ImportError:
+    from ..config import YOUTUBE_CACHE_PATH, YOUTUBE_CACHE_TTL
+    from .cache import SQLiteCache
+
+# Pinned entries never expire in practice (100 years)
+PIN_TTL = 100 * 365 * 24 * 3600
+
+# Video ID in watch, short and embed URLs (or a bare 11-character ID)
+VIDEO_ID_PATTERN = re.compile(r'(?:v=|youtu\.be/|/embed/|/shorts/|^)([A-Za-z0-9_-]{11})(?:[?&#/]|$)')
+
+
+def video_id_from_url(url: str) -> Optional[str]:
+    """
+    Extract the video ID of a YouTube URL.
+
+    Args:
+        url: Video URL (watch, youtu.be, embed, shorts) or bare video ID
+
+    Returns:
+        11-character video ID, or None if the URL has none
+    """
+    match = VIDEO_ID_PATTERN.search(url.strip())
+    return match.group(1) if match else None
+
+
+def video_url(video_id: str) -> str:
+    """Build the watch URL of a video."""
+    return f"https://www.youtube.com/watch?v={video_id}"
+
+
+class YouTubeSearchCache:
+    """Search query -> video cache on top of SQLiteCache, with pinned entries."""
+
+    def __init__(self, cache: Optional[SQLiteCache] = None):
+        """
+        Initialize search cache.
+
+        Args:
+            cache: Backing cache (default: SQLite file from config)
+        """
+        self.cache = cache or SQLiteCache(YOUTUBE_CACHE_PATH, 'youtube_search', YOUTUBE_CACHE_TTL)
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """Case- and whitespace-insensitive cache key of a query."""
+        return ' '.join(query.lower().split())
+
+    def get(self, query: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up the video a query resolved to.
+
+        Args:
+            query: YouTube search query
+
+        Returns:
+            {'id', 'url', 'title', 'pinned'}, or None on a miss
+        """
+        entry = self.cache.get(self.normalize_query(query))
+        return entry if isinstance(entry, dict) else None
+
+    def record(self, query: str, info: Dict[str, Any]):
+        """
+        Remember the video chosen by a search, unless the query is pinned.
+
+        Args:
+            query: YouTube search query
+            info: yt-dlp info dictionary of the downloaded video
+        """
+        if not info.get('id'):
+            return
+        current = self.get(query)
+        if current and current.get('pinned'):
+            return
+
+        self.cache.set(self.normalize_query(query), {
+            'id': info['id'],
+            'url': info.get('webpage_url') or video_url(info['id']),
+            'title': info.get('title'),
+            'pinned': False,
+        })
+
+    def pin(self, query: str, url: str, title: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Force the video used for a query (replaces any cached result).
+
+        Args:
+            query: YouTube search query, as printed by the importer
+            url: Video URL or ID
+            title: Optional note shown by list
+
+        Returns:
+            The stored entry
+
+        Raises:
+            ValueError: If no video ID can be read from the URL
+        """
+        video_id = video_id_from_url(url)
+        if not video_id:
+            raise ValueError(f"Not a YouTube video URL or ID: {url}")
+
+        entry = {'id': video_id, 'url': video_url(video_id), 'title': title, 'pinned': True}
+        self.cache.set(self.normalize_query(query), entry, ttl=PIN_TTL)
+        return entry
+
+    def forget(self, query: str):
+        """
+        Remove a query's entry (pinned or not), so the next import searches again.
+
+        Args:
+            query: YouTube search query
+        """
+        self.cache.delete(self.normalize_query(query))
+
+    def entries(self, pinned_only: bool = False) -> List[Dict[str, Any]]:
+        """
+        List the cached queries.
+
+        Args:
+            pinned_only: Only list pinned entries
+
+        Returns:
+            Entries with their 'query', 'created_at' and 'expires_at'
+        """
+        return [
+            {'query': key, **value, 'created_at': created_at, 'expires_at': expires_at}
+            for key, value, created_at, expires_at in self.cache.entries()
+            if not pinned_only or value.get('pinned')
+        ]
+
+    def stats_line(self) -> str:
+        """Format hit rate for display (see SQLiteCache.stats_line)."""
+        return self.cache.stats_line()
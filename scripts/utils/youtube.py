@@ -1,145 +1,483 @@
 """
 YouTube audio downloader using yt-dlp.
-Downloads theme songs and extracts audio to MP3.
+Downloads theme songs and encodes them with an audio profile.
 """
 
+import json
+import threading
+import time
 import yt_dlp
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
 try:
-    from scripts.config import AUDIO_DIR, FFMPEG_PATH, YOUTUBE_DOWNLOAD_TIMEOUT
+    from scripts.config import (
+        AUDIO_DIR, FFMPEG_PATH, YOUTUBE_DOWNLOAD_TIMEOUT,
+        AUDIO_DOWNLOAD_WORKERS, AUDIO_TRANSCODE_WORKERS, AUDIO_TRANSCODE_TIMEOUT,
+        AUDIO_PROFILES, AUDIO_PROFILE, AUDIO_LOUDNORM, LOUDNORM_TARGET,
+        IMPORT_DOWNLOAD_SLOTS, IMPORT_FFMPEG_SLOTS, YOUTUBE_RATE_LIMIT, YOUTUBE_RATE_BURST
+    )
+    from scripts.utils.audio import transcode_audio
+    from scripts.utils.budget import Budget, get_budget
+    from scripts.utils.metrics import Metrics
+    from scripts.utils.ratelimit import TokenBucket, get_limiter
+    from scripts.utils.search_cache import YouTubeSearchCache
 except ImportError:
-    from ..config import AUDIO_DIR, FFMPEG_PATH, YOUTUBE_DOWNLOAD_TIMEOUT
+    from ..config import (
+        AUDIO_DIR, FFMPEG_PATH, YOUTUBE_DOWNLOAD_TIMEOUT,
+        AUDIO_DOWNLOAD_WORKERS, AUDIO_TRANSCODE_WORKERS, AUDIO_TRANSCODE_TIMEOUT,
+        AUDIO_PROFILES, AUDIO_PROFILE, AUDIO_LOUDNORM, LOUDNORM_TARGET,
+        IMPORT_DOWNLOAD_SLOTS, IMPORT_FFMPEG_SLOTS, YOUTUBE_RATE_LIMIT, YOUTUBE_RATE_BURST
+    )
+    from .audio import transcode_audio
+    from .budget import Budget, get_budget
+    from .metrics import Metrics
+    from .ratelimit import TokenBucket, get_limiter
+    from .search_cache import YouTubeSearchCache
+
+# Audio section to download: (start, end) in seconds
+Clip = Tuple[float, float]
 
 
 class YouTubeDownloader:
     """YouTube audio downloader using yt-dlp."""
 
-    def __init__(self, output_dir: Optional[Path] = None, ffmpeg_path: Optional[str] = None):
+    def __init__(
+        self,
+        output_dir: Optional[Path] = None,
+        ffmpeg_path: Optional[str] = None,
+        download_workers: int = AUDIO_DOWNLOAD_WORKERS,
+        transcode_workers: int = AUDIO_TRANSCODE_WORKERS,
+        profile: str = AUDIO_PROFILE,
+        loudnorm: bool = AUDIO_LOUDNORM,
+        metrics: Optional[Metrics] = None,
+        search_cache: Optional[YouTubeSearchCache] = None,
+        use_search_cache: bool = True,
+        download_budget: Optional[Budget] = None,
+        encode_budget: Optional[Budget] = None,
+        rate_limiter: Optional[TokenBucket] = None
+    ):
         """
         Initialize YouTube downloader.
 
         Args:
             output_dir: Output directory for audio files (default from config)
             ffmpeg_path: Path to ffmpeg executable (default from config)
+            download_workers: Concurrent downloads for submit_audio()
+            transcode_workers: Encoding processes for submit_audio()
+            profile: Encoding profile name (see AUDIO_PROFILES)
+            loudnorm: Normalize loudness to LOUDNORM_TARGET (two-pass EBU R128)
+            metrics: Records download/encode times and bytes (default: a private instance)
+            search_cache: Query -> video cache (default: SQLite file from config)
+            use_search_cache: Set to False to always search YouTube
+            download_budget: Downloads allowed at once (default: budget shared
+                by all downloaders, IMPORT_DOWNLOAD_SLOTS)
+            encode_budget: FFmpeg encodes allowed at once (default: budget
+                shared by all downloaders, IMPORT_FFMPEG_SLOTS)
+            rate_limiter: YouTube request limiter (default: limiter shared by
+                all downloaders if YOUTUBE_RATE_LIMIT is set, else none)
         """
         self.output_dir = output_dir or AUDIO_DIR
         self.ffmpeg_path = ffmpeg_path or FFMPEG_PATH
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.metrics = metrics or Metrics()
+
+        self.search_cache = search_cache
+        if self.search_cache is None and use_search_cache:
+            self.search_cache = YouTubeSearchCache()
+
+        # Shared with the downloaders of other categories imported at the same time
+        self.download_budget = download_budget or get_budget('downloads', IMPORT_DOWNLOAD_SLOTS)
+        self.encode_budget = encode_budget or get_budget('ffmpeg', IMPORT_FFMPEG_SLOTS)
+        self.rate_limiter = rate_limiter
+        if self.rate_limiter is None and YOUTUBE_RATE_LIMIT > 0:
+            self.rate_limiter = get_limiter('youtube', YOUTUBE_RATE_LIMIT, YOUTUBE_RATE_BURST)
+
+        self.set_profile(profile, loudnorm)
 
-    def download_audio(self, search_query: str, filename: str) -> Optional[str]:
+        # Pools are created on first submit_audio() call
+        self.download_workers = download_workers
+        self.transcode_workers = transcode_workers
+        self._download_pool: Optional[ThreadPoolExecutor] = None
+        self._transcode_pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+    def set_profile(self, profile: str, loudnorm: Optional[bool] = None):
         """
-        Search YouTube and download audio as MP3.
+        Select the encoding profile for the next downloads.
 
         Args:
-            search_query: YouTube search query
+            profile: Encoding profile name (see AUDIO_PROFILES)
+            loudnorm: Normalize loudness (None keeps the current setting)
+
+        Raises:
+            ValueError: If the profile is unknown
+        """
+        if profile not in AUDIO_PROFILES:
+            raise ValueError(f"Unknown audio profile: {profile} (expected one of: {', '.join(AUDIO_PROFILES)})")
+        self.profile_name = profile
+        self.profile = AUDIO_PROFILES[profile]
+        if loudnorm is not None:
+            self.loudnorm = LOUDNORM_TARGET if loudnorm else None
+
+    def _pools(self) -> tuple[ThreadPoolExecutor, ProcessPoolExecutor]:
+        """Get the download and transcode pools, creating them if needed."""
+        with self._pool_lock:
+            if self._download_pool is None:
+                self._download_pool = ThreadPoolExecutor(
+                    max_workers=self.download_workers, thread_name_prefix='yt-dlp'
+                )
+                self._transcode_pool = ProcessPoolExecutor(max_workers=self.transcode_workers)
+            return self._download_pool, self._transcode_pool
+
+    def shutdown(self, wait: bool = True):
+        """
+        Stop the download and transcode pools.
+
+        Args:
+            wait: Wait for running jobs to finish
+        """
+        with self._pool_lock:
+            if self._download_pool is not None:
+                self._download_pool.shutdown(wait=wait)
+                self._transcode_pool.shutdown(wait=wait)
+                self._download_pool = None
+                self._transcode_pool = None
+
+    @staticmethod
+    def _clip_opts(clip: Optional[Clip]) -> dict:
+        """
+        Build yt-dlp options downloading only part of the audio.
+
+        yt-dlp fetches just the requested section (using HTTP range
+        requests / seeking when the format allows it) and cuts it with FFmpeg.
+
+        Args:
+            clip: (start, end) in seconds, or None for the whole audio
+
+        Returns:
+            Options to merge into ydl_opts
+        """
+        if not clip:
+            return {}
+        return {
+            'download_ranges': yt_dlp.utils.download_range_func(None, [clip]),
+            'force_keyframes_at_cuts': True,
+        }
+
+    def download_source(
+        self,
+        target: str,
+        filename: str,
+        search: bool = True,
+        clip: Optional[Clip] = None
+    ) -> Optional[Path]:
+        """
+        Download the best audio stream without converting it.
+
+        Args:
+            target: Search query (search=True) or video URL
             filename: Output filename (without extension)
+            search: Treat target as a YouTube search query
+            clip: (start, end) in seconds to download only that section
 
         Returns:
-            Relative path to downloaded file (e.g., "/audio/filename.mp3")
-            or None on failure
+            Path to the downloaded source file, or None on failure
         """
-        output_path = self.output_dir / f"{filename}.mp3"
+        return self._fetch_source(target, filename, search, clip)[0]
 
-        # Skip if already exists
-        if output_path.exists():
-            print(f"  -> Audio already exists: {filename}.mp3")
-            return f"/audio/{filename}.mp3"
+    def _fetch_source(
+        self,
+        target: str,
+        filename: str,
+        search: bool,
+        clip: Optional[Clip]
+    ) -> Tuple[Optional[Path], Optional[Dict[str, Any]]]:
+        """
+        Download the best audio stream, also returning the video's info.
 
+        Args:
+            target: Search query (search=True) or video URL
+            filename: Output filename (without extension)
+            search: Treat target as a YouTube search query
+            clip: (start, end) in seconds to download only that section
+
+        Returns:
+            Tuple of (source file path, yt-dlp info of the chosen video),
+            (None, None) on failure
+        """
         ydl_opts = {
             'format': 'bestaudio/best',
-            'postprocessors': [{
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': 'mp3',
-                'preferredquality': '192',
-            }],
-            'outtmpl': str(self.output_dir / filename),
+            'outtmpl': str(self.output_dir / f'{filename}.source.%(ext)s'),
             'quiet': True,
             'no_warnings': True,
-            'default_search': 'ytsearch1',  # Search YouTube, first result
             'socket_timeout': YOUTUBE_DOWNLOAD_TIMEOUT,
+            **self._clip_opts(clip),
         }
+        if search:
+            ydl_opts['default_search'] = 'ytsearch1'
 
-        # Add ffmpeg location if detected
+        # Add ffmpeg location if detected (clip sections are cut by ffmpeg)
         if self.ffmpeg_path:
             ydl_opts['ffmpeg_location'] = str(Path(self.ffmpeg_path).parent)
 
         try:
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                print(f"  -> Searching YouTube: {search_query}")
-                ydl.download([search_query])
+                print(f"  -> {'Searching YouTube' if search else 'Downloading from URL'}: {target}")
+                info = ydl.extract_info(target, download=True)
+
+            # Search results come back as a playlist of one entry
+            if info and info.get('entries'):
+                info = info['entries'][0]
 
-            # Verify file was created
-            if output_path.exists():
-                print(f"  [OK] Audio downloaded: {filename}.mp3")
-                return f"/audio/{filename}.mp3"
-            else:
-                print(f"  [FAIL] Audio file not created: {filename}.mp3")
-                return None
+            for download in (info or {}).get('requested_downloads', []):
+                if download.get('filepath') and Path(download['filepath']).exists():
+                    return Path(download['filepath']), info
+
+            source = next(
+                (p for p in self.output_dir.glob(f'{filename}.source.*') if p.suffix != '.part'),
+                None
+            )
+            return source, (info if source else None)
 
         except yt_dlp.utils.DownloadError as e:
             print(f"  [FAIL] Download error: {e}")
-            return None
-        except Exception as e:
-            print(f"  [FAIL] Unexpected error: {e}")
-            return None
+            return None, None
 
-    def download_from_url(self, url: str, filename: str) -> Optional[str]:
+    def _timed_download(self, target: str, filename: str, search: bool, clip: Optional[Clip]) -> Optional[Path]:
         """
-        Download audio from a specific YouTube URL.
+        Download a source file, recording its time and downloaded bytes.
+
+        Holds a slot of the download budget for the whole download.
+        """
+        self.metrics.observe('download_slot_wait', self.download_budget.acquire())
+        try:
+            return self._budgeted_download(target, filename, search, clip)
+        finally:
+            self.download_budget.release()
+
+    def _youtube_request(self):
+        """Wait for the YouTube rate limiter, if any, before a yt-dlp request."""
+        if self.rate_limiter:
+            self.metrics.observe('youtube_ratelimit_wait', self.rate_limiter.acquire())
+
+    def _budgeted_download(self, target: str, filename: str, search: bool, clip: Optional[Clip]) -> Optional[Path]:
+        """
+        Download a source file (see _timed_download).
+
+        A search query found in the search cache is downloaded from the
+        cached video URL, without searching. A cached video that can no
+        longer be downloaded is forgotten and the query searched again,
+        unless it is pinned.
+        """
+        cached = self.search_cache.get(target) if search and self.search_cache else None
+        if search and self.search_cache:
+            self.metrics.inc('youtube_search_cache_hits' if cached else 'youtube_search_cache_misses')
+
+        source = None
+        if cached:
+            print(f"  -> Cached search result: {cached['url']}{' (pinned)' if cached.get('pinned') else ''}")
+            self._youtube_request()
+            with self.metrics.timer('youtube_download'):
+                source = self.download_source(cached['url'], filename, False, clip)
+            if not source and cached.get('pinned'):
+                print("  [FAIL] Pinned video unavailable, pin another one (scripts/youtube_cache.py pin)")
+            elif not source:
+                self.search_cache.forget(target)
+                cached = None
+
+        if not cached:
+            self._youtube_request()
+            with self.metrics.timer('youtube_download'):
+                source, info = self._fetch_source(target, filename, search, clip)
+            if source and search and info and self.search_cache:
+                self.search_cache.record(target, info)
+
+        if source:
+            self.metrics.inc('youtube_bytes', source.stat().st_size)
+        return source
+
+    def output_name(self, filename: str) -> str:
+        """Get the encoded file name for the downloader's profile (e.g., "theme.opus")."""
+        return f"{filename}.{self.profile['ext']}"
+
+    def _encoded(self, encoding: Dict[str, Any]) -> str:
+        """
+        Record an encode next to its output file.
+
+        The sidecar ("<file>.json") holds the encode settings and measured
+        loudness; the media store picks it up when the file is ingested.
 
         Args:
-            url: YouTube video URL
+            encoding: Result of transcode_audio()
+
+        Returns:
+            Relative path to the encoded file (e.g., "/audio/theme.mp3")
+        """
+        output_path = Path(encoding['output'])
+        encoding = {'profile': self.profile_name, **encoding}
+        del encoding['output']
+        output_path.with_name(output_path.name + '.json').write_text(json.dumps(encoding), encoding='utf-8')
+        return f"/audio/{output_path.name}"
+
+    def _transcode_args(self, source: Path, output_path: Path) -> tuple:
+        """Arguments for transcode_audio() (picklable, for the process pool)."""
+        return (
+            str(source), str(output_path), self.ffmpeg_path,
+            self.profile, self.loudnorm, AUDIO_TRANSCODE_TIMEOUT
+        )
+
+    def submit_audio(
+        self,
+        target: str,
+        filename: str,
+        search: bool = True,
+        clip: Optional[Clip] = None
+    ) -> Future:
+        """
+        Queue an audio download, encoding it in a separate process.
+
+        Downloads run in a thread pool; encodes run in a process pool sized
+        to the available cores, so several items download while others encode.
+
+        Args:
+            target: Search query (search=True) or video URL
             filename: Output filename (without extension)
+            search: Treat target as a YouTube search query
+            clip: (start, end) in seconds to download and encode only that section
 
         Returns:
-            Relative path to downloaded file or None on failure
+            Future resolving to the relative path ("/audio/filename.mp3")
+            or None on failure
         """
-        output_path = self.output_dir / f"{filename}.mp3"
+        output_path = self.output_dir / self.output_name(filename)
+        result: Future = Future()
 
-        # Skip if already exists
         if output_path.exists():
-            print(f"  -> Audio already exists: {filename}.mp3")
-            return f"/audio/{filename}.mp3"
+            print(f"  -> Audio already exists: {output_path.name}")
+            result.set_result(f"/audio/{output_path.name}")
+            return result
 
-        ydl_opts = {
-            'format': 'bestaudio/best',
-            'postprocessors': [{
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': 'mp3',
-                'preferredquality': '192',
-            }],
-            'outtmpl': str(self.output_dir / filename),
-            'quiet': True,
-            'no_warnings': True,
-            'socket_timeout': YOUTUBE_DOWNLOAD_TIMEOUT,
-        }
+        download_pool, transcode_pool = self._pools()
 
-        # Add ffmpeg location if detected
-        if self.ffmpeg_path:
-            ydl_opts['ffmpeg_location'] = str(Path(self.ffmpeg_path).parent)
+        def on_encoded(encode: Future, source: Path, submitted: float):
+            self.encode_budget.release()
+            # Includes the wait for a free encoding process
+            self.metrics.observe('audio_encode', time.perf_counter() - submitted)
+            source.unlink(missing_ok=True)
+            try:
+                path = self._encoded(encode.result())
+                print(f"  [OK] Audio downloaded: {output_path.name}")
+                result.set_result(path)
+            except Exception as e:
+                print(f"  [FAIL] Encoding error ({filename}): {e}")
+                result.set_result(None)
 
-        try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                print(f"  -> Downloading from URL: {url}")
-                ydl.download([url])
+        def on_downloaded(download: Future):
+            try:
+                source = download.result()
+            except Exception as e:
+                print(f"  [FAIL] Unexpected error: {e}")
+                result.set_result(None)
+                return
 
-            # Verify file was created
-            if output_path.exists():
-                print(f"  [OK] Audio downloaded: {filename}.mp3")
-                return f"/audio/{filename}.mp3"
-            else:
-                print(f"  [FAIL] Audio file not created: {filename}.mp3")
-                return None
+            if not source:
+                result.set_result(None)
+                return
 
-        except yt_dlp.utils.DownloadError as e:
-            print(f"  [FAIL] Download error: {e}")
-            return None
+            # Blocks this download thread until an FFmpeg slot is free
+            self.metrics.observe('ffmpeg_slot_wait', self.encode_budget.acquire())
+            try:
+                encode = transcode_pool.submit(transcode_audio, *self._transcode_args(source, output_path))
+            except RuntimeError as e:
+                # Pool shut down while the download was running
+                self.encode_budget.release()
+                source.unlink(missing_ok=True)
+                result.set_exception(e)
+                return
+            submitted = time.perf_counter()
+            encode.add_done_callback(lambda f: on_encoded(f, source, submitted))
+
+        download_pool.submit(self._timed_download, target, filename, search, clip).add_done_callback(on_downloaded)
+        return result
+
+    def _download_and_encode(self, target: str, filename: str, search: bool, clip: Optional[Clip]) -> Optional[str]:
+        """
+        Download and encode audio in the calling thread.
+
+        Args:
+            target: Search query (search=True) or video URL
+            filename: Output filename (without extension)
+            search: Treat target as a YouTube search query
+            clip: (start, end) in seconds to download and encode only that section
+
+        Returns:
+            Relative path to the encoded file or None on failure
+        """
+        output_path = self.output_dir / self.output_name(filename)
+
+        # Skip if already exists
+        if output_path.exists():
+            print(f"  -> Audio already exists: {output_path.name}")
+            return f"/audio/{output_path.name}"
+
+        try:
+            source = self._timed_download(target, filename, search, clip)
         except Exception as e:
             print(f"  [FAIL] Unexpected error: {e}")
             return None
 
+        if not source:
+            print(f"  [FAIL] Audio file not created: {output_path.name}")
+            return None
+
+        try:
+            self.metrics.observe('ffmpeg_slot_wait', self.encode_budget.acquire())
+            try:
+                with self.metrics.timer('audio_encode'):
+                    encoding = transcode_audio(*self._transcode_args(source, output_path))
+            finally:
+                self.encode_budget.release()
+            path = self._encoded(encoding)
+        except RuntimeError as e:
+            print(f"  [FAIL] Encoding error ({filename}): {e}")
+            return None
+        finally:
+            source.unlink(missing_ok=True)
+
+        print(f"  [OK] Audio downloaded: {output_path.name}")
+        return path
+
+    def download_audio(self, search_query: str, filename: str, clip: Optional[Clip] = None) -> Optional[str]:
+        """
+        Search YouTube and download audio with the encoding profile.
+
+        Args:
+            search_query: YouTube search query
+            filename: Output filename (without extension)
+            clip: (start, end) in seconds to download and encode only that section
+
+        Returns:
+            Relative path to downloaded file (e.g., "/audio/filename.mp3")
+            or None on failure
+        """
+        return self._download_and_encode(search_query, filename, True, clip)
+
+    def download_from_url(self, url: str, filename: str, clip: Optional[Clip] = None) -> Optional[str]:
+        """
+        Download audio from a specific YouTube URL.
+
+        Args:
+            url: YouTube video URL
+            filename: Output filename (without extension)
+            clip: (start, end) in seconds to download and encode only that section
+
+        Returns:
+            Relative path to downloaded file or None on failure
+        """
+        return self._download_and_encode(url, filename, False, clip)
+
     def get_video_info(self, url: str) -> Optional[dict]:
         """
         Get video information without downloading.
@@ -0,0 +1,94 @@
+"""
+Script to inspect the YouTube search cache and pin the video used for a query.
+"""
+
+import sys
+import os
+import argparse
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scripts.config import YOUTUBE_CACHE_PATH
+from scripts.utils.search_cache import YouTubeSearchCache
+
+
+def format_age(timestamp: float) -> str:
+    """Format the time elapsed since a timestamp (e.g., "3d", "5h")."""
+    seconds = max(0, time.time() - timestamp)
+    for unit, length in (('d', 86400), ('h', 3600), ('m', 60)):
+        if seconds >= length:
+            return f"{int(seconds // length)}{unit}"
+    return f"{int(seconds)}s"
+
+
+def main():
+    """Manage the YouTube search cache."""
+    parser = argparse.ArgumentParser(
+        description=f'Inspect and pin YouTube search results ({YOUTUBE_CACHE_PATH})',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # List cached queries containing "inception"
+  python scripts/youtube_cache.py list --search inception
+
+  # Always use this video for a query (as printed by the importer)
+  python scripts/youtube_cache.py pin "Inception (2010) main theme" https://www.youtube.com/watch?v=RxabLA7UQ9k
+
+  # Forget a query (pinned or not): the next import searches again
+  python scripts/youtube_cache.py forget "Inception (2010) main theme"
+        """
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    list_parser = commands.add_parser('list', help='List cached queries')
+    list_parser.add_argument('--pinned', action='store_true', help='Only list pinned queries')
+    list_parser.add_argument('--search', '-s', help='Only list queries containing this text')
+
+    pin_parser = commands.add_parser('pin', help='Use a video for a query, overriding the search')
+    pin_parser.add_argument('query', help='Search query, as printed by the importer')
+    pin_parser.add_argument('url', help='YouTube video URL or ID')
+    pin_parser.add_argument('--note', help='Note shown by list')
+
+    forget_parser = commands.add_parser('forget', help='Remove a query (pinned or not)')
+    forget_parser.add_argument('query', help='Search query')
+
+    commands.add_parser('purge', help='Delete expired entries')
+
+    args = parser.parse_args()
+    cache = YouTubeSearchCache()
+
+    if args.command == 'list':
+        entries = cache.entries(pinned_only=args.pinned)
+        if args.search:
+            needle = cache.normalize_query(args.search)
+            entries = [entry for entry in entries if needle in entry['query']]
+
+        for entry in entries:
+            flag = '[pin]' if entry.get('pinned') else '     '
+            print(f"{flag} {entry['query']}")
+            print(f"      -> {entry['url']}  {entry.get('title') or ''}  ({format_age(entry['created_at'])} ago)")
+        print(f"\n{len(entries)} entries ({sum(1 for e in entries if e.get('pinned'))} pinned)")
+
+    elif args.command == 'pin':
+        try:
+            entry = cache.pin(args.query, args.url, args.note)
+        except ValueError as e:
+            parser.error(str(e))
+        print(f"[OK] Pinned: {cache.normalize_query(args.query)} -> {entry['url']}")
+        print("Used by the next download of this query (audio already stored is kept).")
+
+    elif args.command == 'forget':
+        if not cache.get(args.query):
+            print(f"[WARN] Not cached: {args.query}")
+            return
+        cache.forget(args.query)
+        print(f"[OK] Forgotten: {cache.normalize_query(args.query)}")
+
+    elif args.command == 'purge':
+        print(f"[OK] {cache.cache.purge_expired()} expired entries deleted")
+
+
+if __name__ == '__main__':
+    main()
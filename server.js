@@ -17,39 +17,105 @@ const prisma = new PrismaClient();
 // Code de la room publique permanente
 const PUBLIC_ROOM_CODE = 'PUBLIC';
 
-// Calcul de la distance de Levenshtein (nombre de modifications nécessaires)
-function levenshteinDistance(str1, str2) {
-  const m = str1.length;
-  const n = str2.length;
-  const dp = Array(m + 1).fill(null).map(() => Array(n + 1).fill(0));
-
-  for (let i = 0; i <= m; i++) dp[i][0] = i;
-  for (let j = 0; j <= n; j++) dp[0][j] = j;
+// Index de correspondance des réponses (voir scripts/utils/answers.py)
+const MATCH_INDEX_VERSION = 1;
+const MAX_CLOSE_DISTANCE = 2; // Réponse "proche" : à 2 caractères près
+const TRIGRAM_SIZE = 3;
+
+// Distance de Levenshtein bornée (nombre de modifications nécessaires)
+// Ne calcule que la bande |i - j| <= max ; renvoie max + 1 au-delà
+function boundedLevenshtein(a, b, max) {
+  const m = a.length;
+  const n = b.length;
+  if (Math.abs(m - n) > max) return max + 1;
+
+  let prev = new Array(n + 1);
+  let curr = new Array(n + 1);
+  for (let j = 0; j <= n; j++) prev[j] = j;
 
   for (let i = 1; i <= m; i++) {
-    for (let j = 1; j <= n; j++) {
-      if (str1[i - 1] === str2[j - 1]) {
-        dp[i][j] = dp[i - 1][j - 1];
+    const from = Math.max(1, i - max);
+    const to = Math.min(n, i + max);
+    curr.fill(max + 1);
+    curr[0] = i;
+    let rowMin = curr[0];
+
+    for (let j = from; j <= to; j++) {
+      if (a[i - 1] === b[j - 1]) {
+        curr[j] = prev[j - 1];
       } else {
-        dp[i][j] = Math.min(
-          dp[i - 1][j] + 1,    // suppression
-          dp[i][j - 1] + 1,    // insertion
-          dp[i - 1][j - 1] + 1 // substitution
+        curr[j] = Math.min(
+          prev[j] + 1,     // suppression
+          curr[j - 1] + 1, // insertion
+          prev[j - 1] + 1  // substitution
         );
       }
+      if (curr[j] < rowMin) rowMin = curr[j];
+    }
+
+    if (rowMin > max) return max + 1;
+    [prev, curr] = [curr, prev];
+  }
+
+  return Math.min(prev[n], max + 1);
+}
+
+// Trigrammes d'une réponse normalisée (tableau de caractères) -> occurrences
+function trigramCounts(chars) {
+  const counts = new Map();
+  for (let i = 0; i + TRIGRAM_SIZE <= chars.length; i++) {
+    const trigram = chars.slice(i, i + TRIGRAM_SIZE).join('');
+    counts.set(trigram, (counts.get(trigram) || 0) + 1);
+  }
+  return counts;
+}
+
+// Construire l'index d'un track sans index stocké (même format que build_match_index)
+function buildMatchIndex(acceptedAnswers) {
+  const answers = [...new Set(acceptedAnswers.map(normalizeAnswer))];
+  const trigrams = {};
+  answers.forEach((answer, index) => {
+    for (const [trigram, count] of trigramCounts(Array.from(answer))) {
+      (trigrams[trigram] = trigrams[trigram] || []).push([index, count]);
+    }
+  });
+  return { version: MATCH_INDEX_VERSION, maxDistance: MAX_CLOSE_DISTANCE, answers, trigrams };
+}
+
+// Préparer l'index pour les vérifications (Set des réponses, Map des trigrammes)
+function prepareMatcher(track) {
+  let index = null;
+  if (track.matchIndex) {
+    try {
+      index = JSON.parse(track.matchIndex);
+    } catch {
+      index = null;
     }
   }
+  if (!index || index.version !== MATCH_INDEX_VERSION) {
+    index = buildMatchIndex(track.acceptedAnswers);
+  }
 
-  return dp[m][n];
+  const chars = index.answers.map((answer) => Array.from(answer));
+  return {
+    answers: new Set(index.answers),
+    chars,
+    trigrams: new Map(Object.entries(index.trigrams)),
+    maxDistance: index.maxDistance,
+  };
 }
 
 // Charger les tracks depuis la base de données
 async function loadTracks() {
   const tracks = await prisma.track.findMany();
-  return tracks.map(track => ({
-    ...track,
-    acceptedAnswers: JSON.parse(track.acceptedAnswers),
-  }));
+  return tracks.map(({ matchIndex, ...track }) => {
+    const loaded = {
+      ...track,
+      acceptedAnswers: JSON.parse(track.acceptedAnswers),
+    };
+    loaded.matcher = prepareMatcher({ ...loaded, matchIndex });
+    return loaded;
+  });
 }
 
 // Stockage des rooms en mémoire
@@ -105,12 +171,38 @@ function normalizeAnswer(str) {
     .replace(/\s+/g, ' ');
 }
 
-// Vérifier une réponse
-function checkAnswer(input, acceptedAnswers) {
-  const normalizedInput = normalizeAnswer(input);
-  return acceptedAnswers.some(
-    (answer) => normalizeAnswer(answer) === normalizedInput
-  );
+// Vérifier une réponse (réponse déjà normalisée, recherche dans le Set)
+function checkAnswer(normalizedInput, matcher) {
+  return matcher.answers.has(normalizedInput);
+}
+
+// Vérifier si une réponse est proche (distance 1 à maxDistance)
+// Seules les réponses partageant assez de trigrammes sont comparées :
+// à distance k, deux chaînes en partagent au moins max(longueurs) - 2 - 3k
+function isCloseAnswer(normalizedInput, matcher) {
+  const input = Array.from(normalizedInput);
+  const max = matcher.maxDistance;
+
+  const shared = new Map();
+  for (const [trigram, count] of trigramCounts(input)) {
+    const postings = matcher.trigrams.get(trigram);
+    if (!postings) continue;
+    for (const [index, answerCount] of postings) {
+      shared.set(index, (shared.get(index) || 0) + Math.min(count, answerCount));
+    }
+  }
+
+  for (let index = 0; index < matcher.chars.length; index++) {
+    const answer = matcher.chars[index];
+    if (Math.abs(answer.length - input.length) > max) continue;
+
+    const required = Math.max(answer.length, input.length) - (TRIGRAM_SIZE - 1) - TRIGRAM_SIZE * max;
+    if (required > 0 && (shared.get(index) || 0) < required) continue;
+
+    const distance = boundedLevenshtein(input, answer, max);
+    if (distance <= max && distance > 0) return true;
+  }
+  return false;
 }
 
 // Calculer le score basé sur le temps restant (style Skribbl.io)
@@ -540,22 +632,12 @@ app.prepare().then(async () => {
       const alreadyFound = room.roundFinders.has(socket.id);
 
       const currentTrack = room.tracks[room.currentTrackIndex];
+      const normalizedInput = normalizeAnswer(answer);
       // Ne pas vérifier si déjà trouvé
-      const isCorrect = !alreadyFound && checkAnswer(answer, currentTrack.acceptedAnswers);
+      const isCorrect = !alreadyFound && checkAnswer(normalizedInput, currentTrack.matcher);
 
       // Vérifier si la réponse est proche (à 2 caractères près)
-      let isClose = false;
-      if (!isCorrect && !alreadyFound) {
-        const normalizedInput = normalizeAnswer(answer);
-        for (const acceptedAnswer of currentTrack.acceptedAnswers) {
-          const normalizedAccepted = normalizeAnswer(acceptedAnswer);
-          const distance = levenshteinDistance(normalizedInput, normalizedAccepted);
-          if (distance <= 2 && distance > 0) {
-            isClose = true;
-            break;
-          }
-        }
-      }
+      const isClose = !isCorrect && !alreadyFound && isCloseAnswer(normalizedInput, currentTrack.matcher);
 
       // Si proche mais pas exact, envoyer un message privé
       if (isClose) {
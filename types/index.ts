@@ -17,6 +17,17 @@ export interface Track {
   categoryId: string;
   timeLimit: number;
   startTime: number; // Seconde de départ de la musique
+  matchIndex?: MatchIndex | null; // Écriture seule (jamais renvoyé par les lectures)
+  externalId?: string | null; // ID de l'entrée du catalogue (ID IMDb pour les films)
+  sourceHash?: string | null; // Empreinte de l'entrée du catalogue à l'import
+}
+
+// Index de correspondance des réponses (scripts/utils/answers.py, utilisé par server.js)
+export interface MatchIndex {
+  version: number;
+  maxDistance: number;                       // Distance de Levenshtein des réponses "proches"
+  answers: string[];                         // Réponses déjà normalisées (normalizeAnswer)
+  trigrams: Record<string, [number, number][]>; // Trigramme -> [index de réponse, occurrences]
 }
 
 // Alias pour compatibilité (à supprimer progressivement)